@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.algorithms.dynamic import DynamicCover
+from src.core.graph_io import load_edgelist
+
+
+def _random_batch(
+    rng: random.Random,
+    n: int,
+    edges: Set[Tuple[int, int]],
+    edge_list: List[Tuple[int, int]],
+    size: int,
+) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+    """Lote de cambios mitad inserciones y mitad borrados (actualiza edges in-place)."""
+    inserts, deletes = [], []
+    for _ in range(size):
+        if rng.random() < 0.5 and edge_list:
+            i = rng.randrange(len(edge_list))
+            edge_list[i], edge_list[-1] = edge_list[-1], edge_list[i]
+            e = edge_list.pop()
+            edges.discard(e)
+            deletes.append(e)
+        else:
+            u, v = rng.randrange(n), rng.randrange(n)
+            e = (min(u, v), max(u, v))
+            if u != v and e not in edges:
+                edges.add(e)
+                edge_list.append(e)
+                inserts.append(e)
+    return inserts, deletes
+
+
+def _pct(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main() -> None:
+    """
+    Latencia por actualización de DynamicCover frente a re-resolver con ils.solve
+    el grafo completo tras cada lote de cambios de aristas.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark del modo de grafo dinámico")
+    parser.add_argument("--input", default=str(PROJECT_ROOT / "data" / "bench_graphs_c" / "brock200_2.edgelist"))
+    parser.add_argument("--updates", type=int, default=200, help="Lotes de cambios a aplicar")
+    parser.add_argument("--batch", type=int, default=5, help="Cambios de aristas por lote")
+    parser.add_argument("--budget", type=int, default=50, help="Intercambios de búsqueda local por lote")
+    parser.add_argument("--resolve-every", type=int, default=20, help="Re-resolver con ILS cada k lotes")
+    parser.add_argument("--ils-time", type=float, default=1.0, help="time_limit de cada re-resolución ILS")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", type=str, default=None, help="Guarda el resumen en este archivo")
+    args = parser.parse_args()
+
+    import networkx as nx
+    from src.algorithms.ils import solve as ils_solve
+
+    graph = load_edgelist(args.input)
+    n = graph.number_of_nodes()
+    rng = random.Random(args.seed)
+    edges = {(min(u, v), max(u, v)) for u, v in graph.edges() if u != v}
+    edge_list = sorted(edges)
+
+    t0 = time.perf_counter()
+    dyn = DynamicCover(graph, seed=args.seed, params={"budget": args.budget})
+    build_time = time.perf_counter() - t0
+
+    dyn_lat: List[float] = []
+    ils_lat: List[float] = []
+    gaps: List[int] = []
+    for i in range(args.updates):
+        inserts, deletes = _random_batch(rng, n, edges, edge_list, args.batch)
+        start = time.perf_counter()
+        dyn.update(inserts=inserts, deletes=deletes)
+        dyn_lat.append(time.perf_counter() - start)
+        if not dyn.is_cover():
+            raise SystemExit(f"Cover infactible tras el lote {i}")
+
+        if args.resolve_every and (i + 1) % args.resolve_every == 0:
+            current = nx.Graph()
+            current.add_nodes_from(range(n))
+            current.add_edges_from(edges)
+            start = time.perf_counter()
+            res = ils_solve(current, seed=args.seed, params={"time_limit": args.ils_time})
+            ils_lat.append(time.perf_counter() - start)
+            gaps.append(len(dyn) - int(res.cost))
+            print(f"lote {i + 1}: dinámico={len(dyn)} ils={int(res.cost)}", flush=True)
+
+    summary: Dict[str, Any] = {
+        "instance": Path(args.input).name,
+        "updates": args.updates,
+        "batch": args.batch,
+        "build_s": build_time,
+        "dynamic_p50_ms": _pct(dyn_lat, 0.5) * 1000,
+        "dynamic_p95_ms": _pct(dyn_lat, 0.95) * 1000,
+        "dynamic_max_ms": max(dyn_lat) * 1000,
+        "ils_mean_ms": statistics.mean(ils_lat) * 1000 if ils_lat else None,
+        "size_minus_ils": statistics.mean(gaps) if gaps else None,
+        "final_size": len(dyn),
+    }
+    print(
+        f"DynamicCover: construcción {build_time:.3f}s, p50={summary['dynamic_p50_ms']:.3f}ms "
+        f"p95={summary['dynamic_p95_ms']:.3f}ms max={summary['dynamic_max_ms']:.3f}ms"
+    )
+    if ils_lat:
+        print(
+            f"ils.solve: media={summary['ils_mean_ms']:.1f}ms por re-resolución; "
+            f"tamaño dinámico - ILS = {summary['size_minus_ils']:+.2f} vértices en promedio"
+        )
+    if args.json:
+        Path(args.json).write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
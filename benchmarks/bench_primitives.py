@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.algorithms.gls import guided_cost
+from src.algorithms.heuristic import _mvc_isolation
+from src.algorithms.ils import _perturb
+from src.algorithms.local_search import _get_dscore
+from src.algorithms.utils import _add_greedy_cover_vertices, _edge_key
+from src.core.csr import CSRGraph
+from src.core.evaluator import Evaluator
+from src.core.solution import Solution
+
+# Grafos G(n, p) con el tamaño y la densidad de las instancias DIMACS (complementos)
+GRAPHS: Dict[str, Tuple[int, float]] = {
+    "gnp_brock200": (200, 0.504),
+    "gnp_dsjc500": (500, 0.498),
+    "gnp_hamming10": (1024, 0.171),
+}
+
+
+def gnp(n: int, p: float, seed: int) -> CSRGraph:
+    """G(n, p) determinista (no depende de la versión de NetworkX)."""
+    rng = random.Random(seed)
+    edges = [(u, v) for u in range(n) for v in range(u + 1, n) if rng.random() < p]
+    return CSRGraph.from_edges(n, edges)
+
+
+# Cada caso prepara sus argumentos (fuera de la medición) y retorna la operación a medir
+Case = Callable[[CSRGraph, List[int], random.Random], Tuple[Callable[..., Any], Callable[[], tuple]]]
+
+
+def _case_dscore(g: CSRGraph, cover: List[int], rng: random.Random):
+    cover_set = set(cover)
+    weights = {_edge_key(u, v): 1 for u, v in g.edges()}
+    n = g.number_of_nodes()
+    return _get_dscore, lambda: (rng.randrange(n), cover_set, g, weights)
+
+
+def _case_is_cover(g: CSRGraph, cover: List[int], rng: random.Random):
+    sol = Solution.from_cover(cover, g.number_of_nodes())
+    evaluator = Evaluator(g)
+    return evaluator.is_cover, lambda: (sol,)
+
+
+def _case_greedy_completion(g: CSRGraph, cover: List[int], rng: random.Random):
+    # Completa un cover al que se le quitó el 10% de sus vértices
+    def setup() -> tuple:
+        partial = set(cover)
+        for v in rng.sample(cover, max(1, len(cover) // 10)):
+            partial.discard(v)
+        uncovered = {_edge_key(u, v) for u, v in g.edges() if u not in partial and v not in partial}
+        return g, uncovered, partial, rng
+    return _add_greedy_cover_vertices, setup
+
+
+def _case_perturb(g: CSRGraph, cover: List[int], rng: random.Random):
+    cover_set = set(cover)
+    k = max(1, len(cover) // 10)
+    return _perturb, lambda: (g, cover_set, k, rng)
+
+
+def _case_guided_cost(g: CSRGraph, cover: List[int], rng: random.Random):
+    cover_set = set(cover)
+    edge_keys = [_edge_key(u, v) for u, v in g.edges()]
+    penalties = {e: rng.randrange(3) for e in edge_keys}
+    return guided_cost, lambda: (cover_set, edge_keys, penalties, 0.3)
+
+
+CASES: Dict[str, Case] = {
+    "local_search._get_dscore": _case_dscore,
+    "Evaluator.is_cover": _case_is_cover,
+    "utils._add_greedy_cover_vertices": _case_greedy_completion,
+    "ils._perturb": _case_perturb,
+    "gls.guided_cost": _case_guided_cost,
+}
+
+
+def _measure(fn: Callable[..., Any], setup: Callable[[], tuple], min_time: float, rounds: int) -> Dict[str, float]:
+    """Ejecuta la operación hasta acumular min_time por ronda; reporta ops/s por ronda."""
+    samples = []
+    for _ in range(rounds):
+        elapsed, ops = 0.0, 0
+        while elapsed < min_time:
+            args = setup()
+            start = time.perf_counter()
+            fn(*args)
+            elapsed += time.perf_counter() - start
+            ops += 1
+        samples.append(ops / elapsed)
+    return {
+        "ops_per_sec": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "rounds": rounds,
+    }
+
+
+def _machine() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def _compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Tuple[str, str, float]]:
+    rows = []
+    for case, per_graph in current["results"].items():
+        for graph, stats in per_graph.items():
+            base = baseline.get("results", {}).get(case, {}).get(graph)
+            if base:
+                rows.append((case, graph, stats["ops_per_sec"] / base["ops_per_sec"]))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmarks de las primitivas de los solvers.")
+    parser.add_argument("--cases", type=str, default=",".join(CASES), help="Casos separados por comas")
+    parser.add_argument("--graphs", type=str, default=",".join(GRAPHS), help="Grafos separados por comas")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla de grafos y operaciones")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Segundos medidos por ronda")
+    parser.add_argument("--rounds", type=int, default=5, help="Rondas por caso")
+    parser.add_argument("--save", type=str, default=None, help="Guarda los resultados en este JSON")
+    parser.add_argument("--compare", type=str, default=None, help="JSON de línea base para comparar ops/s")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=None,
+        help="Con --compare, falla si algún caso baja de este factor (p. ej. 0.9)",
+    )
+    args = parser.parse_args()
+
+    cases = [c.strip() for c in args.cases.split(",") if c.strip()]
+    graphs = [g.strip() for g in args.graphs.split(",") if g.strip()]
+    report: Dict[str, Any] = {"machine": _machine(), "seed": args.seed, "results": {}}
+    for gname in graphs:
+        n, p = GRAPHS[gname]
+        graph = gnp(n, p, args.seed)
+        cover = sorted(_mvc_isolation(graph))
+        for case in cases:
+            rng = random.Random(args.seed)
+            fn, setup = CASES[case](graph, cover, rng)
+            stats = _measure(fn, setup, args.min_time, args.rounds)
+            stats.update({"n": n, "m": graph.number_of_edges()})
+            report["results"].setdefault(case, {})[gname] = stats
+            print(f"{case:<36}{gname:<16}{stats['ops_per_sec']:>14.1f} ops/s")
+
+    if args.save:
+        Path(args.save).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print("\nComparación contra", args.compare)
+        worst = None
+        for case, gname, ratio in _compare(report, baseline):
+            print(f"{case:<36}{gname:<16}{ratio:>10.2f}x")
+            worst = ratio if worst is None else min(worst, ratio)
+        if args.max_regression is not None and worst is not None and worst < args.max_regression:
+            print(f"REGRESIÓN: el peor caso quedó en {worst:.2f}x (< {args.max_regression})")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.algorithms.local_search import _greedy_initial_cover, improve_cover
+from src.core.csr import CSRGraph
+from src.core.graph_io import load_csr
+from src.experiments.generators import chung_lu, planted_cover
+from src.experiments.catalog import open_catalog
+
+DIMACS_DIR = PROJECT_ROOT / "data" / "bench_graphs_c"
+
+# Grafos sintéticos grandes: nombre -> (constructor, óptimo conocido)
+SYNTHETIC = {
+    "chunglu_50k": (lambda: CSRGraph.from_edges(50_000, chung_lu(50_000, 8, 2.5, seed=2)), None),
+    "planted_50k": (lambda: CSRGraph.from_edges(50_000, planted_cover(50_000, 15_000, 8, seed=3)), 15_000),
+}
+
+
+def _instances(which: str) -> List[Tuple[str, Any, Optional[int]]]:
+    out = []
+    if which in ("dimacs", "all"):
+        catalog = open_catalog(DIMACS_DIR)
+        for path in sorted(DIMACS_DIR.glob("*.edgelist")):
+            out.append((path.name, load_csr(str(path)), catalog.optimum(path.name)))
+    if which in ("synthetic", "all"):
+        for name, (build, optimum) in SYNTHETIC.items():
+            out.append((name, build(), optimum))
+    return out
+
+
+def main() -> None:
+    """
+    Compara las selecciones de la búsqueda local (máximo exacto, configuration
+    checking y BMS) con el mismo límite de tiempo: tamaño del cover, gap contra
+    el óptimo conocido y pasos por segundo.
+    """
+    parser = argparse.ArgumentParser(description="Compara modos de selección de improve_cover")
+    parser.add_argument("--set", choices=["dimacs", "synthetic", "all"], default="all")
+    parser.add_argument("--selections", type=str, default="max,cc,bms")
+    parser.add_argument("--bms-t", type=int, default=50)
+    parser.add_argument("--time-limit", type=float, default=5.0)
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--json", type=str, default=None, help="Guarda las filas en este archivo")
+    args = parser.parse_args()
+
+    selections = [s.strip() for s in args.selections.split(",") if s.strip()]
+    rows: List[Dict[str, Any]] = []
+    print(f"{'instancia':<26}{'selección':<10}{'cover':>9}{'gap':>8}{'pasos/s':>12}{'ahorro':>8}")
+    for name, graph, optimum in _instances(args.set):
+        initial = _greedy_initial_cover(graph)
+        for selection in selections:
+            sizes, rates, saved = [], [], []
+            for seed in range(args.seeds):
+                stats: Dict[str, Any] = {}
+                params = {
+                    "selection": selection,
+                    "bms_t": args.bms_t,
+                    "time_limit": args.time_limit,
+                    "max_iter": 10**9,
+                }
+                start = time.perf_counter()
+                cover = improve_cover(graph, initial, seed=seed, params=params, stats=stats)
+                elapsed = time.perf_counter() - start
+                sizes.append(len(cover))
+                rates.append(stats.get("steps", 0) / elapsed)
+                if "dscore_saved" in stats:
+                    saved.append(stats["dscore_saved"])
+            row = {
+                "instance": name,
+                "selection": selection,
+                "avg_cover": sum(sizes) / len(sizes),
+                "best_cover": min(sizes),
+                "optimal": optimum,
+                "gap": (sum(sizes) / len(sizes) - optimum) if optimum is not None else None,
+                "steps_per_s": sum(rates) / len(rates),
+                "dscore_saved": sum(saved) / len(saved) if saved else None,
+            }
+            rows.append(row)
+            gap = f"{row['gap']:.2f}" if row["gap"] is not None else "-"
+            ahorro = f"{row['dscore_saved']:.0%}" if row["dscore_saved"] is not None else "-"
+            print(
+                f"{name:<26}{selection:<10}{row['avg_cover']:>9.1f}{gap:>8}"
+                f"{row['steps_per_s']:>12.0f}{ahorro:>8}",
+                flush=True,
+            )
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(rows, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
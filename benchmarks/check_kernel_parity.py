@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.algorithms.kernels import NUMBA_AVAILABLE, improve_cover_compiled, local_search_kernel
+from src.algorithms.local_search import _greedy_initial_cover, improve_cover
+from src.core.graph_io import load_csr
+
+
+def _is_cover(graph, cover) -> bool:
+    return all(u in cover or v in cover for u, v in graph.edges())
+
+
+def main() -> int:
+    """
+    Verifica el backend numba contra dos referencias:
+
+    - el mismo kernel interpretado: covers idénticos (mismo generador xorshift32);
+    - el backend Python de improve_cover: ambos parten del mismo cover voraz y
+      hacen max_iter pasos del mismo intercambio en dos etapas, pero con
+      generadores distintos, así que solo se exige que los dos covers sean
+      factibles y que sus tamaños difieran a lo sumo en
+      max(1, ceil(tolerance * tamaño Python)) vértices.
+    """
+    parser = argparse.ArgumentParser(description="Paridad del backend numba de la búsqueda local")
+    parser.add_argument("--input", default=str(PROJECT_ROOT / "data" / "sample_medium.edgelist"))
+    parser.add_argument("--seeds", type=int, default=5)
+    parser.add_argument("--max-iter", type=int, default=5000)
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="Diferencia relativa de tamaño admitida frente al backend Python")
+    args = parser.parse_args()
+
+    graph = load_csr(args.input)
+    initial = _greedy_initial_cover(graph)
+    params = {"max_iter": args.max_iter, "time_limit": None}
+    interpreted = getattr(local_search_kernel, "py_func", local_search_kernel)
+    if not NUMBA_AVAILABLE:
+        print("numba no está instalado: se verifica solo el kernel interpretado")
+
+    ok = True
+    for seed in range(args.seeds):
+        t0 = time.perf_counter()
+        compiled_cover = improve_cover_compiled(graph, initial, seed=seed, params=params)
+        t1 = time.perf_counter()
+        reference = improve_cover_compiled(graph, initial, seed=seed, params=params, kernel=interpreted)
+        t2 = time.perf_counter()
+        python_cover = improve_cover(graph, initial, seed=seed, params=params)
+        t3 = time.perf_counter()
+
+        same = compiled_cover == reference
+        feasible = _is_cover(graph, compiled_cover) and _is_cover(graph, python_cover)
+        allowed = max(1, math.ceil(args.tolerance * len(python_cover)))
+        close = abs(len(compiled_cover) - len(python_cover)) <= allowed
+        ok = ok and same and feasible and close
+        verdict = (
+            "DIFERENTE" if not same else "NO FACTIBLE" if not feasible
+            else f"LEJOS DE PYTHON (> {allowed})" if not close else "OK"
+        )
+        print(
+            f"seed={seed} compilado={len(compiled_cover)} ({t1 - t0:.3f}s) "
+            f"interpretado={len(reference)} ({t2 - t1:.3f}s) python={len(python_cover)} ({t3 - t2:.3f}s) "
+            f"{verdict}"
+        )
+
+    print("Paridad OK" if ok else "Paridad FALLIDA")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
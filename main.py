@@ -2,22 +2,18 @@ from __future__ import annotations
 import argparse
 import json
 import os
-import networkx as nx
-from typing import Any, Dict, Iterable, Optional
-from src.core.graph_io import load_edgelist
-from src.algorithms import exact, heuristic, local_search, ils, gls, better_exact
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+from src.core.bitset import DENSITY_THRESHOLD
+from src.core.graph_io import load_csr, load_edgelist
+# Registro perezoso: cada algoritmo se importa solo cuando se usa
+from src.algorithms import ALGORITHMS, ARRAY_ALGORITHMS, BITSET_ALGORITHMS
+from src.core.serialization import ENCODINGS, build_output
 from src.experiments.run_benchmark import run
-from src.experiments.optimal_cover import get_optimal_cover_size
-
-# Mapeo de nombres de algoritmos a sus funciones correspondientes
-ALGORITHMS = {
-    "exact": exact.solve,
-    "better_exact": better_exact.solve,
-    "heuristic": heuristic.solve,
-    "local_search": local_search.solve,
-    "ils": ils.solve,
-    "gls": gls.solve,
-}
+from src.experiments.catalog import CATALOG_FILE, OPTIMA_FILE, lookup
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 # Función para parsear parámetros JSON
 # La usamos para convertir la cadena JSON pasada como argumento en un diccionario para
@@ -32,16 +28,17 @@ def _parse_params(params_raw) -> Optional[Dict[str, Any]]:
 
 # Función para iterar sobre instancias en un archivo o directorio
 # La usamos para cargar las instancias de grafos desde archivos edgelist
-def _iter_instances(path: str) -> Iterable[tuple[str, nx.Graph]]:
+# (con load_csr no se importa NetworkX)
+def _iter_instances(path: str, loader: Callable[[str], Any] = load_edgelist) -> Iterable[tuple[str, nx.Graph]]:
     if os.path.isdir(path):
         for name in sorted(os.listdir(path)):
-            if name.startswith("."):
+            if name.startswith(".") or name in (CATALOG_FILE, OPTIMA_FILE):
                 continue
             full = os.path.join(path, name)
             if os.path.isfile(full):
-                yield name, load_edgelist(full)
+                yield name, loader(full)
     else:
-        yield os.path.basename(path), load_edgelist(path)
+        yield os.path.basename(path), loader(path)
 
 
 def main() -> None:
@@ -49,7 +46,8 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Vertex Cover runner")
 
     # Argumento para seleccionar el algoritmo a usar
-    parser.add_argument("--algo", required=True, choices=sorted(ALGORITHMS.keys()))
+    # (en modo servicio es opcional y actúa como algoritmo por defecto)
+    parser.add_argument("--algo", choices=sorted(ALGORITHMS.keys()))
 
     # Argumento para especificar el archivo o directorio de instancias
     parser.add_argument(
@@ -76,11 +74,47 @@ def main() -> None:
         help="Imprime las soluciones completas en la salida",
     )
 
+    # Argumentos del modo servicio (solicitudes JSON por stdin o HTTP local)
+    parser.add_argument(
+        "--serve",
+        choices=["stdin", "http"],
+        help="Mantiene un pool de workers y una caché de grafos y atiende solicitudes JSON",
+    )
+    parser.add_argument(
+        "--solution-encoding",
+        choices=list(ENCODINGS),
+        default="full",
+        help="Codificación de las soluciones con --verbose (full, bitmask, varint o diff contra la mejor)",
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Puerto del modo --serve http")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Procesos del pool en modo servicio (0 = resolver en el mismo proceso)",
+    )
+
     # Parseo de argumentos
     args = parser.parse_args()
+    params = _parse_params(args.params)
+
+    if args.serve:
+        from src.service import SolverService, serve_http, serve_stdin
+
+        service = SolverService(algo=args.algo, params=params, workers=args.workers)
+        try:
+            if args.serve == "http":
+                serve_http(service, port=args.port)
+            else:
+                serve_stdin(service, concurrency=max(1, args.workers))
+        finally:
+            service.close()
+        return
+
+    if args.algo is None:
+        parser.error("--algo es obligatorio salvo en modo --serve")
     algorithm = ALGORITHMS[args.algo]
 
-    params = _parse_params(args.params)
     # Si el flag --verbose está presente, forzar verbose=True en params
     if args.verbose:
         if params is None:
@@ -92,43 +126,25 @@ def main() -> None:
     if params and "seed" in params:
         seed = params["seed"]
 
-    # Iteración sobre las instancias y ejecución del algoritmo seleccionado
-    instances = list(_iter_instances(args.input))
+    # Iteración sobre las instancias y ejecución del algoritmo seleccionado.
+    # Los algoritmos que trabajan sobre arreglos cargan el grafo como CSR
+    # (con filas de bits en grafos densos solo si las usan)
+    if args.algo in BITSET_ALGORITHMS:
+        loader = partial(load_csr, dense_threshold=DENSITY_THRESHOLD)
+    else:
+        loader = load_csr if args.algo in ARRAY_ALGORITHMS else load_edgelist
+    instances = list(_iter_instances(args.input, loader))
     names = [name for name, _ in instances]
     graphs = [graph for _, graph in instances]
-
-    def make_json_serializable(obj):
-        # Convierte sets a listas y aplica recursivamente a dicts y listas
-        if isinstance(obj, set):
-            return list(obj)
-        elif isinstance(obj, dict):
-            return {k: make_json_serializable(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [make_json_serializable(x) for x in obj]
-        elif hasattr(obj, 'to_dict'):
-            return make_json_serializable(obj.to_dict())
-        elif hasattr(obj, '__dict__'):
-            return make_json_serializable(dict(obj.__dict__))
-        else:
-            return obj
-
-
-    for name, result in zip(names, run(algorithm, graphs, seed=seed, params=params)):
-        meta = make_json_serializable(result.meta)
-        optimal = get_optimal_cover_size(name)
-        output = {
-            "instance": name,             # Nombre de la instancia
-            "algo": args.algo,            # Algoritmo usado
-            "cost": result.cost,          # Costo de la solución
-            "feasible": result.feasible,  # Si la solución es factible
-            "meta": meta,                 # Metadatos adicionales serializables
-        }
-        if optimal is not None:
-            output["optimal"] = optimal
-            output["gap"] = result.cost - optimal
-        if args.verbose:
-            # Imprime la solución completa (cover, in_cover, etc.)
-            output["solution"] = make_json_serializable(result.solution)
+    paths = [os.path.join(args.input, name) if os.path.isdir(args.input) else args.input for name in names]
+
+    for name, path, result in zip(names, paths, run(algorithm, graphs, seed=seed, params=params)):
+        # Óptimo conocido desde el catálogo de la carpeta de la instancia
+        record = lookup(path)
+        optimal = record["optimum"] if record else None
+        output = build_output(
+            name, args.algo, result, optimal=optimal, verbose=args.verbose, encoding=args.solution_encoding
+        )
         print(json.dumps(output, ensure_ascii=False))
 
 
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _importtime(cmd: List[str]) -> Tuple[int, List[Tuple[int, str]]]:
+    """
+    Ejecuta el comando con -X importtime y retorna el tiempo total de importación
+    (suma de los módulos de nivel superior, en microsegundos) y los módulos de
+    nivel superior ordenados por tiempo acumulado.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime"] + cmd,
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    top: List[Tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Los módulos anidados llevan sangría extra en la columna del nombre
+        if name.startswith("  "):
+            continue
+        top.append((int(cumulative), name.strip()))
+    top.sort(reverse=True)
+    return sum(c for c, _ in top), top
+
+
+def _wall(cmd: List[str], repeat: int) -> List[float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + cmd, cwd=PROJECT_ROOT, capture_output=True, check=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Mide el arranque de main.py (tiempo de importación con -X importtime y tiempo total)."
+    )
+    parser.add_argument("--input", default="data/sample.edgelist", help="Instancia a resolver")
+    parser.add_argument("--algos", default="heuristic,local_search,ils", help="Algoritmos a medir")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones para el tiempo total")
+    parser.add_argument("--top", type=int, default=8, help="Módulos más costosos a listar")
+    args = parser.parse_args()
+
+    report: Dict[str, Any] = {"python": sys.version.split()[0], "input": args.input, "algos": {}}
+    for algo in [a.strip() for a in args.algos.split(",") if a.strip()]:
+        cmd = ["main.py", "--algo", algo, "--input", args.input, "--params", '{"num_runs": 1, "time_limit": 0.01}']
+        import_us, top = _importtime(cmd)
+        wall = _wall(cmd, args.repeat)
+        report["algos"][algo] = {
+            "import_ms": import_us / 1000.0,
+            "networkx_imported": any(name == "networkx" for _, name in top),
+            "wall_ms_median": statistics.median(wall) * 1000.0,
+            "wall_ms_min": min(wall) * 1000.0,
+            "top_imports_ms": [[name, c / 1000.0] for c, name in top[: args.top]],
+        }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
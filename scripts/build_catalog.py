@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.experiments.catalog import CATALOG_FILE, Catalog
+
+
+def main() -> None:
+    """
+    Construye o actualiza el catálogo (catalog.json) de una o más carpetas de
+    instancias e imprime un resumen por instancia.
+    """
+    parser = argparse.ArgumentParser(description="Construye el catálogo de instancias")
+    parser.add_argument("folders", nargs="*", default=[str(PROJECT_ROOT / "data" / "bench_graphs_c")])
+    parser.add_argument("--force", action="store_true", help="Recalcula todas las instancias")
+    args = parser.parse_args()
+
+    for folder in map(Path, args.folders):
+        catalog = Catalog.load(folder)
+        if catalog.refresh(force=args.force):
+            catalog.save()
+        print(f"{folder / CATALOG_FILE}: {len(catalog.entries)} instancias")
+        for name, rec in sorted(catalog.entries.items()):
+            print(
+                f"  {name}: n={rec['n']} m={rec['m']} densidad={rec['density']:.3f} "
+                f"cota={rec['lower_bound']} óptimo={rec['optimum']} mejor={rec['best_known']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.experiments.optimal_cover import get_optimal_cover_size
+from src.experiments.results_io import iter_rows
+from src.experiments.stats import geometric_mean, mann_whitney_u, wilcoxon_signed_rank
+
+Key = Tuple[str, str]
+
+
+def _num(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _list(value: Any) -> Optional[List[float]]:
+    # En CSV las listas llegan como texto JSON
+    if isinstance(value, str):
+        value = json.loads(value) if value else None
+    # Las semillas aisladas sin resultado (timeout/oom sin incumbente) quedan como null
+    return [float(x) for x in value if x is not None] if value else None
+
+
+def _load(path: Path) -> Dict[Key, Dict[str, Any]]:
+    """Carga un archivo de resultados indexado por (instancia, algoritmo); la última fila gana."""
+    rows: Dict[Key, Dict[str, Any]] = {}
+    for row in iter_rows(path):
+        optimal = _num(row.get("optimal"))
+        if optimal is None:
+            optimal = get_optimal_cover_size(row["instance"])
+        rows[(row["instance"], row["algo"])] = {
+            "cost": _num(row.get("cost")),
+            "best_cost": _num(row.get("best_cost")),
+            "worst_cost": _num(row.get("worst_cost")),
+            "avg_time": _num(row.get("avg_time")),
+            "optimal": optimal,
+            "costs": _list(row.get("costs")),
+            "times": _list(row.get("times")),
+        }
+    return rows
+
+
+def _gap_pct(row: Dict[str, Any]) -> Optional[float]:
+    # Gap porcentual respecto al óptimo conocido (TODO.md: porcentajes, no valores absolutos)
+    if row["optimal"] is None or row["cost"] is None or row["optimal"] == 0:
+        return None
+    return 100.0 * (row["cost"] - row["optimal"]) / row["optimal"]
+
+
+def _time_to_target(row: Dict[str, Any], target: Optional[float]) -> Optional[float]:
+    """
+    Tiempo esperado para alcanzar el objetivo con reinicios independientes:
+    tiempo total de las corridas / corridas que lo alcanzan. Sin datos por
+    corrida se usa avg_time si todas las corridas lo alcanzaron.
+    """
+    if target is None:
+        return None
+    if row["costs"] and row["times"]:
+        hits = sum(1 for c in row["costs"] if c <= target)
+        return sum(row["times"]) / hits if hits else None
+    if row["worst_cost"] is not None and row["worst_cost"] <= target:
+        return row["avg_time"]
+    return None
+
+
+def _delta(a: Optional[float], b: Optional[float]) -> Optional[float]:
+    return None if a is None or b is None else b - a
+
+
+def _fmt(value: Optional[float], spec: str = ".3f") -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def compare(
+    base: Dict[Key, Dict[str, Any]],
+    cand: Dict[Key, Dict[str, Any]],
+    targets: Dict[str, float],
+    alpha: float,
+) -> Dict[str, Any]:
+    """Compara un conjunto candidato contra la línea base (celdas comunes)."""
+    cells = []
+    for key in sorted(set(base) & set(cand)):
+        a, b = base[key], cand[key]
+        target = a["optimal"] if a["optimal"] is not None else targets.get(key[0])
+        ttt_a, ttt_b = _time_to_target(a, target), _time_to_target(b, target)
+        cell: Dict[str, Any] = {
+            "instance": key[0],
+            "algo": key[1],
+            "cost": [a["cost"], b["cost"]],
+            "d_cost": _delta(a["cost"], b["cost"]),
+            "d_gap_pct": _delta(_gap_pct(a), _gap_pct(b)),
+            "time_ratio": (b["avg_time"] / a["avg_time"]) if a["avg_time"] and b["avg_time"] else None,
+            "ttt": [ttt_a, ttt_b],
+            "p_value": None,
+            "worse": False,
+        }
+        if a["costs"] and b["costs"]:
+            test = mann_whitney_u(a["costs"], b["costs"])
+            if test is not None:
+                cell["p_value"] = test[1]
+                cell["worse"] = test[1] < alpha and statistics.median(b["costs"]) > statistics.median(a["costs"])
+        cells.append(cell)
+
+    gaps = [c["d_gap_pct"] for c in cells if c["d_gap_pct"] is not None]
+    pairs = [(c["cost"][0], c["cost"][1]) for c in cells if None not in c["cost"]]
+    wilcoxon = wilcoxon_signed_rank([p[0] for p in pairs], [p[1] for p in pairs]) if pairs else None
+    return {
+        "cells": cells,
+        "aggregate": {
+            "cells": len(cells),
+            "mean_d_cost": statistics.mean(c["d_cost"] for c in cells if c["d_cost"] is not None) if pairs else None,
+            "mean_d_gap_pct": statistics.mean(gaps) if gaps else None,
+            "geomean_time_ratio": geometric_mean([c["time_ratio"] for c in cells if c["time_ratio"]]),
+            "wilcoxon_p": wilcoxon[1] if wilcoxon else None,
+            "significantly_worse_cells": sum(1 for c in cells if c["worse"]),
+        },
+    }
+
+
+def _print_report(label: str, report: Dict[str, Any]) -> None:
+    print(f"\n== {label} ==")
+    print(f"{'instancia':<26}{'algo':<14}{'Δcosto':>9}{'Δgap%':>9}{'t_x':>8}{'TTT base':>10}{'TTT cand':>10}{'p':>8}")
+    for c in report["cells"]:
+        mark = " *" if c["worse"] else ""
+        print(
+            f"{c['instance']:<26}{c['algo']:<14}{_fmt(c['d_cost'], '+.2f'):>9}{_fmt(c['d_gap_pct'], '+.2f'):>9}"
+            f"{_fmt(c['time_ratio'], '.2f'):>8}{_fmt(c['ttt'][0]):>10}{_fmt(c['ttt'][1]):>10}{_fmt(c['p_value'], '.3f'):>8}{mark}"
+        )
+    agg = report["aggregate"]
+    print(
+        f"Agregado: celdas={agg['cells']} Δcosto medio={_fmt(agg['mean_d_cost'], '+.3f')} "
+        f"Δgap% medio={_fmt(agg['mean_d_gap_pct'], '+.3f')} tiempo (media geom.)={_fmt(agg['geomean_time_ratio'], '.3f')}x "
+        f"Wilcoxon p={_fmt(agg['wilcoxon_p'], '.4f')} peores (MWU)={agg['significantly_worse_cells']}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compara archivos de resultados (el primero es la línea base) y detecta regresiones."
+    )
+    parser.add_argument("files", nargs="+", help="Archivos .jsonl/.csv; el primero es la línea base")
+    parser.add_argument("--algos", type=str, default=None, help="Filtrar por algoritmos (separados por comas)")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia")
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=None,
+        help="Falla si la media geométrica de avg_time candidato/base supera este factor (p. ej. 1.10)",
+    )
+    parser.add_argument(
+        "--max-gap-increase",
+        type=float,
+        default=None,
+        help="Falla si el gap porcentual medio aumenta más que estos puntos",
+    )
+    parser.add_argument(
+        "--fail-on-significant",
+        action="store_true",
+        help="Falla si alguna celda es significativamente peor (Mann-Whitney sobre costs)",
+    )
+    parser.add_argument("--json", type=str, default=None, help="Ruta opcional para guardar el reporte completo")
+    args = parser.parse_args()
+
+    if len(args.files) < 2:
+        parser.error("Se necesitan al menos dos archivos")
+    sets = [(Path(f).stem, _load(Path(f))) for f in args.files]
+    if args.algos:
+        wanted = {a.strip() for a in args.algos.split(",")}
+        sets = [(label, {k: v for k, v in rows.items() if k[1] in wanted}) for label, rows in sets]
+
+    # Objetivo para time-to-target cuando no hay óptimo: mejor costo visto en cualquier archivo
+    targets: Dict[str, float] = {}
+    for _, rows in sets:
+        for (instance, _), row in rows.items():
+            best = row["best_cost"] if row["best_cost"] is not None else row["cost"]
+            if best is not None:
+                targets[instance] = min(targets.get(instance, best), best)
+
+    base_label, base = sets[0]
+    failures: List[str] = []
+    full: Dict[str, Any] = {"baseline": base_label, "candidates": {}}
+    for label, cand in sets[1:]:
+        report = compare(base, cand, targets, args.alpha)
+        full["candidates"][label] = report
+        _print_report(f"{base_label} -> {label}", report)
+        agg = report["aggregate"]
+        if args.max_slowdown is not None and agg["geomean_time_ratio"] and agg["geomean_time_ratio"] > args.max_slowdown:
+            failures.append(f"{label}: tiempo x{agg['geomean_time_ratio']:.3f} > x{args.max_slowdown}")
+        if args.max_gap_increase is not None and agg["mean_d_gap_pct"] is not None and agg["mean_d_gap_pct"] > args.max_gap_increase:
+            failures.append(f"{label}: gap medio +{agg['mean_d_gap_pct']:.3f} pts > {args.max_gap_increase}")
+        if args.fail_on_significant and agg["significantly_worse_cells"]:
+            failures.append(f"{label}: {agg['significantly_worse_cells']} celdas significativamente peores")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(full, indent=2, ensure_ascii=False), encoding="utf-8")
+    if failures:
+        print("\nREGRESIÓN:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
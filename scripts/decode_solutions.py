@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.core.serialization import decode_solution, encode_solution
+
+
+def _expand(obj: Dict[str, Any], encoding: str) -> Dict[str, Any]:
+    """Recodifica la solución y las soluciones por corrida de un objeto de salida."""
+    best = decode_solution(obj["solution"]) if obj.get("solution") else None
+    if best is not None:
+        obj["solution"] = encode_solution(best, encoding)
+    meta = obj.get("meta")
+    if isinstance(meta, dict) and meta.get("solutions"):
+        meta["solutions"] = [
+            encode_solution(decode_solution(s, best), encoding, best) for s in meta["solutions"]
+        ]
+    return obj
+
+
+def main() -> None:
+    """
+    Convierte las soluciones codificadas (bitmask, varint, diff) de la salida de
+    main.py --verbose o de un archivo de resultados .jsonl a otra codificación
+    (por defecto el formato completo con listas).
+    """
+    parser = argparse.ArgumentParser(description="Decodifica soluciones compactas")
+    parser.add_argument("input", nargs="?", default="-", help="Archivo JSON/JSONL (por defecto stdin)")
+    parser.add_argument("--encoding", choices=["full", "bitmask", "varint", "diff"], default="full")
+    args = parser.parse_args()
+
+    stream = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            print(json.dumps(_expand(json.loads(line), args.encoding), ensure_ascii=False))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+if __name__ == "__main__":
+    main()
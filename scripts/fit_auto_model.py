@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.algorithms.auto import DEFAULT_MODEL, fit, instance_features, option_key, predict
+from src.core.graph_io import load_csr
+from src.experiments.results_io import iter_rows
+
+# Algoritmos sin límite de tiempo: su time_limit no forma parte de la opción
+UNTIMED = {"heuristic"}
+
+# benchmarks_t<time_limit>_<num_runs>.jsonl
+_NAME_TIME = re.compile(r"_t(\d+(?:\.\d+)?)_")
+
+
+def _time_limit(row: Dict, path: Path) -> Optional[float]:
+    """time_limit de la fila: la columna si existe, si no el nombre del archivo (None si no se sabe)."""
+    if row.get("time_limit") not in (None, ""):
+        return float(row["time_limit"])
+    match = _NAME_TIME.search(path.name)
+    return float(match.group(1)) if match else None
+
+
+def main() -> None:
+    """
+    Ajusta el modelo del algoritmo "auto" con los resultados del barrido y los
+    rasgos de las instancias, y lo guarda en config/auto_model.json. Informa
+    además la elección por instancia (dejando fuera la instancia, leave-one-out)
+    y su regret real.
+    """
+    parser = argparse.ArgumentParser(description="Ajusta el modelo de selección automática")
+    parser.add_argument("results", nargs="*", help="Archivos de resultados (default: results/*.jsonl)")
+    parser.add_argument("--bench", default=str(PROJECT_ROOT / "data" / "bench_graphs_c"))
+    parser.add_argument("--k", type=int, default=3, help="Vecinos más cercanos")
+    parser.add_argument("--out", default=str(DEFAULT_MODEL))
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.results] or sorted((PROJECT_ROOT / "results").glob("*.jsonl"))
+    results: List[Tuple[str, str, Optional[float], float]] = []
+    for path in paths:
+        for row in iter_rows(path):
+            if row.get("status", "ok") != "ok" or str(row.get("feasible")).lower() != "true" or row.get("cost") in (None, ""):
+                continue
+            time_limit = None if row["algo"] in UNTIMED else _time_limit(row, path)
+            if time_limit is None and row["algo"] not in UNTIMED:
+                continue
+            results.append((row["instance"], row["algo"], time_limit, float(row["cost"])))
+
+    bench = Path(args.bench)
+    features: Dict[str, Dict[str, float]] = {}
+    for name in sorted({r[0] for r in results}):
+        if (bench / name).is_file():
+            features[name] = instance_features(load_csr(str(bench / name)))
+
+    model = fit(features, results, k=args.k)
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.out).write_text(json.dumps(model, indent=1), encoding="utf-8")
+    print(f"Modelo: {len(model['points'])} instancias, {len(model['options'])} opciones -> {args.out}")
+
+    # Validación dejando cada instancia fuera del ajuste
+    total = 0.0
+    for point in model["points"]:
+        name = point["instance"]
+        loo = fit({k: v for k, v in features.items() if k != name}, results, k=args.k)
+        choice = predict(loo, point["features"])
+        key = option_key(choice["algo"], choice["params"].get("time_limit"))
+        regret = point["regret"].get(key)
+        total += regret or 0.0
+        shown = f"{regret:.2f}%" if regret is not None else "-"
+        print(f"  {name:<26} elige {key:<18} regret real {shown}")
+    if model["points"]:
+        print(f"Regret medio (leave-one-out): {total / len(model['points']):.2f}%")
+
+
+if __name__ == "__main__":
+    main()
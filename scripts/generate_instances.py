@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.experiments.generators import FAMILIES, LARGE_TIER, generate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Genera instancias sintéticas en formato edgelist (en streaming)."
+    )
+    parser.add_argument("--out", type=str, default="data/large_graphs", help="Directorio de salida")
+    parser.add_argument(
+        "--tier",
+        action="store_true",
+        help="Genera todas las instancias del nivel 'large' del benchmark",
+    )
+    parser.add_argument("--family", type=str, choices=sorted(FAMILIES), help="Familia de grafos")
+    parser.add_argument("--name", type=str, help="Nombre del archivo .edgelist")
+    parser.add_argument(
+        "--kwargs",
+        type=str,
+        default="{}",
+        help="Argumentos del generador en JSON, p. ej. '{\"n\": 100000, \"avg_degree\": 6, \"seed\": 1}'",
+    )
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    if args.tier:
+        jobs = list(LARGE_TIER.items())
+    else:
+        if not args.family or not args.name:
+            parser.error("Se requiere --tier o bien --family y --name")
+        jobs = [(args.name, (args.family, json.loads(args.kwargs)))]
+    for name, (family, kwargs) in jobs:
+        optimum = generate(out, name, family, kwargs)
+        print(f"{out / name}: {family} {kwargs} óptimo={optimum}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,36 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
-
-import networkx as nx
-from tqdm import tqdm
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
 # Permitir ejecutar el script sin configurar PYTHONPATH
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.algorithms import heuristic, local_search, ils, gls
-from src.core.graph_io import load_edgelist
-from src.experiments.optimal_cover import get_optimal_cover_size
+from src.algorithms import ALGORITHMS as REGISTRY, ARRAY_ALGORITHMS, get_algorithm
+from src.core.graph_io import load_csr, load_edgelist
+from src.core.serialization import decode_solution, encode_solution
+from src.core.solution import Solution
+from src.experiments.catalog import open_catalog
+from src.experiments.generators import LARGE_TIER, generate
+from src.experiments.results_io import ResultWriter, completed_cells, params_hash
 from src.experiments.run_benchmark import run
+from src.experiments.sandbox import OK, report_incumbent, run_limited
 
-ALGORITHMS = {
-    "heuristic": heuristic.solve,
-    "local_search": local_search.solve,
-    "ils": ils.solve,
-    "gls": gls.solve,
-}
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Algoritmos del barrido por defecto; se importan al usarse
+ALGORITHMS = ("heuristic", "local_search", "ils", "gls")
+
+# Sin límite de tiempo propio: siempre corren aislados (--wall-time / --mem-mb)
+EXACT_ALGORITHMS = ("exact", "better_exact")
 
 
 def _parse_params(params_raw: str | None) -> Dict[str, Any] | None:
@@ -38,72 +42,234 @@ def _parse_params(params_raw: str | None) -> Dict[str, Any] | None:
     return json.loads(params_raw)
 
 
-def _iter_instances(folder: Path) -> Iterable[Tuple[str, nx.Graph]]:
-    for path in sorted(folder.glob("*.edgelist")):
-        yield path.name, load_edgelist(str(path))
+ROW_FIELDS = [
+    "instance", "algo", "cost", "feasible", "optimal", "gap", "gap_pct", "lower_bound",
+    "avg_time", "best_cost", "worst_cost", "num_runs", "costs", "times", "params_hash", "status",
+    "statuses", "peak_memory", "peak_blocks", "retained_blocks", "top_allocations",
+    "solution",
+]
 
+# Techos por algoritmo para el nivel "large": time_limit que recibe el algoritmo,
+# tiempo de pared máximo de cada semilla (incluye construcción) y memoria adicional.
+# Los algoritmos sin entrada usan los de "heuristic"
+LARGE_LIMITS: Dict[str, Dict[str, float]] = {
+    "heuristic": {"time_limit": 300.0, "wall": 900.0, "mem_mb": 8192},
+    "local_search": {"time_limit": 120.0, "wall": 900.0, "mem_mb": 8192},
+    "ils": {"time_limit": 120.0, "wall": 900.0, "mem_mb": 8192},
+    "gls": {"time_limit": 120.0, "wall": 900.0, "mem_mb": 8192},
+    "partition": {"time_limit": 120.0, "wall": 900.0, "mem_mb": 8192},
+}
 
-def _collect_results(
-    params: Dict[str, Any] | None,
-    instances: List[Tuple[str, nx.Graph]],
+
+def _parse_shard(raw: str | None) -> Tuple[int, int]:
+    """Interpreta '--shard i/N' (0 <= i < N)."""
+    if not raw:
+        return 0, 1
+    i, n = (int(x) for x in raw.split("/"))
+    if n < 1 or not 0 <= i < n:
+        raise ValueError(f"Shard inválido: {raw} (se espera i/N con 0 <= i < N)")
+    return i, n
+
+
+def _plan_cells(
+    folder: Path,
     algos: List[str],
-) -> List[Dict[str, Any]]:
-    results: List[Dict[str, Any]] = []
-    for algo_name in tqdm(algos, desc="Algoritmos", unit="algo"):
-        algorithm = ALGORITHMS[algo_name]
-        names = [name for name, _ in instances]
-        graphs = [g for _, g in instances]
-        for name, result in tqdm(
-            zip(names, run(algorithm, graphs, seed=params.get("seed") if params else None, params=params)),
-            desc=f"{algo_name}",
-            total=len(names),
-            unit="inst",
-            leave=False,
-        ):
-            optimal = get_optimal_cover_size(name)
-            gap = None if optimal is None else result.cost - optimal
-            meta = result.meta or {}
-            results.append(
-                {
-                    "instance": name,
-                    "algo": algo_name,
-                    "cost": result.cost,
-                    "feasible": result.feasible,
-                    "optimal": optimal,
-                    "gap": gap,
-                    "avg_time": meta.get("avg_time"),
-                    "best_cost": meta.get("best_cost"),
-                    "worst_cost": meta.get("worst_cost"),
-                    "num_runs": meta.get("num_runs"),
-                }
-            )
-    return results
-
-
-def _write_jsonl(path: Path, rows: List[Dict[str, Any]]) -> None:
-    with path.open("w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
-
-
-def _write_csv(path: Path, rows: List[Dict[str, Any]]) -> None:
-    if not rows:
-        return
-    with path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        writer.writeheader()
-        writer.writerows(rows)
+    shard: Tuple[int, int],
+    done: Set[Tuple[str, str]],
+) -> List[Tuple[Path, str]]:
+    """
+    Lista de celdas (instancia, algoritmo) a ejecutar: el reparto entre máquinas
+    se hace sobre la lista completa y ordenada (estable entre reinicios), y luego
+    se descartan las celdas ya terminadas.
+    """
+    cells = [(path, algo) for path in sorted(folder.glob("*.edgelist")) for algo in algos]
+    index, count = shard
+    mine = [cell for k, cell in enumerate(cells) if k % count == index]
+    return [(path, algo) for path, algo in mine if (path.name, algo) not in done]
+
+
+def _cell_params(params: Dict[str, Any] | None, record: Dict[str, Any] | None) -> Dict[str, Any] | None:
+    """Con stop_at_target, agrega el objetivo de la instancia (óptimo conocido o cota inferior)."""
+    if params and params.get("stop_at_target") and record:
+        target = record["optimum"] if record["optimum"] is not None else record["lower_bound"]
+        params = dict(params, target=target)
+    return params
+
+
+def _row(
+    name: str,
+    algo_name: str,
+    phash: str,
+    record: Dict[str, Any] | None,
+    cost: float | None,
+    feasible: bool | None,
+    solution: Any,
+    meta: Dict[str, Any],
+    solution_encoding: str | None = None,
+    status: str = "ok",
+) -> Dict[str, Any]:
+    """Fila de resultados de una celda; `record` es la entrada del catálogo de la instancia (óptimo y cotas)."""
+    optimal = record["optimum"] if record else None
+    gap = None if optimal is None or cost is None else cost - optimal
+    return {
+        "instance": name,
+        "algo": algo_name,
+        "cost": cost,
+        "feasible": feasible,
+        "optimal": optimal,
+        "gap": gap,
+        "gap_pct": 100.0 * gap / optimal if gap is not None and optimal else None,
+        "lower_bound": record["lower_bound"] if record else None,
+        "avg_time": meta.get("avg_time"),
+        "best_cost": meta.get("best_cost"),
+        "worst_cost": meta.get("worst_cost"),
+        "num_runs": meta.get("num_runs"),
+        # Valores por corrida (para pruebas de significancia en compare_benchmarks.py)
+        "costs": meta.get("costs"),
+        "times": meta.get("times"),
+        "params_hash": phash,
+        "status": status,
+        # Solo en celdas aisladas: estado de cada semilla (ok/timeout/oom/error)
+        "statuses": meta.get("statuses"),
+        # Solo con --memory-profile: pico máximo entre corridas, bloques vivos en el
+        # pico y al terminar, y sitios principales en el pico
+        "peak_memory": max(meta["peak_memory"]) if meta.get("peak_memory") else None,
+        "peak_blocks": max(meta["peak_blocks"]) if meta.get("peak_blocks") else None,
+        "retained_blocks": max(meta["retained_blocks"]) if meta.get("retained_blocks") else None,
+        "top_allocations": meta.get("top_allocations"),
+        # Solo con --solution-encoding: mejor cover codificado (ver serialization.decode_solution)
+        "solution": encode_solution(solution, solution_encoding) if solution_encoding and solution else None,
+    }
+
+
+def _run_cell(
+    params: Dict[str, Any] | None,
+    name: str,
+    graph: nx.Graph,
+    algo_name: str,
+    phash: str,
+    record: Dict[str, Any] | None = None,
+    solution_encoding: str | None = None,
+) -> Dict[str, Any]:
+    """Ejecuta todas las semillas de una celda en este proceso."""
+    algorithm = get_algorithm(algo_name)
+    seed = params.get("seed") if params else None
+    result = next(iter(run(algorithm, [graph], seed=seed, params=_cell_params(params, record))))
+    return _row(
+        name, algo_name, phash, record, result.cost, result.feasible, result.solution,
+        result.meta or {}, solution_encoding,
+    )
+
+
+def _run_seed(params: Dict[str, Any], graph: nx.Graph, algo_name: str) -> Any:
+    """Trabajo de una semilla dentro del hijo aislado; los solvers anytime reportan incumbentes por el canal."""
+    params = dict(params, on_incumbent=report_incumbent)
+    return next(iter(run(get_algorithm(algo_name), [graph], seed=params.get("seed"), params=params)))
+
+
+def _run_cell_sandboxed(
+    params: Dict[str, Any] | None,
+    name: str,
+    graph: nx.Graph,
+    algo_name: str,
+    phash: str,
+    record: Dict[str, Any] | None,
+    solution_encoding: str | None,
+    wall_time: float,
+    mem_mb: float,
+) -> Dict[str, Any]:
+    """
+    Ejecuta cada semilla de la celda en un proceso hijo con techos de tiempo de
+    pared y memoria. Si una semilla termina por tiempo o memoria se usa el
+    último incumbente que reportó (si el solver lo soporta). Como en run, cost
+    es el promedio de las semillas con cover y solution el mejor.
+    """
+    params = dict(_cell_params(params, record) or {})
+    seed = params.get("seed")
+    n_runs = int(params.get("num_runs", 1))
+    n = graph.number_of_nodes()
+    costs: List[int | None] = []
+    times: List[float] = []
+    statuses: List[str] = []
+    peaks: List[int] = []
+    best: Any = None
+    for i in range(n_runs):
+        job = dict(params, seed=(seed + i) if seed is not None else i, num_runs=1)
+        last: List[Any] = [None]
+        start = time.perf_counter()
+        status, value = run_limited(
+            _run_seed, (job, graph, algo_name), wall_time=wall_time, mem_mb=mem_mb,
+            on_incumbent=lambda cover: last.__setitem__(0, cover),
+        )
+        elapsed = time.perf_counter() - start
+        statuses.append(status)
+        solution = None
+        if status == "ok":
+            times.append(value.meta.get("avg_time", elapsed))
+            peaks.extend(value.meta.get("peak_memory") or [])
+            if value.feasible:
+                solution = value.solution
+        else:
+            times.append(elapsed)
+            if last[0] is not None:
+                solution = Solution.from_cover(last[0], n)
+        costs.append(solution.cost if solution is not None else None)
+        if solution is not None and (best is None or solution.cost < best.cost):
+            best = solution
+
+    found = [c for c in costs if c is not None]
+    meta = {
+        "avg_time": sum(times) / len(times),
+        "best_cost": min(found) if found else None,
+        "worst_cost": max(found) if found else None,
+        "num_runs": n_runs,
+        "costs": costs,
+        "times": times,
+        "statuses": statuses,
+        "peak_memory": peaks,
+    }
+    # La celda está "ok" solo si todas sus semillas terminaron; si no, el primer fallo
+    status = next((st for st in statuses if st != OK), OK)
+    return _row(
+        name, algo_name, phash, record, sum(found) / len(found) if found else None, True if best is not None else None,
+        best, meta, solution_encoding, status,
+    )
+
+
+def _run_cell_large(
+    params: Dict[str, Any] | None,
+    name: str,
+    graph: nx.Graph,
+    algo_name: str,
+    phash: str,
+    record: Dict[str, Any] | None,
+    solution_encoding: str | None = None,
+) -> Dict[str, Any]:
+    """Ejecuta una celda del nivel "large": cada semilla aislada con los techos de LARGE_LIMITS."""
+    limits = LARGE_LIMITS.get(algo_name, LARGE_LIMITS["heuristic"])
+    cell_params = dict(params or {})
+    cell_params["time_limit"] = min(float(cell_params.get("time_limit") or limits["time_limit"]), limits["time_limit"])
+    return _run_cell_sandboxed(
+        cell_params, name, graph, algo_name, phash, record, solution_encoding, limits["wall"], limits["mem_mb"]
+    )
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(
-        description="Ejecuta todos los algoritmos (excepto exactos) sobre el benchmark DIMACS."
+        description="Ejecuta los algoritmos sobre el benchmark DIMACS (los exactos, si se piden, corren aislados)."
     )
     parser.add_argument(
         "--bench",
         type=str,
-        default="data/bench_graphs_c",
-        help="Directorio con instancias .edgelist",
+        default=None,
+        help="Directorio con instancias .edgelist (default: data/bench_graphs_c, o data/large_graphs con --tier large)",
+    )
+    parser.add_argument(
+        "--tier",
+        type=str,
+        choices=["dimacs", "large"],
+        default="dimacs",
+        help="Nivel del benchmark: DIMACS o grafos sintéticos de ~10^6 vértices (se generan si faltan)",
     )
     parser.add_argument(
         "--params",
@@ -114,7 +280,7 @@ def main() -> None:
     parser.add_argument(
         "--algos",
         type=str,
-        default=",".join(ALGORITHMS.keys()),
+        default=",".join(ALGORITHMS),
         help="Lista separada por comas de algoritmos a ejecutar",
     )
     parser.add_argument(
@@ -130,27 +296,133 @@ def main() -> None:
         default="jsonl",
         help="Formato de salida",
     )
+    parser.add_argument(
+        "--shard",
+        type=str,
+        default=None,
+        help="Ejecuta solo la parte i de N de las celdas (formato i/N, p. ej. 0/4)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Descarta el archivo de salida en lugar de reanudar",
+    )
+    parser.add_argument(
+        "--fsync-every",
+        type=int,
+        default=10,
+        help="Filas escritas entre cada fsync",
+    )
+    parser.add_argument(
+        "--memory-profile",
+        type=str,
+        choices=["tracemalloc", "rss"],
+        default=None,
+        help="Registra memoria por corrida (tracemalloc: pico, bloques y sitios; rss: pico residente)",
+    )
+    parser.add_argument(
+        "--solution-encoding",
+        type=str,
+        choices=["bitmask", "varint"],
+        default=None,
+        help="Guarda el mejor cover de cada celda en la columna solution con esta codificación",
+    )
+    parser.add_argument(
+        "--sandbox",
+        action="store_true",
+        help="Ejecuta cada semilla en un proceso hijo con --wall-time y --mem-mb (siempre para exact y better_exact)",
+    )
+    parser.add_argument("--wall-time", type=float, default=300.0, help="Tiempo de pared máximo por semilla aislada (s)")
+    parser.add_argument("--mem-mb", type=float, default=4096, help="Memoria adicional máxima por semilla aislada (MB)")
+    parser.add_argument(
+        "--telemetry",
+        type=str,
+        default=None,
+        help="Progreso de cada corrida: stderr, jsonl:<ruta> o prom:<ruta> (ver src/core/telemetry.py)",
+    )
+    parser.add_argument("--telemetry-interval", type=float, default=10.0, help="Segundos entre instantáneas")
+    parser.add_argument(
+        "--stop-at-target",
+        action="store_true",
+        help="Detiene cada corrida al alcanzar el óptimo o la cota inferior del catálogo",
+    )
     args = parser.parse_args()
 
-    bench_dir = Path(args.bench)
+    large = args.tier == "large"
+    bench_dir = Path(args.bench or ("data/large_graphs" if large else "data/bench_graphs_c"))
     out_path = Path(args.out)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     params = _parse_params(args.params)
+    if args.memory_profile:
+        params = dict(params or {})
+        params["memory_profile"] = args.memory_profile
+    if args.stop_at_target:
+        params = dict(params or {})
+        params["stop_at_target"] = True
     algos = [a.strip() for a in args.algos.split(",") if a.strip()]
     for a in algos:
-        if a not in ALGORITHMS:
+        if a not in REGISTRY:
             raise ValueError(f"Algoritmo desconocido: {a}")
 
-    instances = list(_iter_instances(bench_dir))
-    rows = _collect_results(params, instances, algos)
+    if large:
+        # Genera en streaming las instancias que falten (y registra sus óptimos plantados)
+        for name, (family, kwargs) in LARGE_TIER.items():
+            generate(bench_dir, name, family, kwargs)
+    # Óptimos, cotas y mejores conocidos de la carpeta (se construye la primera vez)
+    catalog = open_catalog(bench_dir)
+
+    if args.overwrite and out_path.exists():
+        out_path.unlink()
+
+    # Reanudación: se omiten las celdas ya escritas con el mismo hash de parámetros
+    phash = params_hash(params)
+    done = completed_cells(out_path, phash)
+    cells = _plan_cells(bench_dir, algos, _parse_shard(args.shard), done)
+    array_only = all(a in ARRAY_ALGORITHMS for a in algos)
+    # Si todos los algoritmos trabajan sobre arreglos, se carga CSR sin NetworkX.
+    # En el nivel "large" siempre se usa CSR (ILS y GLS también lo aceptan)
+    loader = load_csr if array_only or large else load_edgelist
+
+    from tqdm import tqdm
+
+    loaded: Tuple[Path | None, Any] = (None, None)
+    with ResultWriter(out_path, args.format, ROW_FIELDS, fsync_every=args.fsync_every) as writer:
+        for path, algo_name in tqdm(cells, desc="Celdas", unit="celda"):
+            # Las celdas vienen agrupadas por instancia: se carga cada grafo una vez
+            if loaded[0] != path:
+                loaded = (path, loader(str(path)))
+            record = catalog.get(path.name)
+            # La telemetría no entra en el hash de parámetros (no cambia los resultados)
+            cell_params = params
+            if args.telemetry:
+                cell_params = dict(
+                    params or {},
+                    telemetry=args.telemetry,
+                    telemetry_interval=args.telemetry_interval,
+                    telemetry_labels={"instance": path.name},
+                )
+            if large:
+                row = _run_cell_large(cell_params, path.name, loaded[1], algo_name, phash, record, args.solution_encoding)
+            elif args.sandbox or algo_name in EXACT_ALGORITHMS:
+                row = _run_cell_sandboxed(
+                    cell_params, path.name, loaded[1], algo_name, phash, record, args.solution_encoding,
+                    args.wall_time, args.mem_mb,
+                )
+            else:
+                row = _run_cell(cell_params, path.name, loaded[1], algo_name, phash, record, args.solution_encoding)
+            writer.write(row)
+            if row.get("feasible"):
+                # cost es el promedio de las semillas: el mejor conocido es el tamaño del mejor cover
+                cover = decode_solution(row["solution"]) if row.get("solution") else None
+                best = cover.cost if cover is not None else row.get("best_cost")
+                if best is not None:
+                    catalog.record_best(path.name, int(best), encode_solution(cover, "varint") if cover else None)
 
-    if args.format == "csv":
-        _write_csv(out_path, rows)
-    else:
-        _write_jsonl(out_path, rows)
+    if catalog.dirty:
+        catalog.save()
 
-    print(f"Resultados guardados en {out_path}")
+    print(f"Resultados guardados en {out_path} ({len(cells)} celdas nuevas, {len(done)} reanudadas)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# Permitir ejecutar el script sin configurar PYTHONPATH
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.experiments.catalog import open_catalog
+from src.experiments.tuning import PARAM_SPACES, Racer
+
+
+def _parse_params(params_raw: str | None) -> Dict[str, Any] | None:
+    if not params_raw:
+        return None
+    if os.path.isfile(params_raw):
+        with open(params_raw, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return json.loads(params_raw)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Ajusta hiperparámetros por carrera (successive halving) sobre subconjuntos de instancias."
+    )
+    parser.add_argument("--algos", type=str, default=",".join(PARAM_SPACES), help="Algoritmos a ajustar")
+    parser.add_argument("--bench", type=str, default="data/bench_graphs_c", help="Directorio con instancias .edgelist")
+    parser.add_argument(
+        "--instances",
+        type=str,
+        default=None,
+        help="Instancias a usar (separadas por comas); por defecto todas, de menor a mayor tamaño",
+    )
+    parser.add_argument(
+        "--params",
+        type=str,
+        default="config/default_params.json",
+        help="Parámetros base (seed, num_runs, time_limit, ...)",
+    )
+    parser.add_argument("--configs", type=int, default=16, help="Configuraciones iniciales por algoritmo")
+    parser.add_argument("--eta", type=int, default=2, help="Factor de reducción por ronda")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia para eliminar")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos del pool (default: núcleos)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla del muestreo de configuraciones")
+    parser.add_argument("--out-dir", type=str, default="config/tuned", help="Directorio de salida")
+    args = parser.parse_args()
+
+    base = _parse_params(args.params) or {}
+    bench = Path(args.bench)
+    paths = sorted(bench.glob("*.edgelist"), key=lambda p: p.stat().st_size)
+    if args.instances:
+        wanted = {s.strip() for s in args.instances.split(",")}
+        paths = [p for p in paths if p.name in wanted]
+    instances = [(p.name, str(p)) for p in paths]
+    catalog = open_catalog(bench)
+    optima = {name: opt for name, _ in instances if (opt := catalog.optimum(name)) is not None}
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for algo in [a.strip() for a in args.algos.split(",") if a.strip()]:
+        racer = Racer(
+            algo,
+            instances,
+            base_params=base,
+            optima=optima,
+            n_configs=args.configs,
+            eta=args.eta,
+            alpha=args.alpha,
+            workers=args.workers,
+            seed=args.seed,
+        )
+        tuned, history = racer.race()
+        (out_dir / f"{algo}.json").write_text(json.dumps(tuned, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        (out_dir / f"{algo}.race.json").write_text(json.dumps(history, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"{algo}: {json.dumps({k: tuned[k] for k in PARAM_SPACES[algo] if k in tuned})} -> {out_dir / (algo + '.json')}")
+
+
+if __name__ == "__main__":
+    main()
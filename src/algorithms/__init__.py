@@ -0,0 +1,54 @@
+from __future__ import annotations
+from importlib import import_module
+from typing import Callable, Dict, Iterator, Mapping
+
+# Nombre del algoritmo -> "módulo:función". Los módulos se importan en el primer uso,
+# así el arranque de la CLI no paga la importación de todos los algoritmos.
+_ALGORITHM_SPECS: Dict[str, str] = {
+    "exact": "exact:solve",
+    "better_exact": "better_exact:solve",
+    "heuristic": "heuristic:solve",
+    "local_search": "local_search:solve",
+    "ils": "ils:solve",
+    "gls": "gls:solve",
+    "partition": "partition:solve",
+    "auto": "auto:solve",
+}
+
+# Algoritmos que funcionan sobre CSRGraph sin importar NetworkX
+ARRAY_ALGORITHMS = frozenset({"heuristic", "local_search", "partition"})
+
+# Algoritmos que leen las filas de bits de un BitsetGraph (load_csr con dense_threshold)
+BITSET_ALGORITHMS = frozenset({"heuristic"})
+
+
+class _LazyAlgorithms(Mapping[str, Callable]):
+    """Registro de algoritmos que resuelve cada entrada al accederla por primera vez."""
+
+    def __init__(self, specs: Dict[str, str]) -> None:
+        self._specs = specs
+        self._loaded: Dict[str, Callable] = {}
+
+    def __getitem__(self, name: str) -> Callable:
+        fn = self._loaded.get(name)
+        if fn is None:
+            module, attr = self._specs[name].split(":")
+            fn = getattr(import_module(f"{__name__}.{module}"), attr)
+            self._loaded[name] = fn
+        return fn
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+
+ALGORITHMS = _LazyAlgorithms(_ALGORITHM_SPECS)
+
+
+def get_algorithm(name: str) -> Callable:
+    """Retorna la función solve del algoritmo (ValueError si no existe)."""
+    if name not in _ALGORITHM_SPECS:
+        raise ValueError(f"Algoritmo desconocido: {name}")
+    return ALGORITHMS[name]
@@ -0,0 +1,241 @@
+from __future__ import annotations
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from ..core.api import Result
+from ..core.csr import CSRGraph
+
+# Selección automática de algoritmo y parámetros a partir de rasgos baratos de la
+# instancia. El modelo se ajusta fuera de línea (scripts/fit_auto_model.py) con los
+# resultados de results/*.jsonl y se guarda en config/auto_model.json: para cada
+# instancia de entrenamiento guarda sus rasgos y el "regret" (% sobre el mejor costo
+# de esa instancia) de cada opción (algoritmo, time_limit). Al resolver se eligen
+# los k vecinos más cercanos en el espacio de rasgos normalizado y la opción con
+# menor regret promedio ponderado.
+
+DEFAULT_MODEL = Path(__file__).resolve().parents[2] / "config" / "auto_model.json"
+
+# Rasgos usados en la distancia (ver _vector)
+FEATURES = ("log_n", "log_m", "density", "log_deg_var", "kernel_frac")
+
+# Sin modelo se usa esta opción
+FALLBACK = {"algo": "local_search", "params": {}}
+
+_MODELS: Dict[str, Optional[Dict[str, Any]]] = {}
+
+
+def _kernel_size(csr: CSRGraph) -> int:
+    """
+    Vértices que quedan tras aplicar hasta agotar las reglas de grado 0 (se
+    descarta) y grado 1 (su vecino entra al cover y ambos salen), en O(n + m).
+    """
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    deg = [0] * n
+    for v in range(n):
+        for k in range(indptr[v], indptr[v + 1]):
+            if indices[k] != v:
+                deg[v] += 1
+    removed = bytearray(n)
+    stack = [v for v in range(n) if deg[v] <= 1]
+    remaining = n
+    while stack:
+        v = stack.pop()
+        if removed[v] or deg[v] > 1:
+            continue
+        removed[v] = 1
+        remaining -= 1
+        if deg[v] == 0:
+            continue
+        # Grado 1: el único vecino vivo entra al cover y se quita con sus aristas
+        u = next(indices[k] for k in range(indptr[v], indptr[v + 1]) if not removed[indices[k]])
+        removed[u] = 1
+        remaining -= 1
+        for k in range(indptr[u], indptr[u + 1]):
+            w = indices[k]
+            if not removed[w] and w != u:
+                deg[w] -= 1
+                if deg[w] <= 1:
+                    stack.append(w)
+    return remaining
+
+
+def instance_features(instance: Any) -> Dict[str, float]:
+    """Rasgos de la instancia: n, m, densidad, varianza del grado y tamaño del kernel."""
+    csr = CSRGraph.from_graph(instance)
+    n, m = csr.number_of_nodes(), csr.number_of_edges()
+    indptr = csr.indptr
+    deg = [indptr[v + 1] - indptr[v] for v in range(n)]
+    mean = sum(deg) / n if n else 0.0
+    return {
+        "n": n,
+        "m": m,
+        "density": 2.0 * m / (n * (n - 1)) if n > 1 else 0.0,
+        "deg_var": sum((d - mean) ** 2 for d in deg) / n if n else 0.0,
+        "kernel": _kernel_size(csr),
+    }
+
+
+def _vector(features: Dict[str, float]) -> List[float]:
+    n = features["n"]
+    return [
+        math.log1p(n),
+        math.log1p(features["m"]),
+        features["density"],
+        math.log1p(features["deg_var"]),
+        features["kernel"] / n if n else 0.0,
+    ]
+
+
+def option_key(algo: str, time_limit: Optional[float]) -> str:
+    return algo if time_limit is None else f"{algo}@{time_limit:g}"
+
+
+def fit(
+    features: Dict[str, Dict[str, float]],
+    results: Sequence[Tuple[str, str, Optional[float], float]],
+    k: int = 3,
+) -> Dict[str, Any]:
+    """
+    Ajusta el modelo. `features` va de instancia a rasgos y `results` son tuplas
+    (instancia, algoritmo, time_limit, costo promedio); las repetidas de una
+    misma opción se promedian. time_limit None indica un algoritmo sin límite.
+    """
+    costs: Dict[str, Dict[str, List[float]]] = {}
+    options: Dict[str, Dict[str, Any]] = {}
+    for name, algo, time_limit, cost in results:
+        if name not in features or cost is None:
+            continue
+        key = option_key(algo, time_limit)
+        options[key] = {"algo": algo, "time_limit": time_limit}
+        costs.setdefault(name, {}).setdefault(key, []).append(float(cost))
+
+    points = []
+    for name, by_option in sorted(costs.items()):
+        avg = {key: sum(v) / len(v) for key, v in by_option.items()}
+        best = min(avg.values())
+        points.append({
+            "instance": name,
+            "features": features[name],
+            "regret": {key: 100.0 * (c - best) / best if best else 0.0 for key, c in avg.items()},
+        })
+
+    vectors = [_vector(p["features"]) for p in points]
+    dims = len(FEATURES)
+    mean = [sum(v[i] for v in vectors) / len(vectors) for i in range(dims)] if vectors else [0.0] * dims
+    std = [
+        math.sqrt(sum((v[i] - mean[i]) ** 2 for v in vectors) / len(vectors)) or 1.0 if vectors else 1.0
+        for i in range(dims)
+    ]
+    return {
+        "version": 1,
+        "features": list(FEATURES),
+        "k": k,
+        "mean": mean,
+        "std": std,
+        "options": options,
+        "points": points,
+    }
+
+
+def predict(
+    model: Dict[str, Any],
+    features: Dict[str, float],
+    budget: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Elige la opción con menor regret promedio entre los k vecinos más cercanos
+    (pesos 1 / distancia). Con `budget` solo se consideran opciones con
+    time_limit <= budget (si ninguna cabe, la de menor time_limit). Empates:
+    la opción más barata.
+    """
+    mean, std = model["mean"], model["std"]
+    x = [(a - mu) / s for a, mu, s in zip(_vector(features), mean, std)]
+    scored = []
+    for p in model["points"]:
+        y = [(a - mu) / s for a, mu, s in zip(_vector(p["features"]), mean, std)]
+        scored.append((math.dist(x, y), p))
+    scored.sort(key=lambda t: t[0])
+    neighbors = scored[: model["k"]]
+
+    options = model["options"]
+    allowed = [
+        key for key, opt in options.items()
+        if budget is None or opt["time_limit"] is None or opt["time_limit"] <= budget
+    ]
+    if not allowed:
+        allowed = [min(options, key=lambda key: options[key]["time_limit"] or 0.0)]
+
+    best: Optional[Tuple[float, float, str]] = None
+    for key in allowed:
+        total = weight = 0.0
+        for dist, p in neighbors:
+            if key not in p["regret"]:
+                break
+            w = 1.0 / (dist + 1e-9)
+            total += w * p["regret"][key]
+            weight += w
+        else:
+            candidate = (total / weight, options[key]["time_limit"] or 0.0, key)
+            if best is None or candidate < best:
+                best = candidate
+    if best is None:
+        return dict(FALLBACK, predicted_regret=None, neighbors=[p["instance"] for _, p in neighbors])
+    opt = options[best[2]]
+    params = {} if opt["time_limit"] is None else {"time_limit": opt["time_limit"]}
+    return {
+        "algo": opt["algo"],
+        "params": params,
+        "predicted_regret": best[0],
+        "neighbors": [p["instance"] for _, p in neighbors],
+    }
+
+
+def load_model(path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Modelo guardado (cacheado por ruta); None si el archivo no existe."""
+    key = str(path or DEFAULT_MODEL)
+    if key not in _MODELS:
+        p = Path(key)
+        _MODELS[key] = json.loads(p.read_text(encoding="utf-8")) if p.exists() else None
+    return _MODELS[key]
+
+
+def solve(
+    instance: Any,
+    seed: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Result:
+    """
+    Calcula los rasgos de la instancia, elige algoritmo y parámetros con el
+    modelo (params["auto_model"], por defecto config/auto_model.json) y lo
+    ejecuta. params["time_limit"] actúa como presupuesto de la elección; el
+    resto de params se pasa al algoritmo elegido (los elegidos tienen prioridad).
+    """
+    from . import get_algorithm
+
+    params = params or {}
+    start = time.perf_counter()
+    features = instance_features(instance)
+    feature_time = time.perf_counter() - start
+
+    model = load_model(params.get("auto_model"))
+    budget = params.get("time_limit")
+    decision = predict(model, features, budget) if model else dict(FALLBACK, predicted_regret=None, neighbors=[])
+    decision_time = time.perf_counter() - start - feature_time
+
+    run_params = {k: v for k, v in params.items() if k != "auto_model"}
+    run_params.update(decision["params"])
+    result = get_algorithm(decision["algo"])(instance, seed=seed, params=run_params)
+    meta = dict(result.meta or {})
+    meta["auto"] = {
+        "algo": decision["algo"],
+        "params": decision["params"],
+        "predicted_regret": decision["predicted_regret"],
+        "neighbors": decision["neighbors"],
+        "model": str(params.get("auto_model") or DEFAULT_MODEL) if model else None,
+        "features": features,
+        "feature_time": feature_time,
+        "decision_time": decision_time,
+    }
+    return Result(solution=result.solution, cost=result.cost, feasible=result.feasible, meta=meta)
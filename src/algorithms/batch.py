@@ -0,0 +1,101 @@
+from __future__ import annotations
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+from ..core.api import Result
+from ..core.csr import CSRGraph, pack
+from ..core.solution import Solution
+from .heuristic import IsolationWorkspace, _mvc_isolation_arrays
+
+
+def _to_csr(graph: Any) -> CSRGraph:
+    """Acepta un CSRGraph, un grafo de NetworkX o una tupla (n, aristas)."""
+    if isinstance(graph, tuple):
+        n, edges = graph
+        return CSRGraph.from_edges(n, edges)
+    return CSRGraph.from_graph(graph)
+
+
+def _resolve(algo: Union[str, Callable[..., Result]]) -> Callable[..., Result]:
+    if callable(algo):
+        return algo
+    from . import get_algorithm
+    return get_algorithm(algo)
+
+
+def _heuristic_chunk(
+    graphs: List[CSRGraph],
+    ws: IsolationWorkspace,
+) -> Iterator[Result]:
+    """
+    Resuelve un lote con la heurística de aislamiento en una sola pasada
+    sobre el CSR concatenado y reparte la máscara por instancia.
+    """
+    union, offsets = pack(graphs)
+    mask = _mvc_isolation_arrays(union.indptr, union.indices, union.number_of_nodes(), ws)
+    indptr, indices = union.indptr, union.indices
+
+    for i in range(len(graphs)):
+        lo, hi = offsets[i], offsets[i + 1]
+        # Factibilidad: todo vértice fuera del cover debe tener sus vecinos dentro
+        feasible = all(
+            mask[v] or all(mask[indices[j]] for j in range(indptr[v], indptr[v + 1]))
+            for v in range(lo, hi)
+        )
+        sol = Solution.from_mask(mask[lo:hi])
+        yield Result(
+            solution=sol,
+            cost=sol.cost,
+            feasible=feasible,
+            meta={
+                "method": "Isolation",
+                "note": "Heurística de aislamiento resuelta por lotes sobre CSR concatenado",
+                "batch_size": len(graphs),
+            },
+        )
+
+
+def solve_batch(
+    graphs: Iterable[Any],
+    algo: Union[str, Callable[..., Result]] = "heuristic",
+    params: Optional[Dict[str, Any]] = None,
+    seed: Optional[int] = None,
+) -> Iterator[Result]:
+    """
+    Resuelve muchas instancias pequeñas en un solo proceso y entrega los
+    resultados en streaming (generador), en el mismo orden de entrada.
+
+    - graphs: iterable de CSRGraph, grafos de NetworkX o tuplas (n, aristas).
+    - algo: nombre de un módulo de src.algorithms o una función solve.
+    - params["batch_size"]: instancias empaquetadas por lote (default: 256).
+
+    Para "heuristic" el lote se empaqueta en un único CSR y la construcción se
+    ejecuta una sola vez sobre la unión, reutilizando los buffers entre lotes.
+    El resto de algoritmos se ejecuta instancia por instancia.
+    """
+    params = params or {}
+    batch_size = max(1, int(params.get("batch_size", 256)))
+    it = iter(graphs)
+
+    if algo == "heuristic":
+        ws = IsolationWorkspace()
+        while True:
+            chunk = [_to_csr(g) for g in islice(it, batch_size)]
+            if not chunk:
+                return
+            yield from _heuristic_chunk(chunk, ws)
+
+    from . import ARRAY_ALGORITHMS
+
+    solver = _resolve(algo)
+    for graph in it:
+        if isinstance(graph, tuple):
+            if algo in ARRAY_ALGORITHMS:
+                graph = _to_csr(graph)
+            else:
+                # Los demás algoritmos trabajan sobre grafos de NetworkX
+                import networkx as nx
+                n, edges = graph
+                graph = nx.Graph()
+                graph.add_nodes_from(range(n))
+                graph.add_edges_from(edges)
+        yield solver(graph, seed=seed, params=params)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Optional, Set, Tuple
 import random
 import networkx as nx
 from ..core.api import Result
@@ -50,7 +50,12 @@ def _reduce_graph(graph: nx.Graph, cover: Set[int]) -> None:
                 break
 
 
-def _branch_and_bound(graph: nx.Graph, cover: Set[int], best_cover: Set[int]) -> Set[int]:
+def _branch_and_bound(
+    graph: nx.Graph,
+    cover: Set[int],
+    best_cover: Set[int],
+    on_incumbent: Optional[Callable[[Set[int]], None]] = None,
+) -> Set[int]:
     """
     Algoritmo exacto de branching con poda para Minimum Vertex Cover.
     Usa reglas de reducción y cotas inferiores para podar ramas:
@@ -58,6 +63,7 @@ def _branch_and_bound(graph: nx.Graph, cover: Set[int], best_cover: Set[int]) ->
     - Si el tamaño del cover actual es mayor o igual al mejor encontrado, se poda.
     - Si la cota inferior (matching maximal) más el tamaño del cover actual
       es mayor o igual al mejor encontrado, se poda.
+    Si se pasa on_incumbent, se le informa cada mejora del mejor cover.
     """
     # Iniciamos aplicando reducciones
     _reduce_graph(graph, cover)
@@ -89,11 +95,13 @@ def _branch_and_bound(graph: nx.Graph, cover: Set[int], best_cover: Set[int]) ->
     cover_u = set(cover)
     cover_u.add(u)
     # Resolvemos recursivamente el subproblema
-    sol_u = _branch_and_bound(g_u, cover_u, best_cover)
+    sol_u = _branch_and_bound(g_u, cover_u, best_cover, on_incumbent)
 
     # Si la solución de la rama 1 es mejor, actualizamos best_cover
     if len(sol_u) < len(best_cover):
         best_cover = sol_u
+        if on_incumbent is not None:
+            on_incumbent(best_cover)
 
     # Rama 2: usando v
     # Hacemos una copia del grafo sin el nodo v
@@ -103,11 +111,13 @@ def _branch_and_bound(graph: nx.Graph, cover: Set[int], best_cover: Set[int]) ->
     cover_v = set(cover)
     cover_v.add(v)
     # Resolvemos recursivamente el subproblema
-    sol_v = _branch_and_bound(g_v, cover_v, best_cover)
+    sol_v = _branch_and_bound(g_v, cover_v, best_cover, on_incumbent)
 
     # Si la solución de la rama 2 es mejor, actualizamos best_cover
     if len(sol_v) < len(best_cover):
         best_cover = sol_v
+        if on_incumbent is not None:
+            on_incumbent(best_cover)
 
     return best_cover
 
@@ -123,13 +133,19 @@ def solve(
     rng_seed = params.get("seed", seed) if params else seed
     rng = random.Random(rng_seed)
 
-    # Obtenemos una solución inicial usando heurística voraz
-    initial_cover = _initial_cover(instance, rng)
+    # Obtenemos una solución inicial usando heurística voraz (o la construida de antemano)
+    initial = params.get("initial_cover") if params else None
+    initial_cover = set(initial) if initial is not None else _initial_cover(instance, rng)
     best_cover = set(initial_cover)
 
+    # Reporte anytime (p. ej. sandbox.report_incumbent): la solución inicial y cada mejora
+    on_incumbent = params.get("on_incumbent") if params else None
+    if on_incumbent is not None:
+        on_incumbent(best_cover)
+
     cover = set()
     # Ejecutamos el branch-and-bound
-    best_cover = _branch_and_bound(instance.copy(), cover, best_cover)
+    best_cover = _branch_and_bound(instance.copy(), cover, best_cover, on_incumbent)
 
     # Construimos el objeto Result
     sol = Solution.from_cover(best_cover, n)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+import random
+from heapq import heapify, heappop, heappush
+from typing import Any, Callable, Dict, List, Sequence, Set
+from ..core.csr import CSRGraph
+
+# Construcciones iniciales sobre arreglos. Cada una recibe el estado compartido
+# de _Arrays (CSR, aristas y grados, calculado una sola vez por grafo) y un rng,
+# y corre en O(m) u O(m log n), sin copiar el grafo ni el conjunto de aristas.
+
+
+class _Arrays:
+    """Estado de solo lectura compartido por todas las semillas de un grafo."""
+
+    __slots__ = ("n", "indptr", "indices", "deg", "eu", "ev", "loops")
+
+    def __init__(self, instance: Any) -> None:
+        csr = CSRGraph.from_graph(instance)
+        self.n = csr.number_of_nodes()
+        self.indptr = csr.indptr
+        self.indices = csr.indices
+        self.deg = [csr.indptr[v + 1] - csr.indptr[v] for v in range(self.n)]
+        # Aristas sin lazos, cada una una vez (mismo orden que edges())
+        eu: List[int] = []
+        ev: List[int] = []
+        loops: List[int] = []
+        for u, w in csr.edges():
+            if u != w:
+                eu.append(u)
+                ev.append(w)
+            else:
+                loops.append(u)
+        self.eu = eu
+        self.ev = ev
+        self.loops = loops      # Vértices con lazo: deben estar en todo cover
+
+
+def edge_greedy(arrays: _Arrays, rng: random.Random) -> Set[int]:
+    """
+    Mientras haya aristas sin cubrir, toma una al azar y agrega su extremo de
+    mayor grado (desempate aleatorio). Recorrer una permutación aleatoria de las
+    aristas saltando las ya cubiertas equivale a elegir cada vez una arista
+    uniforme entre las que quedan, pero cuesta O(m) en total.
+    """
+    eu, ev, deg = arrays.eu, arrays.ev, arrays.deg
+    order = list(range(len(eu)))
+    rng.shuffle(order)
+    in_cover = bytearray(arrays.n)
+    for e in order:
+        u, v = eu[e], ev[e]
+        if in_cover[u] or in_cover[v]:
+            continue
+        du, dv = deg[u], deg[v]
+        if du == dv:
+            chosen = u if rng.random() < 0.5 else v
+        else:
+            chosen = u if du > dv else v
+        in_cover[chosen] = 1
+    return {v for v in range(arrays.n) if in_cover[v]}
+
+
+def max_degree_greedy(arrays: _Arrays, rng: random.Random) -> Set[int]:
+    """
+    Agrega repetidamente el vértice de mayor grado residual, con desempate
+    aleatorio. Cola de prioridad perezosa (-grado, clave aleatoria, vértice):
+    O(m log n).
+    """
+    n, indptr, indices = arrays.n, arrays.indptr, arrays.indices
+    deg = list(arrays.deg)
+    # Los lazos no cuentan en el grado residual (se cubren aparte, en build_covers)
+    for v in arrays.loops:
+        deg[v] -= 1
+    tie = [rng.random() for _ in range(n)]
+    removed = bytearray(n)
+    cover: Set[int] = set()
+    heap = [(-d, tie[v], v) for v, d in enumerate(deg) if d > 0]
+    heapify(heap)
+    while heap:
+        d, _, v = heappop(heap)
+        if removed[v] or -d != deg[v]:
+            continue
+        cover.add(v)
+        removed[v] = 1
+        for k in range(indptr[v], indptr[v + 1]):
+            u = indices[k]
+            if not removed[u] and u != v:
+                deg[u] -= 1
+                if deg[u] > 0:
+                    heappush(heap, (-deg[u], tie[u], u))
+    return cover
+
+
+def maximal_matching(arrays: _Arrays, rng: random.Random) -> Set[int]:
+    """
+    2-aproximación: ambos extremos de un matching maximal (aristas en orden aleatorio).
+    """
+    eu, ev = arrays.eu, arrays.ev
+    order = list(range(len(eu)))
+    rng.shuffle(order)
+    matched = bytearray(arrays.n)
+    for e in order:
+        u, v = eu[e], ev[e]
+        if not matched[u] and not matched[v]:
+            matched[u] = matched[v] = 1
+    return {v for v in range(arrays.n) if matched[v]}
+
+
+METHODS: Dict[str, Callable[[_Arrays, random.Random], Set[int]]] = {
+    "edge_greedy": edge_greedy,
+    "max_degree": max_degree_greedy,
+    "matching": maximal_matching,
+}
+
+
+def construct(instance: Any, rng: random.Random, method: str = "edge_greedy") -> Set[int]:
+    """Construye un cover factible con el método indicado."""
+    return build_covers(instance, [rng], method)[0]
+
+
+def build_covers(
+    instance: Any,
+    seeds: Sequence[Any],
+    method: str = "edge_greedy",
+) -> List[Set[int]]:
+    """
+    Construye un cover por semilla en una sola pasada: los arreglos del grafo se
+    preparan una vez y cada semilla solo paga su recorrido O(m).
+    `seeds` puede contener enteros (o None) o instancias de random.Random.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Construcción desconocida: {method} (opciones: {', '.join(METHODS)})")
+    build = METHODS[method]
+    arrays = _Arrays(instance)
+    covers = []
+    for seed in seeds:
+        rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        cover = build(arrays, rng)
+        cover.update(arrays.loops)
+        covers.append(cover)
+    return covers
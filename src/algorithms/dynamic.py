@@ -0,0 +1,222 @@
+from __future__ import annotations
+import random
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from ..core.solution import Solution
+
+Edge = Tuple[int, int]
+
+
+class DynamicCover:
+    """
+    Vertex cover mantenido bajo inserciones y borrados de aristas.
+
+    Guarda la adyacencia como diccionario de conjuntos, el cover actual y, para
+    cada vértice del cover, su pérdida (loss): cuántas aristas quedarían sin
+    cubrir si se quitara. Un vértice con loss 0 es redundante.
+
+    Cada lote de cambios se repara localmente:
+    1) Una arista nueva sin cubrir agrega su extremo de mayor grado.
+    2) Los extremos de las aristas tocadas forman la región afectada; se quitan
+       los vértices redundantes de la región y luego se hace una búsqueda local
+       acotada (intercambios 1-1 con vértices de loss 1 seguidos de borrados
+       de redundantes) solo en esa región.
+    El cover es factible después de cada update().
+    """
+
+    def __init__(
+        self,
+        graph: Any = None,
+        cover: Optional[Iterable[int]] = None,
+        seed: Optional[int] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        params = params or {}
+        self.budget = int(params.get("budget", 50))   # Intercambios por lote
+        self._rng = random.Random(seed)
+        self._adj: Dict[int, Set[int]] = {}
+        self._cover: Set[int] = set()
+        self._loss: Dict[int, int] = {}
+        self._tabu: Dict[int, int] = {}               # Vértice -> paso hasta el que no vuelve a entrar
+        self._step = 0
+
+        if graph is not None:
+            for v in graph.nodes():
+                self._adj[v] = set(graph.neighbors(v))
+            if cover is None:
+                from . import get_algorithm
+                algo = params.get("algo", "heuristic")
+                cover = get_algorithm(algo)(graph, seed=seed, params=params.get("algo_params")).solution.cover
+        for v in cover or ():
+            self._cover.add(v)
+        for v in self._cover:
+            self._loss[v] = self._count_loss(v)
+        # Si el cover inicial no es factible, se completa igual que con aristas nuevas
+        for u, nbrs in list(self._adj.items()):
+            for w in nbrs:
+                if u not in self._cover and w not in self._cover:
+                    self._add(u if len(self._adj[u]) >= len(self._adj[w]) else w)
+
+    # --- Consultas -------------------------------------------------------------
+
+    @property
+    def cover(self) -> Set[int]:
+        return set(self._cover)
+
+    def __len__(self) -> int:
+        return len(self._cover)
+
+    def number_of_nodes(self) -> int:
+        return len(self._adj)
+
+    def number_of_edges(self) -> int:
+        loops = sum(1 for v, nbrs in self._adj.items() if v in nbrs)
+        return (sum(len(nbrs) for nbrs in self._adj.values()) - loops) // 2 + loops
+
+    def is_cover(self) -> bool:
+        cover = self._cover
+        return all(u in cover or w in cover for u, nbrs in self._adj.items() for w in nbrs)
+
+    def solution(self) -> Solution:
+        """Solution con los vértices 0..max_id (para evaluar o serializar)."""
+        n = max(self._adj, default=-1) + 1
+        return Solution.from_cover(self._cover, n)
+
+    # --- Actualización ---------------------------------------------------------
+
+    def update(self, inserts: Iterable[Edge] = (), deletes: Iterable[Edge] = ()) -> Dict[str, int]:
+        """
+        Aplica un lote de borrados e inserciones y repara el cover.
+        Retorna cuántos vértices entraron y salieron y el tamaño final.
+        """
+        before = set(self._cover)
+        region: Set[int] = set()
+        for u, w in deletes:
+            if self._delete_edge(u, w):
+                region.add(u)
+                region.add(w)
+        for u, w in inserts:
+            if self._insert_edge(u, w):
+                region.add(u)
+                region.add(w)
+        self._improve(region)
+        return {
+            "added": len(self._cover - before),
+            "removed": len(before - self._cover),
+            "size": len(self._cover),
+        }
+
+    def _insert_edge(self, u: int, w: int) -> bool:
+        adj = self._adj
+        nu = adj.setdefault(u, set())
+        nw = adj.setdefault(w, set())
+        if w in nu:
+            return False
+        nu.add(w)
+        nw.add(u)
+        cover = self._cover
+        if u == w:
+            # Un lazo solo lo cubre u: cuenta en su pérdida o lo obliga a entrar
+            if u in cover:
+                self._loss[u] += 1
+            else:
+                self._add(u)
+            return True
+        if u in cover and w in cover:
+            return True
+        if u in cover:
+            self._loss[u] += 1
+        elif w in cover:
+            self._loss[w] += 1
+        else:
+            # Arista nueva sin cubrir: entra el extremo de mayor grado
+            self._add(u if len(nu) >= len(nw) else w)
+        return True
+
+    def _delete_edge(self, u: int, w: int) -> bool:
+        nu = self._adj.get(u)
+        if nu is None or w not in nu:
+            return False
+        nu.discard(w)
+        self._adj[w].discard(u)
+        cover = self._cover
+        if u == w:
+            if u in cover:
+                self._loss[u] -= 1
+        elif u in cover and w not in cover:
+            self._loss[u] -= 1
+        elif w in cover and u not in cover:
+            self._loss[w] -= 1
+        return True
+
+    # --- Movimientos -----------------------------------------------------------
+
+    def _count_loss(self, v: int) -> int:
+        cover = self._cover
+        # Un lazo (v, v) solo lo cubre v
+        return sum(1 for n in self._adj.get(v, ()) if n not in cover or n == v)
+
+    def _add(self, v: int) -> None:
+        cover = self._cover
+        loss = self._loss
+        for n in self._adj[v]:
+            if n in cover and n != v:
+                loss[n] -= 1
+        cover.add(v)
+        loss[v] = self._count_loss(v)
+
+    def _remove(self, v: int) -> None:
+        cover = self._cover
+        loss = self._loss
+        cover.discard(v)
+        del loss[v]
+        for n in self._adj[v]:
+            if n in cover:
+                loss[n] += 1
+
+    def _drop_redundant(self, candidates: Iterable[int]) -> List[int]:
+        """Quita del cover los candidatos con loss 0 (menor grado primero)."""
+        removed = []
+        order = sorted((v for v in candidates if v in self._cover), key=lambda v: (len(self._adj[v]), v))
+        for v in order:
+            if v in self._cover and self._loss[v] == 0:
+                self._remove(v)
+                removed.append(v)
+        return removed
+
+    def _improve(self, region: Set[int]) -> None:
+        """Borrado de redundantes y búsqueda local acotada en la región afectada."""
+        region = set(region)
+        for v in list(region):
+            region.update(self._adj.get(v, ()))
+        self._drop_redundant(region)
+
+        cover = self._cover
+        loss = self._loss
+        adj = self._adj
+        tabu = self._tabu
+        rng = self._rng
+        for _ in range(self.budget):
+            self._step += 1
+            # Intercambio 1-1: v (loss 1) sale y entra su único vecino descubierto u
+            swaps = [v for v in region if v in cover and loss[v] == 1 and v not in adj[v]]
+            if not swaps:
+                break
+            v = rng.choice(swaps)
+            u = next(n for n in adj[v] if n not in cover)
+            if tabu.get(u, 0) > self._step:
+                continue
+            self._add(u)
+            self._remove(v)
+            tabu[v] = self._step + 2
+            # Tras el intercambio, los vecinos de u pueden haber quedado redundantes
+            region.update(adj[u])
+            self._drop_redundant(adj[u])
+
+    # --- Construcción ----------------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Edge], seed: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> "DynamicCover":
+        """Arma el estado desde cero insertando las aristas (sin resolver antes)."""
+        dyn = cls(seed=seed, params=params)
+        dyn.update(inserts=edges)
+        return dyn
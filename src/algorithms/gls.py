@@ -6,6 +6,7 @@ import networkx as nx
 from ..core.api import Result
 from ..core.evaluator import Evaluator
 from ..core.solution import Solution
+from ..core.telemetry import progress_from_params
 from .utils import _edge_key, _initial_cover
 
 
@@ -87,6 +88,9 @@ def solve(
 		- max_iter: máximo de iteraciones de GLS.
 		- time_limit: límite de tiempo en segundos.
 		- lambda_penalty: peso de la penalización (lambda en la fórmula).
+		- target: tamaño con el que se detiene (óptimo o cota inferior conocidos).
+		- on_incumbent: función que recibe cada nuevo mejor cover (reporte anytime).
+		- telemetry: destino de instantáneas de progreso (ver core.telemetry).
 	"""
 	if params is None:
 		params = {}
@@ -95,12 +99,18 @@ def solve(
 	max_iter = int(params.get("max_iter", 1000))
 	time_limit = params.get("time_limit", None)
 	lambda_penalty = float(params.get("lambda_penalty", 0.3))
+	target = params.get("target")
+	on_incumbent = params.get("on_incumbent")
 
 
-	# 1) Solución inicial voraz
-	cover = _initial_cover(instance, rng)
-	best_cover = set(cover)
+	# 1) Solución inicial voraz (o la construida de antemano por run_benchmark)
+	initial = params.get("initial_cover")
+	cover = set(initial) if initial is not None else _initial_cover(instance, rng)
+	# Sin copias: _guided_local_search devuelve siempre un conjunto nuevo
+	best_cover = cover
 	best_cost = len(best_cover)
+	if on_incumbent is not None:
+		on_incumbent(best_cover)
 
 	# 2) Penalizaciones iniciales (pi=0 para cada arista)
 	edge_list = [e for e in instance.edges() if e[0] != e[1]]
@@ -110,14 +120,21 @@ def solve(
 	# Iniciamos el tiempo
 	start_time = time.time()
 
+	progress = progress_from_params(params, "gls")
+	it = 0
+
 	# 3) Bucle principal de GLS
 	for it in range(max_iter):
-		# Si se alcanza el límite de tiempo, terminamos
+		if progress is not None:
+			progress.tick(it, len(cover), best_cost)
+		# Si se alcanza el límite de tiempo o el tamaño objetivo, terminamos
 		if time_limit is not None and (time.time() - start_time) >= float(time_limit):
 			break
+		if target is not None and best_cost <= target:
+			break
 
 		# Búsqueda local guiada por penalizaciones
-		cover = _guided_local_search(instance, set(cover), edge_keys, penalties, lambda_penalty, rng)
+		cover = _guided_local_search(instance, cover, edge_keys, penalties, lambda_penalty, rng)
 
 		# Actualizamos penalizaciones: identificar aristas descubiertas
 		uncovered = [_edge_key(u, v) for u, v in instance.edges() if u != v and u not in cover and v not in cover]
@@ -129,8 +146,14 @@ def solve(
 
 		# Actualizamos la mejor solución encontrada
 		if len(cover) < best_cost:
-			best_cover = set(cover)
+			best_cover = cover
 			best_cost = len(cover)
+			# Solo se reportan covers factibles
+			if on_incumbent is not None and not uncovered:
+				on_incumbent(best_cover)
+
+	if progress is not None:
+		progress.done(it, len(cover), best_cost)
 
     # Construimos el resultado final
 	sol = Solution.from_cover(best_cover, n)
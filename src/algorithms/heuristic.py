@@ -1,49 +1,111 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional
-import networkx as nx
+from heapq import heapify, heappop, heappush
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 from ..core.api import Result
+from ..core.bitset import BitsetGraph, mask_from_flags
+from ..core.csr import CSRGraph
 from ..core.evaluator import Evaluator
 from ..core.solution import Solution
 
-def _remove_redundant(graph: nx.Graph, cover: set[int]) -> set[int]:
-    """
-    Elimina nodos redundantes de la cobertura
-    Un nodo es redundante si todos sus vecinos estan en la cobertura
-    """
-    # Hacemos una copia para no modificar el cover original mientras iteramos
-    refined_cover = cover.copy()
-    # Para cada nodo en la cobertura
-    for node in list(refined_cover):
-        # Si todos sus vecinos están en la cobertura, lo removemos
-        if all(neighbor in refined_cover for neighbor in graph.neighbors(node)):
-            refined_cover.remove(node)
-    return refined_cover
+if TYPE_CHECKING:
+    import networkx as nx
 
 def _mvc_isolation(graph: nx.Graph) -> set[int]:
     """
     Implementación del algoritmo de aislamiento
     Busca nodos con grado minimo, agrega a sus vecinos a la cobertura, y los elimina del grafo
     Más eficiente y mejores resultados que Max Degree (por lo menos para instancias DIMACS)
+    Acepta un grafo de NetworkX o un CSRGraph; el trabajo se hace sobre arreglos
+    (ver _mvc_isolation_arrays), sin copiar ni modificar el grafo.
+    """
+    csr = CSRGraph.from_graph(graph)
+    mask = _mvc_isolation_arrays(csr.indptr, csr.indices, csr.number_of_nodes())
+    return {v for v, b in enumerate(mask) if b}
+
+class IsolationWorkspace:
     """
-    # Hacemos una copia del grafo para no modificar el original
-    g_copy = graph.copy()
-    cover = set()
-    # Mientras queden aristas en el grafo
-    while g_copy.number_of_edges() > 0:
-        # Encontrar el nodo de grado mínimo
-        min_node, _ = min(  # el _ es porque degree() devuelve tuplas (el nodo y su grado). Y ahora solo nos interesa el nodo
-            (node_degree for node_degree in g_copy.degree() if node_degree[1] > 0),
-            key=lambda x: x[1]
-        )
+    Buffers reutilizables para la heurística de aislamiento sobre arreglos.
+    Solo crecen: resolver muchas instancias pequeñas no vuelve a reservar memoria.
+    """
+
+    __slots__ = ("deg", "removed", "mask")
+
+    def __init__(self) -> None:
+        self.deg: list[int] = []
+        self.removed = bytearray()
+        self.mask = bytearray()
+
+    def reset(self, indptr: Sequence[int], n: int) -> None:
+        if len(self.mask) < n:
+            grow = n - len(self.mask)
+            self.removed.extend(bytes(grow))
+            self.mask.extend(bytes(grow))
+            self.deg.extend([0] * grow)
+        zeros = bytes(n)
+        self.removed[:n] = zeros
+        self.mask[:n] = zeros
+        deg = self.deg
+        for v in range(n):
+            deg[v] = indptr[v + 1] - indptr[v]
+
+
+def _mvc_isolation_arrays(
+    indptr: Sequence[int],
+    indices: Sequence[int],
+    n: int,
+    ws: Optional[IsolationWorkspace] = None,
+    rows: Optional[Sequence[int]] = None,
+) -> bytearray:
+    """
+    Misma heurística de aislamiento que _mvc_isolation, pero sobre arreglos CSR:
+    una cola de prioridad (grado, vértice) con entradas perezosas reemplaza la
+    búsqueda lineal del mínimo y las copias del grafo. El desempate por menor
+    id coincide con el orden de nodos de NetworkX.
+    Sobre una unión disjunta de grafos (CSR concatenado) produce, para cada
+    componente, el mismo cover que al resolverla por separado.
+    Con `rows` (filas de bits de un BitsetGraph) la pasada final de redundantes
+    consulta rows[v] & ~cover sobre una máscara entera que se actualiza en cada
+    vértice quitado, en lugar de recorrer la vecindad.
+    Retorna la máscara del cover (1 byte por vértice).
+    """
+    if ws is None:
+        ws = IsolationWorkspace()
+    ws.reset(indptr, n)
+    deg, removed, mask = ws.deg, ws.removed, ws.mask
+
+    heap = [(deg[v], v) for v in range(n) if deg[v] > 0]
+    heapify(heap)
+    while heap:
+        d, v = heappop(heap)
+        # Entrada obsoleta: el vértice ya salió o su grado cambió
+        if removed[v] or d != deg[v] or d == 0:
+            continue
+        # Agregamos sus vecinos a la cobertura y los "eliminamos" del grafo
+        for i in range(indptr[v], indptr[v + 1]):
+            u = indices[i]
+            if removed[u]:
+                continue
+            mask[u] = 1
+            removed[u] = 1
+            for j in range(indptr[u], indptr[u + 1]):
+                w = indices[j]
+                if not removed[w]:
+                    deg[w] -= 1
+                    if deg[w] > 0:
+                        heappush(heap, (deg[w], w))
 
-        # Agregamos sus vecinos a la cobertura y los eliminamos del grafo
-        neighbors = list(g_copy.neighbors(min_node))
-        cover.update(neighbors)
-        g_copy.remove_nodes_from(neighbors)
-    
-    # Finalmente, removemos nodos redundantes de la cobertura
-    cover = _remove_redundant(graph, cover)
-    return cover
+    # Finalmente, removemos nodos redundantes (todos sus vecinos en la cobertura)
+    if rows is not None:
+        cover = mask_from_flags(mask[:n])
+        for v in range(n):
+            if mask[v] and not rows[v] & ~cover:
+                mask[v] = 0
+                cover ^= 1 << v
+        return mask[:n]
+    for v in range(n):
+        if mask[v] and all(mask[indices[i]] for i in range(indptr[v], indptr[v + 1])):
+            mask[v] = 0
+    return mask[:n]
 
 def solve(
     instance: nx.Graph,
@@ -51,12 +113,13 @@ def solve(
     params: Optional[Dict[str, Any]] = None,
 ) -> Result:
 
-    # Ejecutamos nuestra heuristica para obtener una cobertura
-    raw_cover = _mvc_isolation(instance)
+    # Ejecutamos nuestra heuristica sobre arreglos para obtener la máscara de la cobertura
+    csr = CSRGraph.from_graph(instance)
+    rows = csr.rows if isinstance(csr, BitsetGraph) else None
+    mask = _mvc_isolation_arrays(csr.indptr, csr.indices, csr.number_of_nodes(), rows=rows)
 
     # Convertimos la cobertura obtenida a una solucion
-    n = instance.number_of_nodes()
-    sol = Solution.from_cover(raw_cover, n)
+    sol = Solution.from_mask(mask)
 
     # Evaluamos la solucion
     evaluator = Evaluator(instance)
@@ -4,24 +4,20 @@ import random
 import time
 import networkx as nx
 from ..core.api import Result
+from ..core.csr import CSRGraph
 from ..core.evaluator import Evaluator
 from ..core.solution import Solution
+from ..core.telemetry import progress_from_params
 from .utils import _edge_key, _add_greedy_cover_vertices, _initial_cover
 from .local_search import improve_cover
+from .polish import polish_cover
 
-def _can_remove(instance: nx.Graph, cover: Set[int], v: int) -> bool:
-    """
-    Verifica si al remover v la solución sigue siendo factible.
-    Si algún vecino de v no está en el cover, remover v dejaría una 
-    arista descubierta y haría la solución infactible.
-    """
-    for nbr in instance.neighbors(v):
-        if nbr not in cover:
-            return False
-    return True
-
-
-def _repair_cover(instance: nx.Graph, cover: Set[int], rng: random.Random) -> None:
+def _repair_cover(
+    instance: nx.Graph,
+    cover: Set[int],
+    rng: random.Random,
+    flips: Optional[List[int]] = None,
+) -> None:
     """
     Repara un cover (posiblemente infactible) agregando vértices.
     Para cada arista descubierta, agrega un extremo (mayor grado o aleatorio).
@@ -30,14 +26,21 @@ def _repair_cover(instance: nx.Graph, cover: Set[int], rng: random.Random) -> No
     uncovered = {_edge_key(u, v) for u, v in instance.edges() if u != v and u not in cover and v not in cover}
 
     # Agregamos vértices al cover hasta cubrir todas las aristas
-    _add_greedy_cover_vertices(instance, uncovered, cover, rng)
+    _add_greedy_cover_vertices(instance, uncovered, cover, rng, flips)
 
 
-def _perturb(instance: nx.Graph, cover: Set[int], k: int, rng: random.Random) -> Set[int]:
+def _perturb(
+    instance: nx.Graph,
+    cover: Set[int],
+    k: int,
+    rng: random.Random,
+    flips: Optional[List[int]] = None,
+) -> Set[int]:
     """
     Paso de perturbación para ILS:
     1) Remueve k vértices aleatorios del cover actual (diversificación).
     2) Repara la solución para restaurar factibilidad.
+    Los vértices removidos y agregados se anotan en `flips` si se pasa.
     """
     # Si el cover está vacío, no hay nada que remover
     if not cover:
@@ -53,16 +56,78 @@ def _perturb(instance: nx.Graph, cover: Set[int], k: int, rng: random.Random) ->
     removed = rng.sample(list(new_cover), k)
     for v in removed:
         new_cover.discard(v)
+    if flips is not None:
+        flips.extend(removed)
 
     # 2) Reparamos el cover para asegurar factibilidad
-    _repair_cover(instance, new_cover, rng)
+    _repair_cover(instance, new_cover, rng, flips)
     return new_cover
 
-def hash_cover(cov: Set[int]) -> int:
+def _zobrist_keys(n: int, seed: Optional[int]) -> List[int]:
+    """
+    Genera una clave aleatoria de 64 bits por vértice (hashing de Zobrist).
+    Se usa un generador propio para no alterar la secuencia del rng de ILS.
+    """
+    krng = random.Random(seed)
+    return [krng.getrandbits(64) for _ in range(n)]
+
+
+def hash_cover(cov: Set[int], keys: List[int]) -> int:
+    """
+    Hash de Zobrist de un cover: XOR de las claves de sus vértices.
+    No construye ningún objeto intermedio (a diferencia de frozenset).
+    """
+    h = 0
+    for v in cov:
+        h ^= keys[v]
+    return h
+
+
+def _update_hash(h: int, flips: List[int], keys: List[int]) -> int:
     """
-    Genera un hash inmutable para un cover dado.
+    Actualiza incrementalmente el hash con los vértices invertidos (en orden,
+    como los anotan _perturb, improve_cover y polish_cover): cada inversión
+    aplica un XOR con su clave, así que un vértice que entra y sale se cancela.
+    Sin construir conjuntos y en tiempo proporcional al número de inversiones.
     """
-    return hash(frozenset(cov))
+    for v in flips:
+        h ^= keys[v]
+    return h
+
+
+class _CycleMemory:
+    """
+    Memoria tabú de tamaño fijo para detectar ciclos en O(1):
+    un buffer circular con los últimos hashes y un diccionario de conteos
+    para responder pertenencia sin recorrer el buffer.
+    """
+
+    __slots__ = ("_ring", "_pos", "_size", "_counts")
+
+    def __init__(self, size: int) -> None:
+        self._size = max(0, size)
+        self._ring: List[Optional[int]] = [None] * self._size
+        self._pos = 0
+        self._counts: Dict[int, int] = {}
+
+    def __contains__(self, h: int) -> bool:
+        return h in self._counts
+
+    def push(self, h: int) -> None:
+        if self._size == 0:
+            return
+        # Si la posición está ocupada, expulsamos el hash más antiguo
+        old = self._ring[self._pos]
+        if old is not None:
+            c = self._counts[old] - 1
+            if c:
+                self._counts[old] = c
+            else:
+                del self._counts[old]
+        self._ring[self._pos] = h
+        self._counts[h] = self._counts.get(h, 0) + 1
+        self._pos = (self._pos + 1) % self._size
+
 
 def solve(
     instance: nx.Graph,
@@ -85,6 +150,10 @@ def solve(
         - perturb_min: mínimo de vértices a remover.
         - accept_equal_prob: probabilidad de aceptar soluciones de igual calidad.
         - memoria_tam: tamaño de la memoria de soluciones recientes (default: 10).
+        - target: tamaño con el que se detiene (óptimo o cota inferior conocidos).
+        - on_incumbent: función que recibe cada nuevo mejor cover (reporte anytime).
+        - telemetry: destino de instantáneas de progreso (ver core.telemetry).
+        - polish: pule cada óptimo local (redundantes y (1,2)-swaps, ver polish).
     """
     if params is None:
         params = {}
@@ -96,70 +165,106 @@ def solve(
     perturb_min = int(params.get("perturb_min", 1))
     accept_equal_prob = float(params.get("accept_equal_prob", 0.05))
     memoria_tam = int(params.get("memoria_tam", 10))
+    target = params.get("target")
+    on_incumbent = params.get("on_incumbent")
 
-    # 1) Solución inicial voraz
-    cover = _initial_cover(instance, rng)
+    # 1) Solución inicial voraz (o la construida de antemano por run_benchmark)
+    initial = params.get("initial_cover")
+    cover = set(initial) if initial is not None else _initial_cover(instance, rng)
 
     # 2) Búsqueda local para llegar a un óptimo local
-    local_params = params.get("local_search_params", params)
+    # (la búsqueda local interna no publica telemetría propia salvo que se pida en local_search_params)
+    local_params = params.get("local_search_params")
+    if local_params is None:
+        local_params = {k: v for k, v in params.items() if k != "telemetry"}
     cover = improve_cover(instance, cover, seed=seed, params=local_params)
 
-    # Guardamos la mejor solución encontrada
-    best_cover = set(cover)
+    # Pulido opcional de cada óptimo local sobre un CSR construido una sola vez
+    polish_graph = CSRGraph.from_graph(instance) if params.get("polish") else None
+    polish_stats: Dict[str, int] = {}
+    if polish_graph is not None:
+        cover = polish_cover(polish_graph, cover, polish_stats)
+
+    # Claves de Zobrist y hash del cover actual
+    keys = _zobrist_keys(n, seed)
+    cover_hash = hash_cover(cover, keys)
+
+    # Guardamos la mejor solución encontrada.
+    # No hace falta copiar: los covers nunca se modifican in-place
+    # (_perturb e improve_cover siempre devuelven conjuntos nuevos)
+    best_cover = cover
     best_cost = len(best_cover)
+    if on_incumbent is not None:
+        on_incumbent(best_cover)
 
-    # Memoria para evitar ciclos
-    memoria: List[int] = []
+    # Memoria para evitar ciclos (buffer circular + conjunto de hashes)
+    memoria = _CycleMemory(memoria_tam)
 
     # Agregamos a la memoria la solución inicial
-    memoria.append(hash_cover(cover))
+    memoria.push(cover_hash)
 
     # Iniciar el cronómetro justo antes del bucle principal
     start_time = time.time()
 
+    progress = progress_from_params(params, "ils")
+    it = 0
+
     # 3) Bucle principal de ILS
-    for _ in range(max_iter):
-        # Si se alcanza el límite de tiempo, terminamos
+    for it in range(max_iter):
+        if progress is not None:
+            progress.tick(it, len(cover), best_cost)
+        # Si se alcanza el límite de tiempo o el tamaño objetivo, terminamos
         if time_limit is not None and (time.time() - start_time) >= float(time_limit):
             break
+        if target is not None and best_cost <= target:
+            break
 
         # Aplicamos la perturbación
         k = max(perturb_min, int(max(1, round(perturb_fraction * max(1, len(cover))))))
-        candidato = _perturb(instance, cover, k, rng)
+        flips: List[int] = []
+        candidato = _perturb(instance, cover, k, rng, flips)
 
         # Aplicamos búsqueda local al candidato encontrado
-        candidato = improve_cover(instance, candidato, seed=seed, params=local_params)
+        candidato = improve_cover(instance, candidato, seed=seed, params=local_params, flips=flips)
+        if polish_graph is not None:
+            candidato = polish_cover(polish_graph, candidato, polish_stats, flips)
 
-        # Guardamos costo y hash del candidato
+        # Guardamos costo y hash del candidato (XOR de las inversiones desde cover)
         candidato_cost = len(candidato)
-        candidato_hash = hash_cover(candidato)
+        candidato_hash = _update_hash(cover_hash, flips, keys)
 
         # Evitar ciclos: si la solución ya está en memoria, aplicamos perturbación fuerte
         if candidato_hash in memoria:
             # Perturbación fuerte: remover la mitad del cover
             k_fuerte = max(1, len(candidato) // 2)
-            candidato = _perturb(instance, candidato, k_fuerte, rng)
-            candidato = improve_cover(instance, candidato, seed=seed, params=local_params)
+            flips = []
+            candidato = _perturb(instance, candidato, k_fuerte, rng, flips)
+            candidato = improve_cover(instance, candidato, seed=seed, params=local_params, flips=flips)
+            if polish_graph is not None:
+                candidato = polish_cover(polish_graph, candidato, polish_stats, flips)
             candidato_cost = len(candidato)
-            candidato_hash = hash_cover(candidato)
+            candidato_hash = _update_hash(candidato_hash, flips, keys)
 
         # 4) Criterio de aceptación
         # Si el candidato es mejor, lo aceptamos como la nueva solución
         if candidato_cost < best_cost:
-            best_cover = set(candidato)
+            best_cover = candidato
             best_cost = candidato_cost
+            if on_incumbent is not None:
+                on_incumbent(best_cover)
             cover = candidato
+            cover_hash = candidato_hash
         # Si es igual, lo aceptamos con cierta probabilidad
         else:
             if candidato_cost <= len(cover) or rng.random() < accept_equal_prob:
                 cover = candidato
+                cover_hash = candidato_hash
 
-        # Actualizamos la memoria
-        memoria.append(candidato_hash)
+        # Actualizamos la memoria (el buffer expulsa solo la solución más antigua)
+        memoria.push(candidato_hash)
 
-        # Si la memoria excede su tamaño, removemos la solución más antigua
-        if len(memoria) > memoria_tam:
-            memoria.pop(0)
+    if progress is not None:
+        progress.done(it, len(cover), best_cost)
 
     # Construimos la solución final
     sol = Solution.from_cover(best_cover, n)
@@ -176,5 +281,6 @@ def solve(
             "perturb_min": perturb_min,
             "accept_equal_prob": accept_equal_prob,
             "memoria_tam": memoria_tam,
+            "polish_stats": polish_stats if polish_graph is not None else None,
         },
     )
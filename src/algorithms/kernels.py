@@ -0,0 +1,264 @@
+from __future__ import annotations
+import random
+import time
+import weakref
+from typing import Any, Dict, Optional, Set, Tuple
+
+# Backend compilado (opcional) del ciclo interno de improve_cover.
+# Si numba no está instalado, NUMBA_AVAILABLE es False y los kernels quedan
+# como funciones Python normales (útil solo para verificar paridad).
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba es opcional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+# Pasos del kernel entre dos controles del límite de tiempo (numba no expone un reloj)
+CHUNK_STEPS = 2000
+
+_MASK32 = 0xFFFFFFFF
+
+
+# --- Generador xorshift32 -----------------------------------------------------
+# El estado vive en rng[0]. Todas las operaciones caben en int64, por lo que la
+# secuencia es idéntica compilada con numba o interpretada en Python.
+
+@njit(cache=True)
+def _next32(rng: Any) -> int:
+    x = rng[0]
+    x ^= (x << 13) & _MASK32
+    x ^= x >> 17
+    x ^= (x << 5) & _MASK32
+    rng[0] = x
+    return x
+
+
+@njit(cache=True)
+def _rand_below(rng: Any, n: int) -> int:
+    return (_next32(rng) * n) >> 32
+
+
+def _seed_state(seed: Optional[int]) -> int:
+    if seed is None:
+        seed = random.getrandbits(32)
+    x = (seed * 2654435761 + 0x9E3779B9) & _MASK32
+    return x or 1
+
+
+# --- Kernels ------------------------------------------------------------------
+
+@njit(cache=True)
+def _dscore(v: int, indptr: Any, indices: Any, slot_edge: Any, in_cover: Any, weights: Any) -> int:
+    score = 0
+    sign = -1 if in_cover[v] else 1
+    for k in range(indptr[v], indptr[v + 1]):
+        if not in_cover[indices[k]]:
+            score += sign * weights[slot_edge[k]]
+    return score
+
+
+@njit(cache=True)
+def _best_in_cover(n: int, indptr: Any, indices: Any, slot_edge: Any, in_cover: Any, weights: Any) -> int:
+    # Máximo dscore entre los vértices del cover; desempate por menor id
+    best_v = -1
+    best_s = 0
+    for v in range(n):
+        if in_cover[v]:
+            s = _dscore(v, indptr, indices, slot_edge, in_cover, weights)
+            if best_v < 0 or s > best_s:
+                best_v = v
+                best_s = s
+    return best_v
+
+
+@njit(cache=True)
+def _uncover_around(v: int, indptr: Any, indices: Any, slot_edge: Any, in_cover: Any,
+                    unc: Any, nunc: int, is_unc: Any) -> int:
+    # Agrega al final de la lista las aristas de v que quedaron descubiertas
+    for k in range(indptr[v], indptr[v + 1]):
+        e = slot_edge[k]
+        if not in_cover[indices[k]] and not is_unc[e]:
+            is_unc[e] = 1
+            unc[nunc] = e
+            nunc += 1
+    return nunc
+
+
+@njit(cache=True)
+def local_search_kernel(
+    indptr: Any, indices: Any, slot_edge: Any, eu: Any, ev: Any,
+    in_cover: Any, best: Any, weights: Any, unc: Any, is_unc: Any,
+    state: Any, rng: Any, n_steps: int, max_iter: int, rho: float,
+) -> None:
+    """
+    Ejecuta hasta n_steps pasos del ciclo de improve_cover sobre arreglos CSR.
+    state = [paso, tamaño del cover, tamaño del mejor, aristas no cubiertas].
+    Modifica todos los arreglos in-place para poder reanudarse por bloques.
+    """
+    n = len(indptr) - 1
+    step, size, best_size, nunc = state[0], state[1], state[2], state[3]
+    end = min(max_iter, step + n_steps)
+    while step < end:
+        if nunc == 0:
+            if size < best_size:
+                best[:] = in_cover
+                best_size = size
+            if size > 0:
+                v_rem = _best_in_cover(n, indptr, indices, slot_edge, in_cover, weights)
+                in_cover[v_rem] = 0
+                size -= 1
+                nunc = _uncover_around(v_rem, indptr, indices, slot_edge, in_cover, unc, 0, is_unc)
+            step += 1
+            continue
+
+        # Intercambio en dos etapas: agregar un extremo de una arista no cubierta
+        e = unc[_rand_below(rng, nunc)]
+        a, b = eu[e], ev[e]
+        da = _dscore(a, indptr, indices, slot_edge, in_cover, weights)
+        db = _dscore(b, indptr, indices, slot_edge, in_cover, weights)
+        v_add = a if da >= db else b
+        in_cover[v_add] = 1
+        size += 1
+        # Compactar conservando el orden, sin las aristas que toca v_add
+        j = 0
+        for i in range(nunc):
+            f = unc[i]
+            if eu[f] == v_add or ev[f] == v_add:
+                is_unc[f] = 0
+            else:
+                unc[j] = f
+                j += 1
+        nunc = j
+
+        # ... y quitar el vértice de mayor dscore del cover
+        v_rem = _best_in_cover(n, indptr, indices, slot_edge, in_cover, weights)
+        in_cover[v_rem] = 0
+        size -= 1
+        nunc = _uncover_around(v_rem, indptr, indices, slot_edge, in_cover, unc, nunc, is_unc)
+
+        # Penalización de las aristas no cubiertas
+        for i in range(nunc):
+            weights[unc[i]] += 1
+
+        # Olvido periódico
+        if step % 500 == 0:
+            for i in range(len(weights)):
+                w = int(weights[i] * rho)
+                weights[i] = w if w > 1 else 1
+        step += 1
+
+    state[0], state[1], state[2], state[3] = step, size, best_size, nunc
+
+
+# --- Preparación de arreglos --------------------------------------------------
+
+# Último grafo preparado (ILS llama a improve_cover muchas veces sobre el mismo grafo):
+# referencia débil al grafo, su firma (n, m) y los arreglos. La referencia débil no
+# lo mantiene vivo y la firma detecta la mayoría de las modificaciones posteriores.
+_PREPARED: Optional[Tuple[Any, Tuple[int, int], Tuple[Any, ...]]] = None
+
+
+def _prepare(instance: Any) -> Tuple[Any, ...]:
+    """Arreglos numpy (indptr, indices, slot_edge, eu, ev) con aristas en el orden de edges()."""
+    global _PREPARED
+    signature = (instance.number_of_nodes(), instance.number_of_edges())
+    if _PREPARED is not None and _PREPARED[0]() is instance and _PREPARED[1] == signature:
+        return _PREPARED[2]
+    import numpy as np
+    from ..core.csr import CSRGraph
+
+    csr = CSRGraph.from_graph(instance)
+    n = csr.number_of_nodes()
+    indptr = np.asarray(csr.indptr, dtype=np.int64)
+    indices = np.asarray(csr.indices, dtype=np.int64)
+    slot_edge = np.empty(len(indices), dtype=np.int64)
+    eu, ev = [], []
+    edge_id: Dict[Tuple[int, int], int] = {}
+    for u in range(n):
+        for k in range(csr.indptr[u], csr.indptr[u + 1]):
+            w = csr.indices[k]
+            key = (u, w) if u <= w else (w, u)
+            e = edge_id.get(key)
+            if e is None:
+                e = edge_id[key] = len(eu)
+                eu.append(key[0])
+                ev.append(key[1])
+            slot_edge[k] = e
+    arrays = (indptr, indices, slot_edge, np.asarray(eu, dtype=np.int64), np.asarray(ev, dtype=np.int64))
+    try:
+        _PREPARED = (weakref.ref(instance), signature, arrays)
+    except TypeError:       # Tipo sin referencias débiles: no se cachea
+        _PREPARED = None
+    return arrays
+
+
+def improve_cover_compiled(
+    instance: Any,
+    cover: Set[int],
+    seed: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+    kernel: Any = None,
+) -> Set[int]:
+    """
+    Equivalente de improve_cover sobre arreglos CSR, ejecutado por bloques de
+    CHUNK_STEPS pasos para controlar time_limit entre bloques.
+    Usa su propio generador (xorshift32), por lo que para una misma semilla el
+    resultado es reproducible pero distinto al del backend Python.
+    `kernel` permite pasar la versión sin compilar (local_search_kernel.py_func).
+    Solo implementa la selección "max" (otra da ValueError); params["target"]
+    y params["telemetry"] se atienden entre bloques.
+    """
+    import numpy as np
+    from ..core.telemetry import progress_from_params
+
+    params = params or {}
+    selection = params.get("selection", "max")
+    if selection != "max":
+        raise ValueError(f"El backend numba solo implementa selection='max' (se pidió {selection!r})")
+    target = params.get("target")
+    target = -1 if target is None else int(target)
+    progress = progress_from_params(params, "local_search")
+    max_iter = int(params.get("max_iter", params.get("max_steps", 20000)))
+    time_limit = params.get("time_limit", 5.0)
+    rho = float(params.get("rho", 0.5))
+    chunk = int(params.get("chunk_steps", CHUNK_STEPS))
+    kernel = kernel or local_search_kernel
+
+    indptr, indices, slot_edge, eu, ev = _prepare(instance)
+    n, m = len(indptr) - 1, len(eu)
+    in_cover = np.zeros(n, dtype=np.uint8)
+    for v in cover:
+        in_cover[v] = 1
+    best = in_cover.copy()
+    weights = np.ones(m, dtype=np.int64)
+    size = len(cover)
+    best_size = size
+
+    # Igual que improve_cover: se intenta achicar quitando el vértice de mayor dscore
+    if size:
+        v_rem = _best_in_cover(n, indptr, indices, slot_edge, in_cover, weights)
+        in_cover[v_rem] = 0
+        size -= 1
+    is_unc = ((in_cover[eu] == 0) & (in_cover[ev] == 0)).astype(np.uint8)
+    unc = np.zeros(max(1, m), dtype=np.int64)
+    pending = np.flatnonzero(is_unc)
+    unc[:len(pending)] = pending
+
+    state = np.array([0, size, best_size, len(pending)], dtype=np.int64)
+    rng = np.array([_seed_state(seed)], dtype=np.int64)
+    start_time = time.perf_counter()
+    while state[0] < max_iter and state[2] > target:
+        if time_limit is not None and (time.perf_counter() - start_time) >= float(time_limit):
+            break
+        if progress is not None:
+            progress.tick(int(state[0]), int(state[1]), int(state[2]))
+        kernel(indptr, indices, slot_edge, eu, ev, in_cover, best, weights,
+               unc, is_unc, state, rng, chunk, max_iter, rho)
+    if progress is not None:
+        progress.done(int(state[0]), int(state[1]), int(state[2]))
+    return {int(v) for v in np.flatnonzero(best)}
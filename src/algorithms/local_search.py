@@ -1,13 +1,113 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
 import random
 import time
-import networkx as nx
+from bisect import bisect_right
+from heapq import heapify, heappop, heappush
 from ..core.api import Result
 from ..core.evaluator import Evaluator
 from ..core.solution import Solution
+from ..core.telemetry import Progress, progress_from_params
 from .utils import _edge_key
 
+if TYPE_CHECKING:
+    import networkx as nx
+
+
+class _LazyWeights(dict):
+    """
+    Pesos de aristas para improve_cover con actualización perezosa.
+
+    En lugar de sumar 1 a cada arista no cubierta en cada paso y de reescribir
+    todos los pesos al olvidar, se cuentan los pasos (tick) y se anotan los ticks
+    en que hubo olvido. Cada arista guarda su peso y el tick en que se actualizó
+    por última vez (su "época"); al leerla se reproducen los incrementos (si
+    está sin cubrir) y los olvidos max(1, int(w * rho)) posteriores a esa época.
+    El resultado es idéntico a la versión inmediata, siempre que se llame a
+    settle(v) antes de cambiar el estado de v en el cover (eso cambia qué
+    aristas se incrementan).
+
+    step() es O(1) y forget() no recorre las aristas: una lectura cuesta O(1)
+    más los olvidos pendientes de esa arista (su época). El propio diccionario
+    es una caché de las aristas cubiertas, cuyo peso solo cambia con el olvido.
+    Las de peso 1 (el caso más común) no cambian nunca y quedan en la caché
+    hasta que settle() las saca porque pueden descubrirse; el olvido solo
+    invalida las de peso > 1 que se leyeron desde el olvido anterior.
+    """
+
+    __slots__ = ("_w", "_t", "_cover", "_rho", "_tick", "_forgets", "_heavy")
+
+    def __init__(self, edges: Iterable[Tuple[int, int]], cover: Set[int], rho: float) -> None:
+        super().__init__()
+        self._w: Dict[Tuple[int, int], int] = {e: 1 for e in edges}
+        self._t: Dict[Tuple[int, int], int] = dict.fromkeys(self._w, 0)
+        self._cover = cover     # Referencia al cover actual (se modifica in-place)
+        self._rho = rho
+        self._tick = 0          # Pasos de incremento realizados
+        self._forgets: List[int] = []  # Ticks en que se aplicó el olvido
+        self._heavy: List[Tuple[int, int]] = []  # Aristas en caché con peso > 1
+
+    def _current(self, edge: Tuple[int, int], uncovered: bool) -> int:
+        # Reproduce incrementos y olvidos pendientes desde la última actualización
+        w = self._w[edge]
+        t = self._t[edge]
+        tick = self._tick
+        if t != tick:
+            if uncovered or w > 1:
+                forgets = self._forgets
+                rho = self._rho
+                prev = t
+                for i in range(bisect_right(forgets, t), len(forgets)):
+                    f = forgets[i]
+                    if uncovered:
+                        w += f - prev
+                    elif w == 1:
+                        break
+                    w = max(1, int(w * rho))
+                    prev = f
+                if uncovered:
+                    w += tick - prev
+                self._w[edge] = w
+            self._t[edge] = tick
+        return w
+
+    def __missing__(self, edge: Tuple[int, int]) -> int:
+        cover = self._cover
+        uncovered = edge[0] not in cover and edge[1] not in cover
+        w = self._current(edge, uncovered)
+        if not uncovered:
+            self[edge] = w
+            if w > 1:
+                self._heavy.append(edge)    # El próximo olvido la cambia
+        return w
+
+    def settle(self, v: int, graph: nx.Graph) -> None:
+        """
+        Actualiza las aristas de v antes de agregarlo o quitarlo del cover.
+        Solo cambian de estado las que van a vecinos fuera del cover.
+        """
+        cover = self._cover
+        uncovered = v not in cover
+        for n in graph.neighbors(v):
+            if n not in cover:
+                edge = _edge_key(v, n)
+                self._current(edge, uncovered)
+                self.pop(edge, None)
+
+    def step(self) -> None:
+        """Suma 1 al peso de todas las aristas no cubiertas, O(1)."""
+        self._tick += 1
+
+    def forget(self) -> None:
+        """
+        Olvido w = max(1, int(w * rho)) para todas las aristas: cada una lo
+        aplica al leerse. Solo salen de la caché las de peso > 1.
+        """
+        self._forgets.append(self._tick)
+        for edge in self._heavy:
+            self.pop(edge, None)
+        self._heavy.clear()
+
 
 def _get_dscore(
     v: int,
@@ -22,7 +122,7 @@ def _get_dscore(
     score = 0
     for neighbor in graph.neighbors(v):
         edge = _edge_key(v, neighbor)
-        weight = edge_weights.get(edge, 1)
+        weight = edge_weights[edge]
         if v in cover:
             if neighbor not in cover:
                 score -= weight
@@ -33,38 +133,111 @@ def _get_dscore(
 
 
 def _greedy_initial_cover(graph: nx.Graph) -> Set[int]:
-    """Construcción inicial ávida usando mayor grado."""
+    """
+    Construcción inicial ávida usando mayor grado.
+    Se mantiene el grado residual de cada vértice en un arreglo y una cola de
+    prioridad perezosa (-grado, vértice), en lugar de copiar el grafo y buscar
+    el máximo en cada paso. El desempate por menor id coincide con el orden de nodos.
+    """
+    n = graph.number_of_nodes()
+    deg = [graph.degree(v) for v in range(n)]
+    removed = bytearray(n)
     current_cover: Set[int] = set()
-    temp_graph = graph.copy()
-    while temp_graph.number_of_edges() > 0:
-        v = max(temp_graph.nodes(), key=lambda n: nx.degree(temp_graph, n))
+    heap = [(-d, v) for v, d in enumerate(deg) if d > 0]
+    heapify(heap)
+    while heap:
+        d, v = heappop(heap)
+        if removed[v] or -d != deg[v]:
+            continue
         current_cover.add(v)
-        temp_graph.remove_node(v)
+        removed[v] = 1
+        for u in graph.neighbors(v):
+            if not removed[u]:
+                deg[u] -= 1
+                if deg[u] > 0:
+                    heappush(heap, (-deg[u], u))
     return current_cover
 
 
+def _finish_flips(
+    flips: Optional[List[int]],
+    logged: bool,
+    start_mark: int,
+    best_mark: int,
+    cover: Iterable[int],
+    best_cover: Set[int],
+) -> None:
+    """
+    Deja en `flips` (desde start_mark) los vértices invertidos entre `cover` y
+    `best_cover`. Lo normal es descartar lo registrado después del mejor cover;
+    si el registro se abandonó por largo (más inversiones pendientes que
+    vértices) se usa la diferencia simétrica, que entonces cuesta menos.
+    """
+    if flips is None:
+        return
+    if logged:
+        del flips[best_mark:]
+    else:
+        del flips[start_mark:]
+        flips.extend(best_cover.symmetric_difference(cover))
+
+
 def improve_cover(
     instance: nx.Graph,
     cover: Set[int],
     seed: Optional[int] = None,
     params: Optional[Dict[str, Any]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    flips: Optional[List[int]] = None,
 ) -> Set[int]:
     """
     Aplica la búsqueda local sobre un cover inicial y devuelve el mejor cover hallado.
+    Con params["backend"] == "numba" (y numba instalado) el ciclo corre compilado.
+    Con params["selection"] == "cc" se usa configuration checking y con
+    "bms" la selección por muestreo de params["bms_t"] vértices (ver
+    _improve_cover_cc); `stats`, si se pasa, recibe contadores de esos modos.
+    Con params["target"] (p. ej. el óptimo o la cota del catálogo) la búsqueda
+    termina apenas el mejor cover alcanza ese tamaño. Con params["telemetry"]
+    publica instantáneas del progreso (ver core.telemetry).
+    Si se pasa `flips`, se le agregan en orden los vértices invertidos para ir
+    del cover inicial al devuelto (ILS actualiza su hash de Zobrist con ellos).
     """
     params = params or {}
+    target = params.get("target")
+    target = -1 if target is None else int(target)
+    if len(cover) <= target:
+        return set(cover)
+    if params.get("backend") == "numba":
+        from .kernels import NUMBA_AVAILABLE, improve_cover_compiled
+        if NUMBA_AVAILABLE:
+            best = improve_cover_compiled(instance, cover, seed=seed, params=params)
+            if flips is not None:
+                # El kernel no registra sus movimientos: se toma la diferencia
+                flips.extend(best.symmetric_difference(cover))
+            return best
     max_iter = int(params.get("max_iter", params.get("max_steps", 20000)))
     time_limit = params.get("time_limit", 5.0)
     rho = float(params.get("rho", 0.5))
     rng = random.Random(seed)
-
-    # Inicialización de pesos de aristas a 1
-    edge_weights: Dict[Tuple[int, int], int] = {
-        _edge_key(u, v): 1 for u, v in instance.edges()
-    }
+    selection = params.get("selection", "max")
+    bms_t = int(params.get("bms_t", 50)) if selection == "bms" else 0
+    progress = progress_from_params(params, "local_search")
+    if selection in ("cc", "bms"):
+        return _improve_cover_cc(
+            instance, cover, rng, max_iter, time_limit, rho, stats, bms_t, target, progress, flips
+        )
 
     current_cover = set(cover)
     best_cover = set(current_cover)
+    # Registro de inversiones (solo si se pidió); ver _finish_flips
+    log = flips
+    start_mark = best_mark = len(flips) if flips is not None else 0
+    log_limit = instance.number_of_nodes()
+
+    # Pesos de aristas (inicialmente 1) con incrementos y olvido perezosos
+    edge_weights = _LazyWeights(
+        (_edge_key(u, v) for u, v in instance.edges()), current_cover, rho
+    )
 
     # Intentamos mejorar reduciendo el tamaño objetivo
     if current_cover:
@@ -72,7 +245,10 @@ def improve_cover(
             current_cover,
             key=lambda x: _get_dscore(x, current_cover, instance, edge_weights),
         )
+        edge_weights.settle(v_remove, instance)
         current_cover.remove(v_remove)
+        if log is not None:
+            log.append(v_remove)
 
     # Lista dinámica de aristas no cubiertas para eficiencia
     uncovered_edges = [
@@ -83,12 +259,20 @@ def improve_cover(
 
     # --- Ciclo de Búsqueda Local ---
     start_time = time.perf_counter()
+    steps = 0
     for step in range(max_iter):
         if time_limit is not None and (time.perf_counter() - start_time) >= float(time_limit):
             break
+        steps += 1
+        if progress is not None and not step & 255:
+            progress.tick(step, len(current_cover), len(best_cover))
         if not uncovered_edges:
             if len(current_cover) < len(best_cover):
                 best_cover = set(current_cover)
+                if log is not None:
+                    best_mark = len(log)
+                if len(best_cover) <= target:
+                    break
 
             if not current_cover:
                 continue
@@ -97,7 +281,10 @@ def improve_cover(
                 current_cover,
                 key=lambda x: _get_dscore(x, current_cover, instance, edge_weights),
             )
+            edge_weights.settle(v_rem, instance)
             current_cover.remove(v_rem)
+            if log is not None:
+                log.append(v_rem)
             uncovered_edges = [
                 _edge_key(v_rem, n)
                 for n in instance.neighbors(v_rem)
@@ -111,7 +298,10 @@ def improve_cover(
             target_edge,
             key=lambda x: _get_dscore(x, current_cover, instance, edge_weights),
         )
+        edge_weights.settle(v_add, instance)
         current_cover.add(v_add)
+        if log is not None:
+            log.append(v_add)
 
         # Actualizar aristas no cubiertas tras adición
         uncovered_edges = [e for e in uncovered_edges if v_add not in e]
@@ -123,7 +313,10 @@ def improve_cover(
             current_cover,
             key=lambda x: _get_dscore(x, current_cover, instance, edge_weights),
         )
+        edge_weights.settle(v_rem, instance)
         current_cover.remove(v_rem)
+        if log is not None:
+            log.append(v_rem)
 
         # Añadir nuevas aristas descubiertas por la eliminación
         for n in instance.neighbors(v_rem):
@@ -132,16 +325,203 @@ def improve_cover(
                 if edge not in uncovered_edges:
                     uncovered_edges.append(edge)
 
-        # Actualización de pesos (Penalización de aristas no cubiertas)
-        for u, v in uncovered_edges:
-            edge = _edge_key(u, v)
-            edge_weights[edge] += 1
+        # Actualización de pesos (Penalización de aristas no cubiertas), O(1)
+        edge_weights.step()
+
+        # Olvido periódico: cada arista lo aplica al leerse
+        if step % 500 == 0:
+            edge_weights.forget()
+            if log is not None and len(log) - best_mark > log_limit:
+                log = None
+
+    if progress is not None:
+        progress.done(steps, len(current_cover), len(best_cover))
+    if stats is not None:
+        stats["steps"] = steps
+    _finish_flips(flips, log is not None, start_mark, best_mark, cover, best_cover)
+    return best_cover
+
+
+def _improve_cover_cc(
+    instance: nx.Graph,
+    cover: Set[int],
+    rng: random.Random,
+    max_iter: int,
+    time_limit: Optional[float],
+    rho: float,
+    stats: Optional[Dict[str, Any]] = None,
+    bms_t: int = 0,
+    target: int = -1,
+    progress: Optional[Progress] = None,
+    flips: Optional[List[int]] = None,
+) -> Set[int]:
+    """
+    Variante de improve_cover con configuration checking y desempate por edad
+    (estilo NuMVC), con el mismo esquema de pesos y olvido.
+
+    - Un vértice solo puede entrar al cover si cambió la configuración de sus
+      vecinos desde que salió (conf_change[v] == 1).
+    - El vértice que sale es el de mayor dscore del cover, desempatando por el
+      que lleva más tiempo sin cambiar (menor age), sin deshacer el que acaba de entrar.
+    - El cover se guarda como arreglo indexado (swap-remove en O(1)) y el dscore
+      de sus vértices se cachea: solo cambia cuando un vecino entra o sale
+      (invalidación explícita) o cuando hay olvido (época).
+
+    Con bms_t > 0 (estilo FastVC, para grafos enormes) no se recorre todo el
+    cover para elegir el que sale: se toman bms_t vértices al azar del arreglo
+    indexado y se elige el mejor de ellos; además no se usa conf_change al
+    agregar. La memoria sigue siendo O(1) enteros por vértice.
+    """
+    n = instance.number_of_nodes()
+    current_cover = set(cover)
+    members = list(current_cover)            # Cover indexado
+    pos = [-1] * n
+    for i, v in enumerate(members):
+        pos[v] = i
+    best_cover = set(current_cover)
+    log = flips                              # Registro de inversiones (ver improve_cover)
+    start_mark = best_mark = len(flips) if flips is not None else 0
+
+    conf_change = bytearray(b"\x01") * n   # Con BMS queda siempre en 1
+    age = [0] * n
+    cached = [0] * n
+    stamp = [-1] * n                         # Época del valor cacheado (-1: inválido)
+    epoch = 0
+    evaluations = 0
+    hits = 0
+
+    edge_weights = _LazyWeights(
+        (_edge_key(u, v) for u, v in instance.edges()), current_cover, rho
+    )
+
+    # Aristas no cubiertas como lista indexada (elección al azar y bajas en O(1))
+    uncovered: List[Tuple[int, int]] = []
+    upos: Dict[Tuple[int, int], int] = {}
+
+    def _uncover(edge: Tuple[int, int]) -> None:
+        upos[edge] = len(uncovered)
+        uncovered.append(edge)
+
+    def _discard(edge: Tuple[int, int]) -> None:
+        i = upos.pop(edge)
+        last = uncovered.pop()
+        if i < len(uncovered):
+            uncovered[i] = last
+            upos[last] = i
+
+    def _flip(v: int, step: int) -> None:
+        # Invierte v en el cover y actualiza aristas, cachés y conf_change
+        edge_weights.settle(v, instance)
+        if v in current_cover:
+            current_cover.remove(v)
+            i = pos[v]
+            last = members.pop()
+            if i < len(members):
+                members[i] = last
+                pos[last] = i
+            pos[v] = -1
+            conf_change[v] = 0 if not bms_t else 1
+            for nb in instance.neighbors(v):
+                stamp[nb] = -1
+                conf_change[nb] = 1
+                if nb not in current_cover:
+                    _uncover(_edge_key(v, nb))
+        else:
+            current_cover.add(v)
+            pos[v] = len(members)
+            members.append(v)
+            for nb in instance.neighbors(v):
+                stamp[nb] = -1
+                conf_change[nb] = 1
+                if nb not in current_cover:
+                    _discard(_edge_key(v, nb))
+        stamp[v] = -1
+        age[v] = step
+        if log is not None:
+            log.append(v)
+
+    def _cover_score(v: int) -> int:
+        nonlocal evaluations, hits
+        evaluations += 1
+        if stamp[v] == epoch:
+            hits += 1
+            return cached[v]
+        score = _get_dscore(v, current_cover, instance, edge_weights)
+        cached[v] = score
+        stamp[v] = epoch
+        return score
+
+    def _select_removal(tabu: int) -> int:
+        best_v, best_key = -1, None
+        if bms_t and len(members) > bms_t:
+            candidates = [members[rng.randrange(len(members))] for _ in range(bms_t)]
+        else:
+            candidates = members
+        for v in candidates:
+            if v == tabu:
+                continue
+            key = (_cover_score(v), -age[v])
+            if best_key is None or key > best_key:
+                best_v, best_key = v, key
+        return best_v
+
+    for u, v in instance.edges():
+        if u not in current_cover and v not in current_cover:
+            _uncover(_edge_key(u, v))
+
+    # Intentamos mejorar reduciendo el tamaño objetivo
+    if members:
+        _flip(_select_removal(-1), 0)
+
+    start_time = time.perf_counter()
+    steps = 0
+    for step in range(max_iter):
+        if time_limit is not None and (time.perf_counter() - start_time) >= float(time_limit):
+            break
+        steps += 1
+        if progress is not None and not step & 255:
+            progress.tick(step, len(current_cover), len(best_cover))
+        if not uncovered:
+            if len(current_cover) < len(best_cover):
+                best_cover = set(current_cover)
+                if log is not None:
+                    best_mark = len(log)
+                if len(best_cover) <= target:
+                    break
+            if members:
+                _flip(_select_removal(-1), step)
+            continue
+
+        # Entra un extremo de una arista no cubierta con conf_change activo
+        a, b = rng.choice(uncovered)
+        if conf_change[a] and conf_change[b]:
+            evaluations += 2
+            da = _get_dscore(a, current_cover, instance, edge_weights)
+            db = _get_dscore(b, current_cover, instance, edge_weights)
+            v_add = a if (da, -age[a]) >= (db, -age[b]) else b
+        else:
+            v_add = b if conf_change[b] else a
+        _flip(v_add, step)
+
+        # Sale el de mayor dscore del cover (sin deshacer el que acaba de entrar)
+        v_rem = _select_removal(v_add)
+        if v_rem >= 0:
+            _flip(v_rem, step)
 
-        # Olvido periódico
+        edge_weights.step()
         if step % 500 == 0:
-            for e in edge_weights:
-                edge_weights[e] = max(1, int(edge_weights[e] * rho))
+            edge_weights.forget()
+            epoch += 1
+            if log is not None and len(log) - best_mark > n:
+                log = None
 
+    if progress is not None:
+        progress.done(steps, len(current_cover), len(best_cover))
+    if stats is not None:
+        stats["dscore_evaluations"] = evaluations
+        stats["dscore_saved"] = hits / evaluations if evaluations else 0.0
+        stats["steps"] = steps
+    _finish_flips(flips, log is not None, start_mark, best_mark, cover, best_cover)
     return best_cover
 
 
@@ -154,13 +534,19 @@ def solve(
     max_iter = int(params.get("max_iter", params.get("max_steps", 20000)))
     time_limit = params.get("time_limit", 5.0)
     rho = float(params.get("rho", 0.5))
+    backend = params.get("backend", "python")
+    if backend == "numba":
+        from .kernels import NUMBA_AVAILABLE
+        backend = "numba" if NUMBA_AVAILABLE else "python"
 
-    # --- FASE 1: Construcción Inicial Ávida ---
-    current_cover = _greedy_initial_cover(instance)
+    # --- FASE 1: Construcción Inicial Ávida (o la construida de antemano por run_benchmark) ---
+    initial = params.get("initial_cover")
+    current_cover = set(initial) if initial is not None else _greedy_initial_cover(instance)
     initial_size = len(current_cover)
 
     # --- FASE 2: Búsqueda Local ---
-    best_cover = improve_cover(instance, current_cover, seed=seed, params=params)
+    stats: Dict[str, Any] = {}
+    best_cover = improve_cover(instance, current_cover, seed=seed, params=params, stats=stats)
 
     n = instance.number_of_nodes()
     sol = Solution.from_cover(best_cover, n)
@@ -177,6 +563,9 @@ def solve(
             "max_iter": max_iter,
             "time_limit": time_limit,
             "rho": rho,
+            "backend": backend,
+            "selection": params.get("selection", "max"),
+            **stats,
             "seed": seed,
         },
     )
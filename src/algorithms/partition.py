@@ -0,0 +1,273 @@
+from __future__ import annotations
+import math
+import multiprocessing as mp
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from ..core.api import Result
+from ..core.csr import CSRGraph
+from ..core.evaluator import Evaluator
+from ..core.solution import Solution
+from .local_search import improve_cover
+
+# Divide y vencerás para grafos que no caben en el presupuesto de un solo núcleo:
+# 1) partición balanceada con pocas aristas de corte (BFS + propagación de etiquetas),
+# 2) cada parte (subgrafo inducido) se resuelve en un proceso con local_search o ils,
+# 3) las aristas de corte se reparan y la frontera se mejora con búsqueda local.
+
+
+def partition(
+    csr: CSRGraph,
+    k: int,
+    rng: random.Random,
+    rounds: int = 5,
+    eps: float = 0.03,
+) -> List[int]:
+    """
+    Etiqueta cada vértice con una parte en [0, k).
+
+    La partición inicial corta en k bloques contiguos un orden BFS (desde
+    raíces al azar), de modo que cada parte ya es bastante conexa. Luego cada
+    ronda de propagación de etiquetas mueve cada vértice (en orden aleatorio)
+    a la parte más frecuente entre sus vecinos si eso reduce el corte y la
+    parte destino no supera (1 + eps) n / k vértices.
+    """
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    if k <= 1 or n == 0:
+        return [0] * n
+    roots = list(range(n))
+    rng.shuffle(roots)
+    seen = bytearray(n)
+    order: List[int] = []
+    for r in roots:
+        if seen[r]:
+            continue
+        seen[r] = 1
+        head = len(order)
+        order.append(r)
+        while head < len(order):
+            u = order[head]
+            head += 1
+            for i in range(indptr[u], indptr[u + 1]):
+                w = indices[i]
+                if not seen[w]:
+                    seen[w] = 1
+                    order.append(w)
+    label = [0] * n
+    for i, v in enumerate(order):
+        label[v] = i * k // n
+    sizes = [0] * k
+    for p in label:
+        sizes[p] += 1
+
+    cap = math.ceil((1.0 + eps) * n / k)
+    perm = list(range(n))
+    for _ in range(rounds):
+        rng.shuffle(perm)
+        moved = 0
+        for v in perm:
+            counts: Dict[int, int] = {}
+            for i in range(indptr[v], indptr[v + 1]):
+                p = label[indices[i]]
+                counts[p] = counts.get(p, 0) + 1
+            own = label[v]
+            best, best_count = own, counts.get(own, 0)
+            for p, c in counts.items():
+                if c > best_count and sizes[p] < cap:
+                    best, best_count = p, c
+            if best != own:
+                label[v] = best
+                sizes[own] -= 1
+                sizes[best] += 1
+                moved += 1
+        if moved <= n // 1000:
+            break
+    return label
+
+
+def _split(csr: CSRGraph, label: List[int], k: int) -> Tuple[List[List[int]], List[CSRGraph], int]:
+    """Subgrafos inducidos por cada parte (ids locales), sus vértices globales y el número de aristas de corte."""
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    members: List[List[int]] = [[] for _ in range(k)]
+    local = [0] * n
+    for v in range(n):
+        part = members[label[v]]
+        local[v] = len(part)
+        part.append(v)
+    cut = 0
+    subgraphs = []
+    for p, verts in enumerate(members):
+        adj = []
+        for v in verts:
+            nbrs = []
+            for i in range(indptr[v], indptr[v + 1]):
+                w = indices[i]
+                if label[w] == p:
+                    nbrs.append(local[w])
+                elif w > v:
+                    cut += 1
+            adj.append(nbrs)
+        subgraphs.append(CSRGraph.from_adjacency(adj))
+    return members, subgraphs, cut
+
+
+def _solve_part(algo: str, graph: CSRGraph, seed: Optional[int], params: Dict[str, Any]) -> bytes:
+    """Tarea de cada proceso: resuelve una parte y devuelve su máscara de cover."""
+    from . import get_algorithm
+    return bytes(get_algorithm(algo)(graph, seed=seed, params=params).solution.in_cover)
+
+
+def _repair_boundary(
+    csr: CSRGraph,
+    in_cover: bytearray,
+    label: List[int],
+    seed: Optional[int],
+    params: Dict[str, Any],
+) -> int:
+    """
+    Cubre las aristas de corte y mejora la frontera en su lugar; retorna el
+    tamaño de la frontera.
+
+    Cada arista de corte descubierta recibe el extremo con más aristas de corte
+    descubiertas. Después se toma la región R = frontera + vecinos: los vértices
+    de R con un vecino fuera de R que no está en el cover quedan fijos, y sobre
+    el subgrafo inducido por el resto de R se corre improve_cover partiendo del
+    cover actual (cualquier cover de ese subgrafo mantiene la factibilidad).
+    """
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    boundary = [
+        v for v in range(n)
+        if any(label[indices[i]] != label[v] for i in range(indptr[v], indptr[v + 1]))
+    ]
+    pending = [0] * n
+    for v in boundary:
+        if not in_cover[v]:
+            for i in range(indptr[v], indptr[v + 1]):
+                w = indices[i]
+                if label[w] != label[v] and not in_cover[w]:
+                    pending[v] += 1
+    for v in boundary:
+        if in_cover[v]:
+            continue
+        for i in range(indptr[v], indptr[v + 1]):
+            w = indices[i]
+            if label[w] != label[v] and not in_cover[w] and not in_cover[v]:
+                in_cover[v if pending[v] >= pending[w] else w] = 1
+
+    in_region = bytearray(n)
+    for v in boundary:
+        in_region[v] = 1
+        for i in range(indptr[v], indptr[v + 1]):
+            in_region[indices[i]] = 1
+    free = [
+        v for v in range(n)
+        if in_region[v] and not (in_cover[v] and any(
+            not in_region[w] and not in_cover[w]
+            for w in indices[indptr[v]:indptr[v + 1]]
+        ))
+    ]
+    local = {v: i for i, v in enumerate(free)}
+    sub = CSRGraph.from_adjacency([
+        [local[w] for w in indices[indptr[v]:indptr[v + 1]] if w in local] for v in free
+    ])
+    start = {local[v] for v in free if in_cover[v]}
+    best = improve_cover(sub, start, seed=seed, params=params)
+    for v in free:
+        in_cover[v] = 0
+    for i in best:
+        in_cover[free[i]] = 1
+    # Vértices de la región que quedaron redundantes (todos sus vecinos en el cover)
+    for v in range(n):
+        if in_region[v] and in_cover[v] and all(w != v and in_cover[w] for w in indices[indptr[v]:indptr[v + 1]]):
+            in_cover[v] = 0
+    return len(boundary)
+
+
+def solve(
+    instance: Any,
+    seed: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> Result:
+    """
+    Solver por partición para grafos grandes.
+
+    Parámetros opcionales:
+        - parts: número de partes (default: workers).
+        - workers: procesos para resolver las partes (default: os.cpu_count()).
+        - part_algo: "local_search" (default) o "ils".
+        - part_params: parámetros del solver de cada parte y de la reparación
+          (default: selección "bms").
+        - time_limit: tiempo total en segundos (default: 10).
+        - part_share: fracción del tiempo para resolver las partes (default: 0.7);
+          el resto queda para la reparación de la frontera.
+        - lp_rounds: rondas de propagación de etiquetas (default: 5).
+    """
+    params = params or {}
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    csr = CSRGraph.from_graph(instance)
+    n = csr.number_of_nodes()
+    workers = int(params.get("workers") or os.cpu_count() or 1)
+    if mp.current_process().daemon:
+        workers = 1     # Un proceso daemon (p. ej. el sandbox) no puede crear hijos
+    k = max(1, int(params.get("parts") or workers))
+    part_algo = params.get("part_algo", "local_search")
+    time_limit = float(params.get("time_limit", 10.0))
+    part_share = float(params.get("part_share", 0.7))
+
+    # 1) Partición
+    label = partition(csr, k, rng, rounds=int(params.get("lp_rounds", 5)))
+    members, subgraphs, cut = _split(csr, label, k)
+    t_partition = time.perf_counter() - start
+
+    # 2) Partes en paralelo; el tiempo que queda de su fracción se reparte entre
+    # las tandas de `workers` partes que corren una tras otra
+    waves = math.ceil(k / max(1, min(workers, k)))
+    part_time = max(0.0, time_limit * part_share - t_partition) / waves
+    # Por defecto la búsqueda local usa BMS: la selección exacta recorre todo el cover en cada paso
+    base_params = {"selection": "bms", **(params.get("part_params") or {})}
+    part_params = dict(base_params, time_limit=part_time)
+    seeds = [None if seed is None else seed + p for p in range(k)]
+    if workers > 1 and k > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, k)) as pool:
+            masks = list(pool.map(_solve_part, [part_algo] * k, subgraphs, seeds, [part_params] * k))
+    else:
+        masks = [_solve_part(part_algo, g, s, part_params) for g, s in zip(subgraphs, seeds)]
+    in_cover = bytearray(n)
+    for verts, mask in zip(members, masks):
+        for v, bit in zip(verts, mask):
+            in_cover[v] = bit
+    merged_size = sum(in_cover)
+    t_parts = time.perf_counter() - start - t_partition
+
+    # 3) Reparación del corte y búsqueda local en la frontera con el tiempo restante
+    repair_params = dict(base_params)
+    repair_params["time_limit"] = max(0.0, time_limit - (time.perf_counter() - start))
+    boundary = _repair_boundary(csr, in_cover, label, seed, repair_params)
+    t_repair = time.perf_counter() - start - t_partition - t_parts
+
+    sol = Solution.from_mask(in_cover)
+    evaluation = Evaluator(csr).evaluate(sol)
+    return Result(
+        solution=sol,
+        cost=evaluation.cost,
+        feasible=evaluation.feasible,
+        meta={
+            "method": "partition",
+            "parts": k,
+            "workers": workers,
+            "part_algo": part_algo,
+            "part_sizes": [len(verts) for verts in members],
+            "cut_edges": cut,
+            "cut_fraction": cut / csr.number_of_edges() if csr.number_of_edges() else 0.0,
+            "boundary": boundary,
+            "merged_size": merged_size,
+            "time_limit": time_limit,
+            "partition_time": t_partition,
+            "parts_time": t_parts,
+            "repair_time": t_repair,
+            "seed": seed,
+        },
+    )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+from ..core.api import Result
+from ..core.csr import CSRGraph
+from ..core.evaluator import Evaluator
+from ..core.solution import Solution
+
+# Pulido posterior de un cover factible, compartido por todos los solvers
+# (params["polish"] en run_benchmark.run y tras cada óptimo local de ILS).
+# Se mantiene, para cada vértice v del cover, loss[v] = aristas que quedarían
+# descubiertas al quitarlo (vecinos fuera del cover, más el lazo propio si lo hay):
+#   - loss[v] == 0: v es redundante y se quita;
+#   - loss[u] == 1 para varios vecinos u de un mismo x fuera del cover (su única
+#     arista "propia" es u-x): si dos o más de ellos son independientes, se
+#     cambian todos por x, el (1,2)-swap (o (1,k)) que baja el tamaño en k - 1.
+# Cada cambio solo actualiza los contadores de los vecinos tocados, así que el
+# trabajo es proporcional a las vecindades del cover y no a m.
+
+
+def polish_cover(
+    graph: Any,
+    cover: Iterable[int],
+    stats: Optional[Dict[str, int]] = None,
+    flips: Optional[List[int]] = None,
+) -> Set[int]:
+    """
+    Quita vértices redundantes y aplica (1,2)-swaps hasta que no quede ninguno.
+    Retorna un conjunto nuevo si hubo cambios (el mismo objeto si no) y, si se
+    pasa `stats`, suma ahí la reducción del tamaño ("reduction") y los swaps.
+    Los vértices que cambian de estado se agregan a `flips` si se pasa.
+    """
+    csr = CSRGraph.from_graph(graph)
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    cover = cover if isinstance(cover, (set, frozenset)) else set(cover)
+    mask = bytearray(n)
+    for v in cover:
+        mask[v] = 1
+    loss = [0] * n
+    for v in cover:
+        c = 0
+        for i in range(indptr[v], indptr[v + 1]):
+            w = indices[i]
+            if w == v or not mask[w]:
+                c += 1
+        loss[v] = c
+
+    def _outside(u: int) -> int:
+        # Vecino fuera del cover de u (-1 si su arista propia es un lazo)
+        for i in range(indptr[u], indptr[u + 1]):
+            w = indices[i]
+            if w != u and not mask[w]:
+                return w
+        return -1
+
+    # Redundantes iniciales: primero los que bloquean menos a otros redundantes
+    # (menos vecinos redundantes); la pila se consume desde el final
+    redundant = [v for v in cover if loss[v] == 0]
+    if len(redundant) > 1:
+        blocked = {
+            v: sum(1 for i in range(indptr[v], indptr[v + 1]) if loss[indices[i]] == 0)
+            for v in redundant
+        }
+        redundant.sort(key=lambda v: (-blocked[v], -v))
+    candidates = list({x for x in (_outside(u) for u in cover if loss[u] == 1) if x >= 0})
+
+    removed: List[int] = []
+    added: List[int] = []
+    swaps = 0
+
+    def _touch(vertices: Iterable[int]) -> None:
+        # Encola los vértices del cover cuyo contador bajó a 0 o a 1
+        for y in vertices:
+            if mask[y]:
+                if loss[y] == 0:
+                    redundant.append(y)
+                elif loss[y] == 1:
+                    x = _outside(y)
+                    if x >= 0:
+                        candidates.append(x)
+
+    while True:
+        while redundant:
+            v = redundant.pop()
+            if not mask[v] or loss[v]:
+                continue
+            mask[v] = 0
+            removed.append(v)
+            for i in range(indptr[v], indptr[v + 1]):
+                w = indices[i]
+                if w != v:
+                    loss[w] += 1    # Todos sus vecinos están en el cover
+            candidates.append(v)
+        if not candidates:
+            break
+        x = candidates.pop()
+        if mask[x]:
+            continue
+        # Vecinos de x cuya única arista propia es la que va a x; de ellos se
+        # toma un independiente voraz, primero los de menos vecinos en el grupo
+        tight = {
+            indices[i] for i in range(indptr[x], indptr[x + 1])
+            if indices[i] != x and mask[indices[i]] and loss[indices[i]] == 1
+        }
+        if len(tight) < 2:
+            continue
+        inner = {
+            u: sum(1 for j in range(indptr[u], indptr[u + 1]) if indices[j] in tight)
+            for u in tight
+        }
+        chosen: Set[int] = set()
+        for u in sorted(tight, key=lambda u: (inner[u], u)):
+            if not inner[u] or not any(indices[j] in chosen for j in range(indptr[u], indptr[u + 1])):
+                chosen.add(u)
+        if len(chosen) < 2:
+            continue
+
+        mask[x] = 1
+        added.append(x)
+        c = 0
+        for i in range(indptr[x], indptr[x + 1]):
+            y = indices[i]
+            if y == x:
+                c += 1
+            elif mask[y]:
+                loss[y] -= 1
+            else:
+                c += 1
+        loss[x] = c
+        for u in chosen:
+            mask[u] = 0
+            removed.append(u)
+            for i in range(indptr[u], indptr[u + 1]):
+                y = indices[i]
+                if y != u and mask[y]:
+                    loss[y] += 1
+        swaps += 1
+        _touch(indices[indptr[x]:indptr[x + 1]])
+        for u in chosen:
+            _touch(indices[indptr[u]:indptr[u + 1]])
+        _touch((x,))
+
+    if stats is not None:
+        stats["reduction"] = stats.get("reduction", 0) + len(removed) - len(added)
+        stats["swaps"] = stats.get("swaps", 0) + swaps
+    if flips is not None:
+        flips.extend(added)
+        flips.extend(removed)
+    if not removed:
+        return cover
+    # Un vértice puede entrar por un swap y salir después como redundante: manda la máscara
+    changed = set(removed)
+    changed.update(added)
+    out = set(cover)
+    for v in changed:
+        if mask[v]:
+            out.add(v)
+        else:
+            out.discard(v)
+    return out
+
+
+def polish_result(instance: Any, result: Result) -> Result:
+    """
+    Pule la solución de un Result factible y la reevalúa; meta["polish"] guarda
+    cuánto se redujo el cover, los swaps aplicados y el tiempo empleado.
+    """
+    if not result.feasible:
+        return result
+    start = time.perf_counter()
+    stats: Dict[str, int] = {}
+    before = result.solution.cover
+    after = polish_cover(instance, before, stats)
+    meta = dict(result.meta or {})
+    meta["polish"] = {"reduction": stats["reduction"], "swaps": stats["swaps"], "time": time.perf_counter() - start}
+    if after is before:
+        return Result(solution=result.solution, cost=result.cost, feasible=result.feasible, meta=meta)
+    sol = Solution.from_cover(after, result.solution.n)
+    evaluation = Evaluator(instance).evaluate(sol)
+    return Result(solution=sol, cost=evaluation.cost, feasible=evaluation.feasible, meta=meta)
+
+
+def with_polish(algorithm: Callable[..., Result]) -> Callable[..., Result]:
+    """Envuelve un solve para pulir su resultado (el tiempo del pulido cuenta en la corrida)."""
+    def solve(instance: Any, seed: Optional[int] = None, params: Optional[Dict[str, Any]] = None) -> Result:
+        return polish_result(instance, algorithm(instance, seed=seed, params=params))
+    return solve
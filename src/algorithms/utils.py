@@ -1,7 +1,9 @@
 from __future__ import annotations
-from typing import Optional, Set
+from typing import TYPE_CHECKING, List, Optional, Set
 import random
-import networkx as nx
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 
 def _edge_key(u: int, v: int) -> tuple[int, int]:
@@ -21,14 +23,22 @@ def _add_greedy_cover_vertices(
     uncovered: Set[tuple[int, int]],
     cover: Set[int],
     rng: random.Random,
+    flips: Optional[List[int]] = None,
 ) -> None:
     """
     Dado un conjunto de aristas no cubiertas y un cover parcial,
     agrega vértices al cover usando el heurístico voraz hasta cubrir todas las aristas.
-    Modifica el cover y uncovered in-place.
+    Modifica el cover y uncovered in-place; los vértices agregados se anotan en `flips` si se pasa.
+    Recorre una permutación aleatoria de las aristas saltando las ya cubiertas
+    (equivale a elegir cada vez una arista uniforme entre las que quedan) en
+    lugar de copiar el conjunto en cada elección.
     """
-    while uncovered:
-        u, v = rng.choice(tuple(uncovered))
+    order = list(uncovered)
+    rng.shuffle(order)
+    for edge in order:
+        if edge not in uncovered:
+            continue
+        u, v = edge
         du = instance.degree(u)
         dv = instance.degree(v)
 
@@ -37,6 +47,8 @@ def _add_greedy_cover_vertices(
         else:
             chosen = u if du > dv else v
         cover.add(chosen)
+        if flips is not None:
+            flips.append(chosen)
 
         for nbr in instance.neighbors(chosen):
             uncovered.discard(_edge_key(chosen, nbr))
@@ -47,15 +59,8 @@ def _initial_cover(instance: nx.Graph, rng: random.Random) -> Set[int]:
     Construye un cover factible usando un heurístico voraz:
     Mientras existan aristas no cubiertas, selecciona una y agrega el
     extremo de mayor grado (desempate aleatorio).
+    Delega en construction.edge_greedy, que trabaja sobre arreglos en O(m).
     """
-    edges = {_edge_key(u, v) for u, v in instance.edges() if u != v}
-    uncovered = set(edges)
-
-    cover: Set[int] = set()
-
-    if not uncovered:
-        return cover
-
-    _add_greedy_cover_vertices(instance, uncovered, cover, rng)
+    from .construction import construct
 
-    return cover
+    return construct(instance, rng, "edge_greedy")
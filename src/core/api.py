@@ -1,9 +1,11 @@
 from __future__ import annotations
-import networkx as nx
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Protocol
+from typing import TYPE_CHECKING, Any, Dict, Optional, Protocol
 from .solution import Solution
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 @dataclass
 class Result:
     solution: Solution
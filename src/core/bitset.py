@@ -0,0 +1,74 @@
+from __future__ import annotations
+from array import array
+from typing import List, Union
+from .csr import CSRGraph
+
+# Densidad (2m / (n (n - 1))) a partir de la cual load_csr agrega la matriz de bits (si se pide)
+DENSITY_THRESHOLD = 0.25
+
+# bytes 0/1 -> dígitos "0"/"1" para convertir una máscara de bytes en entero
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def density(n: int, m: int) -> float:
+    return 2.0 * m / (n * (n - 1)) if n > 1 else 0.0
+
+
+def mask_from_flags(flags: Union[bytes, bytearray]) -> int:
+    """Convierte una máscara de bytes (1 = pertenece) en un entero con el bit v encendido."""
+    if not flags:
+        return 0
+    return int(bytes(flags).translate(_TO_DIGITS)[::-1], 2)
+
+
+class BitsetGraph(CSRGraph):
+    """
+    CSRGraph con una fila de bits por vértice (enteros de Python como bitsets).
+
+    Conserva los arreglos CSR, de modo que recorrer vecinos y aristas da
+    exactamente el mismo orden que el CSR normal; la matriz de bits se usa
+    para las consultas de conjunto, que pasan a ser operaciones sobre
+    palabras: "¿todos los vecinos están en el cover?" es rows[v] & ~mask == 0.
+    Las filas se suman a los arreglos CSR, así que siempre ocupa más memoria
+    (unos n^2 / 8 bytes extra); solo conviene en grafos densos (complementos
+    de instancias DIMACS) y para quien consulta las filas.
+    """
+
+    __slots__ = ("rows",)
+
+    def __init__(self, indptr: array, indices: array, m: int, rows: List[int]) -> None:
+        super().__init__(indptr, indices, m)
+        self.rows = rows
+
+    @classmethod
+    def from_csr(cls, csr: CSRGraph) -> "BitsetGraph":
+        if isinstance(csr, cls):
+            return csr
+        n = csr.number_of_nodes()
+        indptr, indices = csr.indptr, csr.indices
+        rows = []
+        for v in range(n):
+            flags = bytearray(n)
+            for k in range(indptr[v], indptr[v + 1]):
+                flags[indices[k]] = 1
+            rows.append(mask_from_flags(flags))
+        return cls(indptr, indices, csr.number_of_edges(), rows)
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return bool(self.rows[u] >> v & 1)
+
+    def is_cover_mask(self, mask: int) -> bool:
+        """Factibilidad: ningún vértice fuera del cover tiene vecinos fuera del cover."""
+        rows = self.rows
+        outside = ~mask
+        for v in range(len(rows)):
+            if not mask >> v & 1 and rows[v] & outside:
+                return False
+        return True
+
+
+def maybe_bitset(csr: CSRGraph, threshold: float = DENSITY_THRESHOLD) -> CSRGraph:
+    """Retorna un BitsetGraph si la densidad del grafo supera el umbral; si no, el mismo CSR."""
+    if density(csr.number_of_nodes(), csr.number_of_edges()) >= threshold:
+        return BitsetGraph.from_csr(csr)
+    return csr
@@ -0,0 +1,108 @@
+from __future__ import annotations
+from array import array
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+
+
+class CSRGraph:
+    """
+    Grafo no dirigido en formato CSR (compressed sparse row).
+
+    Los vecinos de v son indices[indptr[v]:indptr[v + 1]]. Los vértices son
+    enteros consecutivos desde 0 (igual que tras normalize_nodes).
+    Expone el subconjunto de la API de NetworkX que usan los algoritmos
+    (neighbors, degree, edges, number_of_nodes, ...), de modo que puede
+    pasarse directamente a los que no modifican el grafo.
+    """
+
+    # __weakref__: cachés por grafo (p. ej. kernels._prepare) sin mantenerlo vivo
+    __slots__ = ("indptr", "indices", "_m", "__weakref__")
+
+    def __init__(self, indptr: array, indices: array, m: int) -> None:
+        self.indptr = indptr    # Inicio de la lista de vecinos de cada vértice (n + 1 entradas)
+        self.indices = indices  # Vecinos concatenados (2 * m entradas)
+        self._m = m             # Número de aristas
+
+    # Construye el CSR a partir de listas de adyacencia
+    @classmethod
+    def from_adjacency(cls, adj: Sequence[Sequence[int]]) -> "CSRGraph":
+        indptr = array("l", [0])
+        indices = array("l")
+        loops = 0
+        for v, nbrs in enumerate(adj):
+            indices.extend(nbrs)
+            indptr.append(len(indices))
+            if v in nbrs:
+                loops += 1
+        return cls(indptr, indices, (len(indices) - loops) // 2 + loops)
+
+    # Construye el CSR a partir de una lista de aristas (se ignoran duplicados,
+    # conservando el orden de primera aparición igual que NetworkX)
+    @classmethod
+    def from_edges(cls, n: int, edges: Iterable[Tuple[int, int]]) -> "CSRGraph":
+        adj: List[dict] = [{} for _ in range(n)]
+        for u, v in edges:
+            adj[u][v] = None
+            adj[v][u] = None
+        return cls.from_adjacency([list(a) for a in adj])
+
+    # Convierte un grafo de NetworkX (nodos 0..n-1) o devuelve el mismo CSR
+    @classmethod
+    def from_graph(cls, graph: Any) -> "CSRGraph":
+        if isinstance(graph, cls):
+            return graph
+        n = graph.number_of_nodes()
+        return cls.from_adjacency([list(graph.neighbors(v)) for v in range(n)])
+
+    def number_of_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    def number_of_edges(self) -> int:
+        return self._m
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def nodes(self) -> range:
+        return range(len(self.indptr) - 1)
+
+    def neighbors(self, v: int) -> array:
+        return self.indices[self.indptr[v]:self.indptr[v + 1]]
+
+    def degree(self, v: Any = None) -> Any:
+        # Con un vértice devuelve su grado; sin argumentos, pares (v, grado)
+        indptr = self.indptr
+        if v is None:
+            return [(u, indptr[u + 1] - indptr[u]) for u in range(len(indptr) - 1)]
+        return indptr[v + 1] - indptr[v]
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return v in self.neighbors(u)
+
+    def edges(self) -> Iterator[Tuple[int, int]]:
+        # Mismo orden que NetworkX: cada arista una vez, desde su extremo menor
+        indptr, indices = self.indptr, self.indices
+        for u in range(len(indptr) - 1):
+            for i in range(indptr[u], indptr[u + 1]):
+                w = indices[i]
+                if w >= u:
+                    yield u, w
+
+
+def pack(graphs: Sequence[CSRGraph]) -> Tuple[CSRGraph, List[int]]:
+    """
+    Empaqueta varios grafos en un único CSR (unión disjunta).
+    Retorna el grafo concatenado y el desplazamiento de cada grafo
+    (offsets[i] es el id del vértice 0 del grafo i; el último es n total).
+    """
+    indptr = array("l", [0])
+    indices = array("l")
+    offsets = [0]
+    m = 0
+    for g in graphs:
+        off = offsets[-1]
+        base = len(indices)
+        indices.extend(w + off for w in g.indices)
+        indptr.extend(p + base for p in g.indptr[1:])
+        offsets.append(off + g.number_of_nodes())
+        m += g.number_of_edges()
+    return CSRGraph(indptr, indices, m), offsets
@@ -1,8 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass
-import networkx as nx
+from typing import TYPE_CHECKING
+from .bitset import BitsetGraph, mask_from_flags
 from .solution import Solution
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 @dataclass
 class Evaluation:
     feasible: bool
@@ -14,14 +18,18 @@ class Evaluator:
 
     # Revisa si la solución es un cover válido
     def is_cover(self, sol: Solution) -> bool:
+        in_cover = sol.in_cover
+        # Grafo denso con filas de bits: se verifica por palabras
+        if isinstance(self.graph, BitsetGraph):
+            return self.graph.is_cover_mask(mask_from_flags(in_cover))
         for u, v in self.graph.edges():
-            if not (sol.in_cover[u] or sol.in_cover[v]):
+            if not (in_cover[u] or in_cover[v]):
                 return False
         return True
 
     # Calcula el costo de la solución
     def cost(self, sol: Solution) -> int:
-        return len(sol.cover)
+        return sol.cost
 
     # Evalúa la solución y retorna su factibilidad y costo
     def evaluate(self, sol: Solution) -> Evaluation:
@@ -1,10 +1,16 @@
 from __future__ import annotations
-from typing import Any
-import networkx as nx
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from .bitset import maybe_bitset
+from .csr import CSRGraph
+
+if TYPE_CHECKING:
+    import networkx as nx
 
 # Normaliza los nodos del grafo para que sean enteros consecutivos desde 0
 # para facilitar el manejo interno
 def normalize_nodes(graph: nx.Graph) -> nx.Graph:
+    import networkx as nx
+
     # Crear un mapeo de nodos originales a enteros consecutivos
     mapping = {node: i for i, node in enumerate(graph.nodes())}
     # Retornar un nuevo grafo con los nodos renombrados
@@ -12,5 +18,55 @@ def normalize_nodes(graph: nx.Graph) -> nx.Graph:
 
 # Carga un grafo desde un archivo de edgelist y normaliza sus nodos
 def load_edgelist(path: str, nodetype: Any = int, comment: str = "#") -> nx.Graph:
+    import networkx as nx
+
     graph = nx.read_edgelist(path, nodetype=nodetype, comments=comment)
     return normalize_nodes(graph)
+
+# Carga un edgelist directamente a CSR, sin importar NetworkX
+def load_csr(
+    path: str,
+    nodetype: Callable[[str], Any] = int,
+    comment: str = "#",
+    dense_threshold: Optional[float] = None,
+) -> CSRGraph:
+    """
+    Lee un edgelist y construye un CSRGraph con la misma numeración y el mismo
+    orden de vecinos que load_edgelist (ids por orden de primera aparición,
+    aristas duplicadas ignoradas), de modo que los algoritmos obtienen
+    exactamente los mismos resultados con ambos caminos.
+    Si se pasa dense_threshold (p. ej. DENSITY_THRESHOLD) y la densidad lo
+    alcanza, retorna un BitsetGraph, que agrega filas de bits para las
+    consultas de conjunto; solo conviene a quien las lee (BITSET_ALGORITHMS).
+    """
+    ids: Dict[Any, int] = {}
+    adj: List[Dict[int, None]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split(comment, 1)[0]
+            tokens = line.split()
+            if len(tokens) < 2:
+                continue
+            ends = []
+            for tok in tokens[:2]:
+                label = nodetype(tok)
+                v = ids.get(label)
+                if v is None:
+                    v = ids[label] = len(adj)
+                    adj.append({})
+                ends.append(v)
+            u, v = ends
+            adj[u][v] = None
+            adj[v][u] = None
+
+    # normalize_nodes reconstruye la adyacencia recorriendo las aristas en el
+    # orden de NetworkX (cada arista desde su extremo menor); lo replicamos
+    rebuilt: List[List[int]] = [[] for _ in adj]
+    for u, nbrs in enumerate(adj):
+        for w in nbrs:
+            if w >= u:
+                rebuilt[u].append(w)
+                if w != u:
+                    rebuilt[w].append(u)
+    csr = CSRGraph.from_adjacency(rebuilt)
+    return maybe_bitset(csr, dense_threshold) if dense_threshold is not None else csr
@@ -0,0 +1,161 @@
+from __future__ import annotations
+import base64
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .api import Result
+from .bitset import mask_from_flags
+from .solution import Solution
+
+# Codificaciones de soluciones en la salida JSON:
+#   - "full": cover, in_cover y cost como listas (formato original)
+#   - "bitmask": in_cover empaquetado a 1 bit por vértice, en base64
+#   - "varint": cover ordenado como diferencias consecutivas en varint (LEB128), en base64
+#   - "diff": como "varint", pero de los vértices que difieren de la mejor solución
+ENCODINGS = ("full", "bitmask", "varint", "diff")
+
+# Byte empaquetado -> sus 8 bits como bytes 0/1 (bit menos significativo primero)
+_BYTE_BITS = [bytes((b >> i) & 1 for i in range(8)) for b in range(256)]
+
+
+def _varints(values: Iterable[int]) -> bytes:
+    out = bytearray()
+    for x in values:
+        while x >= 0x80:
+            out.append((x & 0x7F) | 0x80)
+            x >>= 7
+        out.append(x)
+    return bytes(out)
+
+
+def _unvarints(data: bytes) -> List[int]:
+    values = []
+    x = shift = 0
+    for b in data:
+        x |= (b & 0x7F) << shift
+        if b & 0x80:
+            shift += 7
+        else:
+            values.append(x)
+            x = shift = 0
+    return values
+
+
+def _deltas(sorted_values: List[int]) -> List[int]:
+    prev = 0
+    out = []
+    for v in sorted_values:
+        out.append(v - prev)
+        prev = v
+    return out
+
+
+def _undeltas(deltas: List[int]) -> List[int]:
+    out = []
+    acc = 0
+    for d in deltas:
+        acc += d
+        out.append(acc)
+    return out
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def encode_solution(sol: Solution, encoding: str = "full", best: Optional[Solution] = None) -> Dict[str, Any]:
+    """
+    Codifica una solución para la salida JSON. Con "diff" se guarda la diferencia
+    simétrica contra `best` (si no se pasa, se usa "varint").
+    """
+    if encoding == "full":
+        return sol.to_dict()
+    if encoding == "diff" and best is None:
+        encoding = "varint"
+    out: Dict[str, Any] = {"encoding": encoding, "n": sol.n, "cost": sol.cost}
+    if encoding == "bitmask":
+        out["data"] = _b64(mask_from_flags(sol.in_cover).to_bytes((sol.n + 7) // 8, "little"))
+    elif encoding == "varint":
+        out["data"] = _b64(_varints(_deltas(sorted(sol.cover))))
+    elif encoding == "diff":
+        flips = sorted(sol.cover.symmetric_difference(best.cover))
+        out["data"] = _b64(_varints(_deltas(flips)))
+    else:
+        raise ValueError(f"Codificación desconocida: {encoding} (opciones: {', '.join(ENCODINGS)})")
+    return out
+
+
+def decode_solution(obj: Dict[str, Any], best: Optional[Solution] = None) -> Solution:
+    """Inverso de encode_solution (acepta también el formato "full")."""
+    encoding = obj.get("encoding", "full")
+    if encoding == "full":
+        return Solution.from_mask(bytearray(1 if b else 0 for b in obj["in_cover"]))
+    n = obj["n"]
+    data = base64.b64decode(obj["data"])
+    if encoding == "bitmask":
+        return Solution.from_mask(b"".join(_BYTE_BITS[b] for b in data)[:n])
+    vertices = _undeltas(_unvarints(data))
+    if encoding == "varint":
+        return Solution.from_cover(vertices, n)
+    if encoding == "diff":
+        if best is None:
+            raise ValueError("La codificación diff requiere la mejor solución")
+        return Solution.from_cover(best.cover.symmetric_difference(vertices), n)
+    raise ValueError(f"Codificación desconocida: {encoding}")
+
+
+def load_solutions(output: Dict[str, Any]) -> Tuple[Optional[Solution], List[Solution]]:
+    """
+    Lee de un objeto de salida (main.py --verbose o una fila de resultados) la
+    mejor solución y las soluciones por corrida de meta, en cualquier codificación.
+    """
+    best = decode_solution(output["solution"]) if output.get("solution") else None
+    runs = [decode_solution(s, best) for s in (output.get("meta") or {}).get("solutions", [])]
+    return best, runs
+
+
+def make_json_serializable(obj: Any, encoding: str = "full", best: Optional[Solution] = None) -> Any:
+    # Convierte sets a listas y aplica recursivamente a dicts y listas
+    if isinstance(obj, set):
+        return list(obj)
+    elif isinstance(obj, dict):
+        return {k: make_json_serializable(v, encoding, best) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [make_json_serializable(x, encoding, best) for x in obj]
+    elif isinstance(obj, Solution):
+        return encode_solution(obj, encoding, best)
+    elif hasattr(obj, 'to_dict'):
+        return make_json_serializable(obj.to_dict(), encoding, best)
+    elif hasattr(obj, '__dict__'):
+        return make_json_serializable(dict(obj.__dict__), encoding, best)
+    else:
+        return obj
+
+
+def build_output(
+    name: str,
+    algo: str,
+    result: Result,
+    optimal: Optional[int] = None,
+    verbose: bool = False,
+    encoding: str = "full",
+) -> Dict[str, Any]:
+    """
+    Construye el objeto de salida que imprime main.py para una instancia
+    (también lo usa el modo servicio para responder con el mismo formato).
+    `encoding` elige cómo se escriben las soluciones (ver ENCODINGS); con
+    "diff" las soluciones por corrida de meta se guardan contra la mejor.
+    """
+    output = {
+        "instance": name,                                # Nombre de la instancia
+        "algo": algo,                                    # Algoritmo usado
+        "cost": result.cost,                             # Costo de la solución
+        "feasible": result.feasible,                     # Si la solución es factible
+        "meta": make_json_serializable(result.meta, encoding, result.solution),  # Metadatos serializables
+    }
+    if optimal is not None:
+        output["optimal"] = optimal
+        output["gap"] = result.cost - optimal
+        output["gap_pct"] = 100.0 * (result.cost - optimal) / optimal if optimal else None
+    if verbose:
+        # Imprime la solución completa (cover, in_cover, etc.); la mejor nunca va como diff
+        output["solution"] = encode_solution(result.solution, "varint" if encoding == "diff" else encoding)
+    return output
@@ -1,22 +1,141 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Set
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
 
-@dataclass
 class Solution:
-    cover: Set[int]       # Conjunto de vértices en el cover
-    in_cover: List[bool]  # Lista booleana que indica si un vértice está en el cover
-    cost: int             # Costo de la solución (tamaño del cover)
+    """
+    Solución de Vertex Cover respaldada por una máscara compacta (bytearray).
+
+    - La máscara ocupa 1 byte por vértice (en lugar de un objeto bool por posición).
+    - El costo se mantiene como contador O(1) en cada cambio.
+    - El conjunto `cover` se materializa de forma perezosa la primera vez que se pide
+      y luego se mantiene actualizado de forma incremental.
+    - `copy()` es copy-on-write: la copia comparte la máscara hasta que alguna de
+      las dos se modifica, por lo que guardar el mejor-hasta-ahora es O(1).
+    """
+
+    __slots__ = ("_mask", "_cost", "_cover", "_shared")
+
+    def __init__(self, mask: bytearray, cost: int, cover: Optional[Set[int]] = None) -> None:
+        self._mask = mask     # Máscara: mask[v] == 1 si v está en el cover
+        self._cost = cost     # Costo de la solución (tamaño del cover)
+        self._cover = cover   # Vista perezosa del cover como conjunto (None si no se ha pedido)
+        self._shared = False  # True si la máscara está compartida con otra copia
 
-    @classmethod
-    
     # Crea una solución a partir de un conjunto de vértices en el cover
-    def from_cover(cls, cover: Set[int], n: int) -> "Solution":
-        in_cover = [False] * n
+    @classmethod
+    def from_cover(cls, cover: Iterable[int], n: int) -> "Solution":
+        mask = bytearray(n)
         for v in cover:
-            in_cover[v] = True
-        return cls(set(cover), in_cover, len(cover))
+            mask[v] = 1
+        return cls(mask, mask.count(1))
+
+    # Crea una solución a partir de una máscara (se copia para no compartir estado)
+    @classmethod
+    def from_mask(cls, mask: Iterable[int]) -> "Solution":
+        mask = bytearray(mask)
+        return cls(mask, mask.count(1))
+
+    @property
+    def n(self) -> int:
+        return len(self._mask)
+
+    @property
+    def cost(self) -> int:
+        return self._cost
+
+    @property
+    def in_cover(self) -> bytearray:
+        # Máscara de pertenencia; debe tratarse como solo lectura
+        return self._mask
+
+    @property
+    def cover(self) -> Set[int]:
+        # Materializa el conjunto solo cuando se necesita
+        if self._cover is None:
+            self._cover = set(compress(range(len(self._mask)), self._mask))
+        return self._cover
+
+    def __len__(self) -> int:
+        return self._cost
 
-    # Crea una copia de la solución actual para modificaciones seguras
+    def __contains__(self, v: object) -> bool:
+        return isinstance(v, int) and 0 <= v < len(self._mask) and self._mask[v] == 1
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.cover)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Solution):
+            return NotImplemented
+        return self._mask == other._mask
+
+    def __repr__(self) -> str:
+        return f"Solution(cost={self._cost}, n={len(self._mask)})"
+
+    def _own(self) -> None:
+        """Deja de compartir la máscara (y la vista) antes de modificarla."""
+        if self._shared:
+            self._mask = bytearray(self._mask)
+            if self._cover is not None:
+                self._cover = set(self._cover)
+            self._shared = False
+
+    # Agrega v al cover; retorna True si hubo cambio
+    def add(self, v: int) -> bool:
+        if self._mask[v]:
+            return False
+        self._own()
+        self._mask[v] = 1
+        self._cost += 1
+        if self._cover is not None:
+            self._cover.add(v)
+        return True
+
+    # Remueve v del cover; retorna True si hubo cambio
+    def remove(self, v: int) -> bool:
+        if not self._mask[v]:
+            return False
+        self._own()
+        self._mask[v] = 0
+        self._cost -= 1
+        if self._cover is not None:
+            self._cover.discard(v)
+        return True
+
+    # Invierte el estado de v
+    def flip(self, v: int) -> None:
+        if self._mask[v]:
+            self.remove(v)
+        else:
+            self.add(v)
+
+    # Crea una copia de la solución actual para modificaciones seguras (copy-on-write)
     def copy(self) -> "Solution":
-        return Solution(set(self.cover), list(self.in_cover), self.cost)
+        self._shared = True
+        clone = Solution(self._mask, self._cost, self._cover)
+        clone._shared = True
+        return clone
+
+    # Alias explícito para guardar el mejor-hasta-ahora
+    snapshot = copy
+
+    # Representación serializable (misma forma que la antigua dataclass)
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cover": sorted(self.cover),
+            "in_cover": [b == 1 for b in self._mask],
+            "cost": self._cost,
+        }
+
+    # Soporte de pickle (por ejemplo, para ProcessPoolExecutor)
+    def __getstate__(self):
+        return (bytes(self._mask), self._cost)
+
+    def __setstate__(self, state) -> None:
+        mask, cost = state
+        self._mask = bytearray(mask)
+        self._cost = cost
+        self._cover = None
+        self._shared = False
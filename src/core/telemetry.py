@@ -0,0 +1,148 @@
+from __future__ import annotations
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+# Telemetría de progreso de los solvers: instantáneas periódicas (iteración,
+# costo actual y mejor, movimientos por segundo, tiempo transcurrido) hacia un
+# destino intercambiable. Se activa con params["telemetry"]:
+#   "stderr"            una línea legible por instantánea
+#   "jsonl:<ruta>"      un objeto JSON por línea (append)
+#   "prom:<ruta>"       archivo de texto para el textfile collector de Prometheus
+# En las rutas, "{pid}" se reemplaza por el id del proceso (útil con workers).
+
+
+class StderrSink:
+    def emit(self, snap: Dict[str, Any]) -> None:
+        labels = " ".join(f"{k}={v}" for k, v in snap.get("labels", {}).items())
+        print(
+            f"[{snap['algo']}{' ' + labels if labels else ''}] it={snap['iteration']} "
+            f"actual={snap['current']} mejor={snap['best']} "
+            f"mov/s={snap['moves_per_s']:.0f} t={snap['elapsed']:.1f}s{' fin' if snap['done'] else ''}",
+            file=sys.stderr,
+            flush=True,
+        )
+
+
+class JsonlSink:
+    def __init__(self, path: str) -> None:
+        self._file: TextIO = open(path, "a", encoding="utf-8", buffering=1)
+
+    def emit(self, snap: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(snap, ensure_ascii=False) + "\n")
+
+
+class PrometheusSink:
+    """Reescribe el archivo completo (temporal + rename) con la última instantánea de cada solver."""
+
+    METRICS = (
+        ("iteration", "vc_solver_iteration", "Iteración actual del solver"),
+        ("current", "vc_solver_current_cost", "Tamaño del cover actual"),
+        ("best", "vc_solver_best_cost", "Tamaño del mejor cover"),
+        ("moves_per_s", "vc_solver_moves_per_second", "Movimientos por segundo desde la instantánea anterior (promedio en la final)"),
+        ("elapsed", "vc_solver_elapsed_seconds", "Segundos desde el inicio de la corrida"),
+    )
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._last: Dict[Tuple[Tuple[str, str], ...], Dict[str, Any]] = {}
+
+    def emit(self, snap: Dict[str, Any]) -> None:
+        labels = {"algo": snap["algo"], **{k: str(v) for k, v in snap.get("labels", {}).items()}}
+        key = tuple(sorted(labels.items()))
+        self._last[key] = snap
+        lines = []
+        for field, metric, help_text in self.METRICS:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for key, last in self._last.items():
+                text = ",".join(f'{k}="{v}"' for k, v in key)
+                lines.append(f"{metric}{{{text}}} {last[field]}")
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp, self.path)
+
+
+# Destinos abiertos en este proceso (especificación -> sink)
+_SINKS: Dict[str, Any] = {}
+
+
+def make_sink(spec: str) -> Any:
+    """Crea (o reutiliza) el destino descrito por `spec` ("stderr", "jsonl:<ruta>" o "prom:<ruta>")."""
+    spec = spec.replace("{pid}", str(os.getpid()))
+    sink = _SINKS.get(spec)
+    if sink is None:
+        kind, _, path = spec.partition(":")
+        if kind == "stderr":
+            sink = StderrSink()
+        elif kind == "jsonl" and path:
+            sink = JsonlSink(path)
+        elif kind == "prom" and path:
+            sink = PrometheusSink(path)
+        else:
+            raise ValueError(f"Destino de telemetría inválido: {spec} (stderr, jsonl:<ruta> o prom:<ruta>)")
+        _SINKS[spec] = sink
+    return sink
+
+
+class Progress:
+    """
+    Publicador de instantáneas con límite de frecuencia. tick() solo lee el
+    reloj y compara; la instantánea se arma y se emite a lo sumo una vez cada
+    `interval` segundos. En ciclos muy calientes conviene llamarlo cada tantas
+    iteraciones (p. ej. `if not step & 255`).
+    """
+
+    __slots__ = ("sink", "algo", "labels", "interval", "_start", "_next", "_last_time", "_last_iter")
+
+    def __init__(self, sink: Any, algo: str, interval: float = 1.0, labels: Optional[Dict[str, Any]] = None) -> None:
+        self.sink = sink
+        self.algo = algo
+        self.labels = labels or {}
+        self.interval = interval
+        self._start = self._last_time = time.perf_counter()
+        self._next = self._start + interval
+        self._last_iter = 0
+
+    def tick(self, iteration: int, current: int, best: int) -> None:
+        now = time.perf_counter()
+        if now >= self._next:
+            self._emit(now, iteration, current, best, False)
+
+    def done(self, iteration: int, current: int, best: int) -> None:
+        """Instantánea final (siempre se emite)."""
+        self._emit(time.perf_counter(), iteration, current, best, True)
+
+    def _emit(self, now: float, iteration: int, current: int, best: int, done: bool) -> None:
+        # La instantánea final informa el ritmo promedio de toda la corrida
+        last_time, last_iter = (self._start, 0) if done else (self._last_time, self._last_iter)
+        span = now - last_time
+        self.sink.emit({
+            "ts": time.time(),
+            "algo": self.algo,
+            "labels": self.labels,
+            "iteration": iteration,
+            "current": current,
+            "best": best,
+            "moves_per_s": (iteration - last_iter) / span if span > 0 else 0.0,
+            "elapsed": now - self._start,
+            "done": done,
+        })
+        self._last_time, self._last_iter = now, iteration
+        self._next = now + self.interval
+
+
+def progress_from_params(params: Optional[Dict[str, Any]], algo: str) -> Optional[Progress]:
+    """Progress según params["telemetry"], ["telemetry_interval"] y ["telemetry_labels"]; None si no se pidió."""
+    spec = params.get("telemetry") if params else None
+    if not spec:
+        return None
+    return Progress(
+        make_sink(spec),
+        algo,
+        interval=float(params.get("telemetry_interval", 1.0)),
+        labels=params.get("telemetry_labels"),
+    )
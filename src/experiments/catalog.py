@@ -0,0 +1,321 @@
+from __future__ import annotations
+import hashlib
+import json
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from ..core.csr import CSRGraph
+from ..core.graph_io import load_csr
+
+# Catálogo de instancias: un único archivo JSON por carpeta de datos, indexado por
+# nombre de instancia, con el hash del contenido, estadísticas del grafo, cotas
+# inferiores (matching y relajación LP), el óptimo conocido y el mejor cover hallado.
+# Se construye una vez; al abrirlo solo se recalculan las instancias cuyo archivo
+# cambió (tamaño/mtime y luego hash), de modo que las consultas no leen los grafos
+# ni optimal_covers.txt.
+
+CATALOG_FILE = "catalog.json"
+OPTIMA_FILE = "optimal_covers.txt"
+CATALOG_VERSION = 1
+
+# Hopcroft-Karp en Python puro: por encima de este número de aristas se omite la cota LP
+LP_MAX_EDGES = 1_000_000
+
+DEFAULT_BENCH_DIR = Path(__file__).resolve().parents[2] / "data" / "bench_graphs_c"
+
+# Catálogos abiertos en este proceso (carpeta resuelta -> Catalog)
+_OPEN: Dict[str, "Catalog"] = {}
+
+
+def file_hash(path: Path) -> str:
+    """SHA-1 del contenido del archivo (lectura por bloques)."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def read_optima(path: Path) -> Dict[str, int]:
+    """
+    Lee un archivo `nombre: tamaño` (líneas vacías y comentarios # se ignoran).
+    Una línea mal formada es un error, no se descarta en silencio.
+    """
+    optima: Dict[str, int] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, sep, value = line.partition(":")
+            try:
+                if not sep:
+                    raise ValueError("falta ':'")
+                optima[name.strip()] = int(value.strip())
+            except ValueError as exc:
+                raise ValueError(f"{path}:{lineno}: línea inválida {line!r} ({exc})") from None
+    return optima
+
+
+def _greedy_matching(csr: CSRGraph) -> Tuple[List[int], int]:
+    """Matching maximal en el orden del CSR: pareja de cada vértice (-1 si libre) y tamaño."""
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    mate = [-1] * n
+    size = 0
+    for u in range(n):
+        if mate[u] != -1:
+            continue
+        for k in range(indptr[u], indptr[u + 1]):
+            w = indices[k]
+            if w != u and mate[w] == -1:
+                mate[u], mate[w] = w, u
+                size += 1
+                break
+    return mate, size
+
+
+def _lp_bound(csr: CSRGraph, mate: List[int]) -> float:
+    """
+    Óptimo de la relajación LP del vertex cover: es la mitad del matching máximo
+    del doble cubrimiento bipartito (u_izq - w_der por cada arista u-w), que se
+    calcula con Hopcroft-Karp partiendo del matching maximal `mate`.
+    """
+    n, indptr, indices = csr.number_of_nodes(), csr.indptr, csr.indices
+    match_l = list(mate)
+    match_r = list(mate)
+    while True:
+        # BFS por capas desde los vértices izquierdos libres
+        dist = [-1] * n
+        queue = [u for u in range(n) if match_l[u] == -1 and indptr[u + 1] > indptr[u]]
+        for u in queue:
+            dist[u] = 0
+        found = False
+        i = 0
+        while i < len(queue):
+            u = queue[i]
+            i += 1
+            for k in range(indptr[u], indptr[u + 1]):
+                w = indices[k]
+                if w == u:
+                    continue
+                x = match_r[w]
+                if x == -1:
+                    found = True
+                elif dist[x] == -1:
+                    dist[x] = dist[u] + 1
+                    queue.append(x)
+        if not found:
+            break
+        # DFS iterativo por caminos de aumento disjuntos dentro de las capas
+        nxt = list(indptr[:n])
+        for root in range(n):
+            if match_l[root] != -1 or dist[root] != 0:
+                continue
+            stack = [root]
+            via: List[int] = []
+            while stack:
+                u = stack[-1]
+                end = indptr[u + 1]
+                advanced = False
+                while nxt[u] < end:
+                    w = indices[nxt[u]]
+                    nxt[u] += 1
+                    if w == u:
+                        continue
+                    x = match_r[w]
+                    if x == -1:
+                        via.append(w)
+                        for a, b in zip(stack, via):
+                            match_l[a] = b
+                            match_r[b] = a
+                        stack = []
+                        advanced = True
+                        break
+                    if dist[x] == dist[u] + 1:
+                        via.append(w)
+                        stack.append(x)
+                        advanced = True
+                        break
+                if not advanced:
+                    dist[u] = -1       # Sin salida: no se vuelve a visitar en esta fase
+                    stack.pop()
+                    if via:
+                        via.pop()
+    return sum(1 for w in match_l if w != -1) / 2.0
+
+
+def describe(path: Path) -> Dict[str, Any]:
+    """Registro del catálogo para un edgelist: hash, tamaño, grados y cotas inferiores."""
+    csr = load_csr(str(path))
+    n, m = csr.number_of_nodes(), csr.number_of_edges()
+    indptr = csr.indptr
+    deg = [indptr[v + 1] - indptr[v] for v in range(n)]
+    mean = sum(deg) / n if n else 0.0
+    std = math.sqrt(sum((d - mean) ** 2 for d in deg) / n) if n else 0.0
+    mate, matching = _greedy_matching(csr)
+    lp = _lp_bound(csr, mate) if m <= LP_MAX_EDGES else None
+    stat = path.stat()
+    return {
+        "hash": file_hash(path),
+        "bytes": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "n": n,
+        "m": m,
+        "density": 2.0 * m / (n * (n - 1)) if n > 1 else 0.0,
+        "deg_min": min(deg) if deg else 0,
+        "deg_max": max(deg) if deg else 0,
+        "deg_mean": mean,
+        "deg_std": std,
+        "lb_matching": matching,
+        "lb_lp": lp,
+        "lower_bound": max(matching, math.ceil(lp)) if lp is not None else matching,
+        "optimum": None,
+        "best_known": None,
+        "best_cover": None,
+    }
+
+
+class Catalog:
+    """
+    Índice de las instancias .edgelist de una carpeta, guardado en folder/catalog.json.
+    Usar open_catalog(folder) para obtenerlo ya construido y actualizado.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.folder = Path(folder)
+        self.path = self.folder / CATALOG_FILE
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.optima_mtime_ns: Optional[int] = None
+        self.dirty = False
+
+    @classmethod
+    def load(cls, folder: Path) -> "Catalog":
+        catalog = cls(folder)
+        if catalog.path.exists():
+            data = json.loads(catalog.path.read_text(encoding="utf-8"))
+            if data.get("version") == CATALOG_VERSION:
+                catalog.entries = data.get("instances", {})
+                catalog.optima_mtime_ns = data.get("optima_mtime_ns")
+        return catalog
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Agrega o recalcula las instancias nuevas o modificadas, quita las borradas y
+        vuelve a leer los óptimos si cambió optimal_covers.txt. Retorna si hubo cambios.
+        Los resultados de corridas (best_known) se conservan mientras el hash no cambie.
+        """
+        present = {p.name: p for p in sorted(self.folder.glob("*.edgelist"))}
+        for name in [name for name in self.entries if name not in present]:
+            del self.entries[name]
+            self.dirty = True
+        for name, path in present.items():
+            old = self.entries.get(name)
+            stat = path.stat()
+            if not force and old and old["bytes"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+                continue
+            if not force and old and old["hash"] == file_hash(path):
+                old["bytes"], old["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+            else:
+                record = describe(path)
+                if old and old["hash"] == record["hash"]:
+                    record["best_known"], record["best_cover"] = old["best_known"], old["best_cover"]
+                self.entries[name] = record
+                self.optima_mtime_ns = None      # Los registros nuevos necesitan su óptimo
+            self.dirty = True
+
+        optima_path = self.folder / OPTIMA_FILE
+        mtime = optima_path.stat().st_mtime_ns if optima_path.exists() else None
+        if force or mtime != self.optima_mtime_ns:
+            optima = read_optima(optima_path) if mtime is not None else {}
+            for name, record in self.entries.items():
+                record["optimum"] = optima.get(name)
+            self.optima_mtime_ns = mtime
+            self.dirty = True
+        return self.dirty
+
+    def save(self) -> None:
+        """Escribe el índice de forma atómica (archivo temporal + rename)."""
+        data = {
+            "version": CATALOG_VERSION,
+            "optima_mtime_ns": self.optima_mtime_ns,
+            "instances": self.entries,
+        }
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.entries.get(name)
+
+    def optimum(self, name: str) -> Optional[int]:
+        record = self.entries.get(name)
+        return record["optimum"] if record else None
+
+    def lower_bound(self, name: str) -> Optional[int]:
+        record = self.entries.get(name)
+        return record["lower_bound"] if record else None
+
+    def target(self, name: str) -> Optional[int]:
+        """
+        Tamaño con el que un solver puede detenerse: el óptimo conocido o, si no hay,
+        la cota inferior (alcanzarla también prueba optimalidad).
+        """
+        record = self.entries.get(name)
+        if record is None:
+            return None
+        return record["optimum"] if record["optimum"] is not None else record["lower_bound"]
+
+    def gap_pct(self, name: str, cost: Optional[float]) -> Optional[float]:
+        """Gap porcentual contra el óptimo conocido (None si no hay óptimo)."""
+        optimum = self.optimum(name)
+        if optimum is None or cost is None or optimum == 0:
+            return None
+        return 100.0 * (cost - optimum) / optimum
+
+    def record_best(self, name: str, cost: int, cover: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Registra un cover factible si mejora el mejor conocido. `cover` es la
+        solución codificada (serialization.encode_solution). Hay que llamar a save().
+        """
+        record = self.entries.get(name)
+        if record is None or (record["best_known"] is not None and cost >= record["best_known"]):
+            return False
+        record["best_known"] = int(cost)
+        record["best_cover"] = cover
+        self.dirty = True
+        return True
+
+
+def open_catalog(folder: Path, refresh: bool = True) -> Catalog:
+    """
+    Catálogo de la carpeta, construido si falta y actualizado una sola vez por
+    proceso. Si la carpeta no admite escritura se usa solo en memoria.
+    """
+    key = str(Path(folder).resolve())
+    catalog = _OPEN.get(key)
+    if catalog is None:
+        catalog = Catalog.load(Path(folder))
+        if refresh and catalog.refresh():
+            try:
+                catalog.save()
+            except OSError as exc:
+                print(f"Aviso: no se pudo guardar {catalog.path}: {exc}", file=sys.stderr)
+        _OPEN[key] = catalog
+    return catalog
+
+
+def lookup(path: str) -> Optional[Dict[str, Any]]:
+    """Registro de la instancia en el catálogo de su carpeta (None si no es un .edgelist catalogado)."""
+    p = Path(path)
+    if p.suffix != ".edgelist" or not p.is_file():
+        return None
+    return open_catalog(p.parent).get(p.name)
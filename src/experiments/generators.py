@@ -0,0 +1,174 @@
+from __future__ import annotations
+import math
+import random
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Generadores de instancias sintéticas. Todos producen las aristas en streaming
+# (sin construir el grafo en memoria) y, cuando es posible, conocen el óptimo.
+
+Edge = Tuple[int, int]
+
+
+def erdos_renyi(n: int, avg_degree: float, seed: Optional[int] = None) -> Iterator[Edge]:
+    """
+    G(n, p) con p = avg_degree / (n - 1), usando saltos geométricos
+    (Batagelj-Brandes): O(n + m) en lugar de O(n^2).
+    """
+    rng = random.Random(seed)
+    p = min(1.0, avg_degree / max(1, n - 1))
+    if p <= 0:
+        return
+    if p >= 1:
+        for v in range(1, n):
+            for w in range(v):
+                yield w, v
+        return
+    lp = math.log(1.0 - p)
+    v, w = 1, -1
+    while v < n:
+        w += 1 + int(math.log(1.0 - rng.random()) / lp)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            yield w, v
+
+
+def chung_lu(
+    n: int,
+    avg_degree: float,
+    exponent: float = 2.5,
+    seed: Optional[int] = None,
+) -> Iterator[Edge]:
+    """
+    Grafo de ley de potencias (Chung-Lu) con pesos w_i ∝ (i + 1)^(-1/(exponent - 1)),
+    usando el algoritmo de saltos de Miller-Hagberg: O(n + m) esperado.
+    Los vértices salen ordenados por peso decreciente.
+    """
+    rng = random.Random(seed)
+    beta = 1.0 / (exponent - 1.0)
+    raw = [(i + 1) ** -beta for i in range(n)]
+    scale = avg_degree * n / sum(raw)
+    w = [x * scale for x in raw]
+    total = sum(w)
+    for u in range(n - 1):
+        v = u + 1
+        p = min(w[u] * w[v] / total, 1.0)
+        while v < n and p > 0:
+            if p != 1.0:
+                v += int(math.log(1.0 - rng.random()) / math.log(1.0 - p))
+            if v < n:
+                q = min(w[u] * w[v] / total, 1.0)
+                if rng.random() < q / p:
+                    yield u, v
+                p = q
+                v += 1
+
+
+def planted_cover(
+    n: int,
+    cover_size: int,
+    avg_degree: float,
+    seed: Optional[int] = None,
+) -> Iterator[Edge]:
+    """
+    Grafo con un vertex cover plantado S de tamaño cover_size (requiere n >= 2 * cover_size).
+    Un matching perfecto entre S y otros cover_size vértices fija la cota inferior
+    y toda arista toca S, por lo que el óptimo es exactamente cover_size.
+    Las ids se permutan al azar para que S no sea reconocible.
+    """
+    if 2 * cover_size > n:
+        raise ValueError("planted_cover requiere n >= 2 * cover_size")
+    rng = random.Random(seed)
+    perm = list(range(n))
+    rng.shuffle(perm)
+    k = cover_size
+    # Matching S[i] -- I[i]
+    for i in range(k):
+        yield perm[i], perm[k + i]
+    # Aristas extra con al menos un extremo en S (pueden repetirse; el cargador las ignora)
+    extra = max(0, int(avg_degree * n / 2) - k)
+    for _ in range(extra):
+        s = perm[rng.randrange(k)]
+        t = perm[rng.randrange(n)]
+        if s != t:
+            yield s, t
+
+
+def grid(
+    rows: int,
+    cols: int,
+    drop: float = 0.0,
+    seed: Optional[int] = None,
+) -> Iterator[Edge]:
+    """
+    Grilla tipo red vial: vecinos horizontales y verticales, eliminando cada
+    arista con probabilidad drop. Es bipartita; sin eliminaciones el óptimo
+    es floor(rows * cols / 2) (König).
+    """
+    rng = random.Random(seed)
+    for r in range(rows):
+        for c in range(cols):
+            v = r * cols + c
+            if c + 1 < cols and (drop <= 0 or rng.random() >= drop):
+                yield v, v + 1
+            if r + 1 < rows and (drop <= 0 or rng.random() >= drop):
+                yield v, v + cols
+
+
+def write_edgelist(path: Path, edges: Iterator[Edge], buffer_lines: int = 65536) -> int:
+    """Escribe las aristas en formato edgelist en bloques; retorna cuántas escribió."""
+    m = 0
+    chunk = []
+    with path.open("w", encoding="utf-8") as f:
+        for u, v in edges:
+            chunk.append(f"{u} {v}\n")
+            if len(chunk) >= buffer_lines:
+                f.write("".join(chunk))
+                m += len(chunk)
+                chunk.clear()
+        f.write("".join(chunk))
+        m += len(chunk)
+    return m
+
+
+# Familias disponibles: nombre -> (generador, función que da el óptimo conocido o None)
+FAMILIES: Dict[str, Tuple[Callable[..., Iterator[Edge]], Callable[..., Optional[int]]]] = {
+    "erdos_renyi": (erdos_renyi, lambda **kw: None),
+    "chung_lu": (chung_lu, lambda **kw: None),
+    "planted_cover": (planted_cover, lambda **kw: kw["cover_size"]),
+    "grid": (grid, lambda **kw: (kw["rows"] * kw["cols"]) // 2 if not kw.get("drop") else None),
+}
+
+# Nivel "large" del benchmark: grafos dispersos de ~10^6 vértices
+LARGE_TIER: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "er_1m.edgelist": ("erdos_renyi", {"n": 1_000_000, "avg_degree": 8, "seed": 1}),
+    "chunglu_1m.edgelist": ("chung_lu", {"n": 1_000_000, "avg_degree": 8, "exponent": 2.5, "seed": 2}),
+    "planted_1m.edgelist": ("planted_cover", {"n": 1_000_000, "cover_size": 300_000, "avg_degree": 8, "seed": 3}),
+    "grid_1m.edgelist": ("grid", {"rows": 1000, "cols": 1000, "seed": 4}),
+}
+
+
+def generate(folder: Path, name: str, family: str, kwargs: Dict[str, Any]) -> Optional[int]:
+    """
+    Genera una instancia en folder/name (si no existe) y registra su óptimo
+    conocido en folder/optimal_covers.txt. Retorna el óptimo o None.
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    gen, optimum_of = FAMILIES[family]
+    path = folder / name
+    if not path.exists():
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        write_edgelist(tmp, gen(**kwargs))
+        tmp.replace(path)
+    optimum = optimum_of(**kwargs)
+    if optimum is not None:
+        opt_file = folder / "optimal_covers.txt"
+        known = opt_file.read_text(encoding="utf-8") if opt_file.exists() else ""
+        if not any(line.split(":", 1)[0].strip() == name for line in known.splitlines() if ":" in line):
+            with opt_file.open("a", encoding="utf-8") as f:
+                if not known:
+                    f.write("# Formato: nombre_archivo: tamaño_cover_optimo\n")
+                f.write(f"{name}: {optimum}\n")
+    return optimum
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import os
+import sys
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Medición de memoria por corrida para run_benchmark.run:
+#   - "tracemalloc": pico de memoria asignada por Python y los bloques y sitios
+#     principales en ese pico (muestreados en un hilo aparte), más los bloques que
+#     siguen vivos al terminar.
+#   - "rss": pico de memoria residente del proceso, muestreado en un hilo aparte.
+# tracemalloc ralentiza bastante la ejecución, por lo que los tiempos medidos
+# con ese modo no son comparables con los de una corrida normal.
+MODES = ("tracemalloc", "rss")
+
+
+def _rss_bytes() -> int:
+    """Memoria residente actual del proceso en bytes."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        # Sin /proc solo está el pico de toda la vida del proceso (KB en Linux, bytes en macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RSSSampler:
+    """Hilo que muestrea el RSS cada `interval` segundos y guarda el pico."""
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.baseline = 0
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss_bytes())
+
+    def __enter__(self) -> "RSSSampler":
+        self.baseline = self.peak = _rss_bytes()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.peak = max(self.peak, _rss_bytes())
+
+
+class PeakSnapshots:
+    """
+    Hilo que consulta la memoria trazada cada `interval` segundos y toma una
+    instantánea de tracemalloc cada vez que supera en `growth` la de la
+    instantánea anterior: la última queda cerca del pico y muestra qué bloques
+    estaban vivos en ese momento (incluidos los temporales que se liberan antes
+    de terminar). El factor limita el número de instantáneas, que son caras.
+    """
+
+    def __init__(self, interval: float = 0.005, growth: float = 0.1) -> None:
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.size = 0           # Memoria trazada al tomar la instantánea
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _take(self, current: int) -> None:
+        self.snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        self.size = current
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.size * (1.0 + self.growth):
+                self._take(current)
+
+    def __enter__(self) -> "PeakSnapshots":
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def _sites(snapshot: tracemalloc.Snapshot, top: int) -> Tuple[int, List[Dict[str, Any]]]:
+    """Bloques vivos de la instantánea y sus `top` sitios con más bytes."""
+    stats = snapshot.statistics("lineno")
+    return sum(s.count for s in stats), [
+        {
+            "site": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+            "size": s.size,
+            "count": s.count,
+        }
+        for s in stats[:top]
+    ]
+
+
+def profile_call(
+    mode: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    top: int = 5,
+    **kwargs: Any,
+) -> Tuple[Any, float, Dict[str, Any]]:
+    """
+    Ejecuta fn(*args, **kwargs) midiendo memoria según `mode`.
+    Retorna (resultado, segundos, medidas).
+
+    Con tracemalloc: peak_memory es el pico exacto; peak_blocks y
+    top_allocations salen de la instantánea más cercana al pico
+    (peak_snapshot_memory dice cuánta memoria había entonces) y
+    retained_blocks son los bloques que siguen vivos tras retornar.
+    tracemalloc no cuenta asignaciones ya liberadas, así que no hay un total
+    de asignaciones.
+    """
+    from time import perf_counter
+
+    if mode == "tracemalloc":
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start()
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+        with PeakSnapshots() as sampler:
+            _start = perf_counter()
+            res = fn(*args, **kwargs)
+            _elapsed = perf_counter() - _start
+        current, peak = tracemalloc.get_traced_memory()
+        retained = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        if started_here:
+            tracemalloc.stop()
+        retained_blocks, retained_sites = _sites(retained, top)
+        # Una corrida más corta que el intervalo no alcanza a muestrearse:
+        # entonces lo más cercano al pico que hay es el estado final
+        if sampler.snapshot is None or current >= sampler.size:
+            peak_size, peak_blocks, sites = current, retained_blocks, retained_sites
+        else:
+            peak_size = sampler.size
+            peak_blocks, sites = _sites(sampler.snapshot, top)
+        return res, _elapsed, {
+            "peak_memory": peak,
+            "peak_snapshot_memory": peak_size,
+            "peak_blocks": peak_blocks,
+            "top_allocations": sites,
+            "retained_blocks": retained_blocks,
+        }
+
+    if mode == "rss":
+        with RSSSampler() as sampler:
+            _start = perf_counter()
+            res = fn(*args, **kwargs)
+            _elapsed = perf_counter() - _start
+        return res, _elapsed, {
+            "peak_memory": sampler.peak,
+            "peak_memory_delta": sampler.peak - sampler.baseline,
+        }
+
+    raise ValueError(f"Modo de memoria desconocido: {mode} (opciones: {', '.join(MODES)})")
@@ -1,19 +1,13 @@
+from __future__ import annotations
+from pathlib import Path
+from .catalog import DEFAULT_BENCH_DIR, open_catalog
+
+
 def get_optimal_cover_size(instance_name: str, optimal_file: str = None) -> int | None:
     """
-    Busca el tamaño del cover óptimo conocido para una instancia dada.
-    Retorna None si no se encuentra.
+    Busca el tamaño del cover óptimo conocido para una instancia dada en el
+    catálogo de la carpeta de `optimal_file` (por defecto data/bench_graphs_c,
+    la carpeta que usa el barrido). Retorna None si no se encuentra.
     """
-    if optimal_file is None:
-        optimal_file = "data/bench_graphs/optimal_covers.txt"
-    try:
-        with open(optimal_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"): continue
-                if ":" in line:
-                    name, val = line.split(":", 1)
-                    if name.strip() == instance_name.strip():
-                        return int(val.strip())
-    except Exception:
-        pass
-    return None
+    folder = Path(optimal_file).parent if optimal_file is not None else DEFAULT_BENCH_DIR
+    return open_catalog(folder).optimum(Path(instance_name).name)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import csv
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+
+def params_hash(params: Optional[Dict[str, Any]]) -> str:
+    """Hash corto y estable de un diccionario de parámetros (orden de claves irrelevante)."""
+    raw = json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+
+
+def iter_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Itera las filas de un archivo de resultados (.jsonl o .csv).
+    Las líneas JSONL incompletas (p. ej. tras una caída) se ignoran.
+    """
+    if not path.exists():
+        return
+    if path.suffix == ".csv":
+        with path.open("r", encoding="utf-8", newline="") as f:
+            yield from csv.DictReader(f)
+        return
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def completed_cells(path: Path, phash: str) -> Set[Tuple[str, str]]:
+    """Celdas (instancia, algoritmo) ya presentes en el archivo para el mismo hash de parámetros."""
+    return {
+        (row.get("instance"), row.get("algo"))
+        for row in iter_rows(path)
+        if row.get("params_hash") == phash
+    }
+
+
+class ResultWriter:
+    """
+    Escribe filas de resultados apenas se producen, en modo append.
+    Cada fila se vacía al sistema operativo (flush); fsync se agrupa cada
+    `fsync_every` filas o `fsync_interval` segundos, y siempre al cerrar.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fmt: str = "jsonl",
+        fieldnames: Optional[List[str]] = None,
+        fsync_every: int = 10,
+        fsync_interval: float = 30.0,
+    ) -> None:
+        self.path = path
+        self.fmt = fmt
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        existing = path.exists() and path.stat().st_size > 0
+        needs_newline = False
+        if existing and fmt == "jsonl":
+            with path.open("rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+        self._f = path.open("a", encoding="utf-8", newline="" if fmt == "csv" else None)
+        if needs_newline:
+            # Una caída pudo dejar la última línea a medias: empezamos en una nueva
+            self._f.write("\n")
+        self._csv: Optional[csv.DictWriter] = None
+        if fmt == "csv":
+            header = fieldnames or []
+            if existing:
+                with path.open("r", encoding="utf-8", newline="") as f:
+                    header = next(csv.reader(f), header)
+            self._csv = csv.DictWriter(self._f, fieldnames=header, extrasaction="ignore")
+            if not existing:
+                self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._csv is not None:
+            # Listas y diccionarios (costs, top_allocations, ...) como JSON, no como repr
+            self._csv.writerow({
+                k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v
+                for k, v in row.items()
+            })
+        else:
+            self._f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._f.flush()
+        self._pending += 1
+        if self._pending >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self.sync()
+            self._f.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,8 +1,14 @@
 from __future__ import annotations
-from time import perf_counter
-from typing import Callable, Dict, Iterable, Optional
-import networkx as nx
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
 from ..core.api import Result
+from .memory import profile_call
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Contadores internos de los algoritmos (y la decisión de "auto" y el pulido) que se conservan por corrida en meta
+RUN_STATS = ("steps", "dscore_evaluations", "dscore_saved", "auto", "polish")
 
 def run(
     algorithm: Callable[[nx.Graph, Optional[int], Optional[Dict]], Result],
@@ -12,38 +18,91 @@ def run(
 ) -> Iterable[Result]:
     # Extraemos cuantas corridas queremos (por defecto 1)
     n_runs = params.get("num_runs", 1) if params else 1
+    # Medición de memoria opcional ("tracemalloc" o "rss"); sin ella el bucle no cambia
+    memory_mode = params.get("memory_profile") if params else None
+
+    # Fecha límite opcional de toda la llamada (time.monotonic absoluto, la fija el servicio):
+    # el tiempo restante se reparte entre las corridas pendientes y no se inician
+    # corridas nuevas una vez vencida
+    deadline_at = params.get("deadline_at") if params else None
+
+    # Construcción inicial por lotes opcional: un cover por semilla, preparado de una vez
+    construction = params.get("construction") if params else None
+
+    # Pulido opcional del cover de cada corrida (su tiempo se cuenta en la corrida)
+    if params and params.get("polish"):
+        from ..algorithms.polish import with_polish
+        algorithm = with_polish(algorithm)
 
     for instance in instances:
+        if construction:
+            from ..algorithms.construction import build_covers
+            seeds = [(seed + i) if seed is not None else i for i in range(n_runs)]
+            initial_covers = build_covers(instance, seeds, construction)
         costs = []
         times = []
         solutions = []
         results = []
+        memory: list = []
 
         # Bucle para ejecutar el algoritmo n_runs veces
         for i in range(n_runs):
             # Variamos la semilla para que cada corrida sea distinta
             current_seed = (seed + i) if seed is not None else i
-            _start = perf_counter()
-            res = algorithm(instance, seed=current_seed, params=params)
-            _elapsed = perf_counter() - _start
+            run_params = dict(params, initial_cover=initial_covers[i]) if construction else params
+            if deadline_at is not None:
+                remaining = deadline_at - monotonic()
+                if remaining <= 0 and results:
+                    break
+                share = max(0.0, remaining) / (n_runs - i)
+                limit = params.get("time_limit")
+                run_params = dict(run_params, time_limit=share if limit is None else min(float(limit), share))
+            if memory_mode:
+                res, _elapsed, mem = profile_call(memory_mode, algorithm, instance, seed=current_seed, params=run_params)
+                memory.append(mem)
+            else:
+                _start = perf_counter()
+                res = algorithm(instance, seed=current_seed, params=run_params)
+                _elapsed = perf_counter() - _start
             costs.append(res.cost)
             times.append(_elapsed)
             solutions.append(res.solution)
             results.append(res)
 
-        # Agregamos los resultados de las n_runs al objeto meta
-        avg_cost = sum(costs) / n_runs
+        # Agregamos los resultados de las corridas hechas al objeto meta
+        n_done = len(results)
+        avg_cost = sum(costs) / n_done
         meta = {
             "costs": costs,
             "times": times,
             "avg_cost": avg_cost,
             "best_cost": min(costs),
             "worst_cost": max(costs),
-            "avg_time": sum(times) / n_runs,
-            "num_runs": n_runs,
+            "avg_time": sum(times) / n_done,
+            "num_runs": n_done,
             "n_nodes": instance.number_of_nodes() if hasattr(instance, 'number_of_nodes') else None,
             "n_edges": instance.number_of_edges() if hasattr(instance, 'number_of_edges') else None,
         }
+        if deadline_at is not None:
+            meta["num_runs_requested"] = n_runs
+            meta["deadline_overrun"] = max(0.0, monotonic() - deadline_at)
+        # Medidas de memoria por corrida y sitios de asignación de la corrida con mayor pico
+        if memory:
+            meta["memory_profile"] = memory_mode
+            meta["peak_memory"] = [m["peak_memory"] for m in memory]
+            if "peak_blocks" in memory[0]:
+                meta["peak_blocks"] = [m["peak_blocks"] for m in memory]
+                meta["retained_blocks"] = [m["retained_blocks"] for m in memory]
+                worst = max(memory, key=lambda m: m["peak_memory"])
+                meta["top_allocations"] = worst["top_allocations"]
+            else:
+                meta["peak_memory_delta"] = [m["peak_memory_delta"] for m in memory]
+
+        # Contadores reportados por el algoritmo (si los hay), uno por corrida
+        for key in RUN_STATS:
+            if key in results[0].meta:
+                meta[key] = [r.meta.get(key) for r in results]
+
         # Solo agregamos solutions si params tiene verbose True
         if params and params.get("verbose", False):
             meta["solutions"] = solutions
@@ -0,0 +1,144 @@
+from __future__ import annotations
+import multiprocessing as mp
+import os
+import time
+import traceback
+from multiprocessing.connection import wait
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+# Estados posibles de un trabajo aislado
+OK, TIMEOUT, OOM, ERROR = "ok", "timeout", "oom", "error"
+
+# Extremo de escritura del canal de incumbentes (solo dentro de un hijo de run_limited)
+_incumbent_conn: Any = None
+
+
+def _context() -> Any:
+    # Con fork el hijo hereda el grafo ya cargado sin serializarlo
+    methods = mp.get_all_start_methods()
+    return mp.get_context("fork" if "fork" in methods else methods[0])
+
+
+def _address_space() -> int:
+    """Espacio de direcciones virtual actual del proceso en bytes (0 si no se puede medir)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _set_memory_limit(mem_mb: Optional[float]) -> None:
+    # El límite es memoria adicional sobre lo que el hijo ya hereda del padre
+    if not mem_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - plataformas sin resource (Windows)
+        return
+    limit = _address_space() + int(mem_mb * 1024 * 1024)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def report_incumbent(cover: Iterable[int]) -> None:
+    """
+    Envía al padre el mejor cover factible hallado hasta ahora. Los solvers con
+    reporte anytime lo reciben como params["on_incumbent"]; fuera de un hijo de
+    run_limited (o si el padre no pidió incumbentes) no hace nada.
+    """
+    if _incumbent_conn is not None:
+        _incumbent_conn.send(sorted(cover))
+
+
+def _child(
+    conn: Any,
+    target: Callable[..., Any],
+    args: tuple,
+    mem_mb: Optional[float],
+    incumbent_conn: Any = None,
+) -> None:
+    global _incumbent_conn
+    _incumbent_conn = incumbent_conn
+    try:
+        _set_memory_limit(mem_mb)
+        value = target(*args)
+        conn.send((OK, value))
+    except MemoryError:
+        conn.send((OOM, None))
+    except BaseException:
+        conn.send((ERROR, traceback.format_exc(limit=5)))
+    finally:
+        conn.close()
+        if incumbent_conn is not None:
+            incumbent_conn.close()
+
+
+def run_limited(
+    target: Callable[..., Any],
+    args: tuple = (),
+    wall_time: Optional[float] = None,
+    mem_mb: Optional[float] = None,
+    on_incumbent: Optional[Callable[[Any], None]] = None,
+) -> Tuple[str, Any]:
+    """
+    Ejecuta target(*args) en un proceso hijo con límite de tiempo de pared y de
+    memoria (RLIMIT_AS). Retorna (estado, valor): ("ok", resultado),
+    ("timeout", None), ("oom", None) o ("error", traza).
+
+    Con on_incumbent se abre un segundo canal: cada report_incumbent(cover) del
+    hijo llega como on_incumbent(lista ordenada de vértices), también si el hijo
+    termina por tiempo o memoria, de modo que se conserva el último incumbente.
+    """
+    ctx = _context()
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    inc_parent, inc_child = ctx.Pipe(duplex=False) if on_incumbent is not None else (None, None)
+    proc = ctx.Process(
+        target=_child, args=(child_conn, target, args, mem_mb, inc_child), daemon=True
+    )
+    proc.start()
+    child_conn.close()
+    if inc_child is not None:
+        inc_child.close()
+
+    def _drain_incumbents() -> None:
+        nonlocal inc_parent
+        try:
+            while inc_parent is not None and inc_parent.poll(0):
+                on_incumbent(inc_parent.recv())
+        except EOFError:
+            inc_parent.close()
+            inc_parent = None
+
+    deadline = None if wall_time is None else time.monotonic() + wall_time
+    try:
+        while True:
+            # Se leen los incumbentes mientras se espera el resultado, para que
+            # el hijo nunca se bloquee con el canal lleno
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready = wait([c for c in (parent_conn, inc_parent) if c is not None], timeout)
+            if not ready:
+                proc.terminate()
+                proc.join()
+                _drain_incumbents()
+                return TIMEOUT, None
+            if inc_parent is not None and inc_parent in ready:
+                _drain_incumbents()
+            if parent_conn in ready:
+                break
+        try:
+            value = parent_conn.recv()
+            _drain_incumbents()
+            return value
+        except EOFError:
+            pass
+        proc.join()
+        _drain_incumbents()
+        # El hijo murió sin responder (p. ej. lo mató el OOM killer)
+        return (OOM if proc.exitcode in (-9, 137) else ERROR), f"exitcode={proc.exitcode}"
+    finally:
+        parent_conn.close()
+        if inc_parent is not None:
+            inc_parent.close()
+        if proc.is_alive():
+            proc.kill()
+        proc.join()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+import math
+from typing import List, Optional, Sequence, Tuple
+
+# Pruebas no paramétricas en Python puro (sin SciPy), con aproximación normal,
+# corrección por empates y corrección de continuidad.
+
+
+def _normal_two_sided(z: float) -> float:
+    """p-valor bilateral de una normal estándar."""
+    return math.erfc(abs(z) / math.sqrt(2.0))
+
+
+def _ranks(values: Sequence[float]) -> Tuple[List[float], float]:
+    """
+    Rangos promedio (1..n) y el término de corrección por empates sum(t^3 - t).
+    """
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    ties = 0.0
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        avg = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            ranks[order[k]] = avg
+        t = j - i + 1
+        ties += t * t * t - t
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """
+    Prueba U de Mann-Whitney bilateral (muestras independientes).
+    Retorna (U de la muestra a, p-valor) o None si no hay datos suficientes.
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return None
+    ranks, ties = _ranks(list(a) + list(b))
+    u1 = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    mu = n1 * n2 / 2.0
+    var = n1 * n2 / 12.0 * ((n + 1) - ties / (n * (n - 1)))
+    if var <= 0:
+        return u1, 1.0
+    z = (abs(u1 - mu) - 0.5) / math.sqrt(var)
+    return u1, _normal_two_sided(max(0.0, z))
+
+
+def wilcoxon_signed_rank(x: Sequence[float], y: Sequence[float]) -> Optional[Tuple[float, float]]:
+    """
+    Prueba de rangos con signo de Wilcoxon bilateral (muestras pareadas).
+    Las diferencias nulas se descartan. Retorna (W+, p-valor) o None.
+    """
+    diffs = [b - a for a, b in zip(x, y) if b != a]
+    n = len(diffs)
+    if n == 0:
+        return None
+    ranks, ties = _ranks([abs(d) for d in diffs])
+    w_plus = sum(r for r, d in zip(ranks, diffs) if d > 0)
+    mu = n * (n + 1) / 4.0
+    var = n * (n + 1) * (2 * n + 1) / 24.0 - ties / 48.0
+    if var <= 0:
+        return w_plus, 1.0
+    z = (abs(w_plus - mu) - 0.5) / math.sqrt(var)
+    return w_plus, _normal_two_sided(max(0.0, z))
+
+
+def geometric_mean(values: Sequence[float]) -> Optional[float]:
+    values = [v for v in values if v > 0]
+    if not values:
+        return None
+    return math.exp(sum(math.log(v) for v in values) / len(values))
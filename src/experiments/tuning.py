@@ -0,0 +1,173 @@
+from __future__ import annotations
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .stats import wilcoxon_signed_rank
+
+# Espacio de búsqueda por algoritmo: nombre -> (tipo, ...)
+#   ("float", lo, hi), ("log", lo, hi), ("int", lo, hi), ("choice", [valores])
+PARAM_SPACES: Dict[str, Dict[str, tuple]] = {
+    "local_search": {
+        "rho": ("float", 0.1, 0.9),
+    },
+    "ils": {
+        "perturb_fraction": ("float", 0.01, 0.3),
+        "perturb_min": ("int", 1, 5),
+        "accept_equal_prob": ("float", 0.0, 0.2),
+        "memoria_tam": ("log", 5, 2000),
+        "rho": ("float", 0.1, 0.9),
+    },
+    "gls": {
+        "lambda_penalty": ("log", 0.02, 2.0),
+    },
+}
+
+
+def sample_config(space: Dict[str, tuple], rng: random.Random) -> Dict[str, Any]:
+    """Muestrea una configuración del espacio de búsqueda."""
+    config: Dict[str, Any] = {}
+    for name, spec in space.items():
+        kind = spec[0]
+        if kind == "float":
+            config[name] = rng.uniform(spec[1], spec[2])
+        elif kind == "log":
+            value = math.exp(rng.uniform(math.log(spec[1]), math.log(spec[2])))
+            config[name] = int(round(value)) if isinstance(spec[1], int) else value
+        elif kind == "int":
+            config[name] = rng.randint(spec[1], spec[2])
+        elif kind == "choice":
+            config[name] = rng.choice(spec[1])
+        else:
+            raise ValueError(f"Tipo de parámetro desconocido: {kind}")
+    return config
+
+
+# Caché de grafos por proceso worker (cada instancia se parsea una sola vez)
+_GRAPHS: Dict[str, Any] = {}
+
+
+def _evaluate(algo: str, path: str, params: Dict[str, Any], seed: Optional[int]) -> List[float]:
+    """Trabajo de un worker: corre run_benchmark.run y retorna los costos por corrida."""
+    from ..algorithms import ARRAY_ALGORITHMS, get_algorithm
+    from ..core.graph_io import load_csr, load_edgelist
+    from .run_benchmark import run
+
+    key = f"{path}:{algo in ARRAY_ALGORITHMS}"
+    graph = _GRAPHS.get(key)
+    if graph is None:
+        graph = (load_csr if algo in ARRAY_ALGORITHMS else load_edgelist)(path)
+        _GRAPHS[key] = graph
+    result = next(iter(run(get_algorithm(algo), [graph], seed=seed, params=params)))
+    return [float(c) for c in result.meta["costs"]]
+
+
+class Racer:
+    """
+    Carrera por halving sucesivo (successive halving) con eliminación estadística.
+
+    En cada ronda las configuraciones vivas se evalúan sobre un subconjunto
+    creciente de instancias (en paralelo, en un pool de procesos). Luego se
+    conserva la mejor fracción 1/eta según el costo normalizado medio y se
+    descartan además las que son significativamente peores que la mejor
+    (Wilcoxon pareado por instancia y corrida).
+    """
+
+    def __init__(
+        self,
+        algo: str,
+        instances: Sequence[Tuple[str, str]],
+        base_params: Optional[Dict[str, Any]] = None,
+        optima: Optional[Dict[str, int]] = None,
+        n_configs: int = 16,
+        eta: int = 2,
+        alpha: float = 0.05,
+        workers: Optional[int] = None,
+        seed: int = 0,
+    ) -> None:
+        if algo not in PARAM_SPACES:
+            raise ValueError(f"No hay espacio de parámetros para: {algo}")
+        self.algo = algo
+        self.instances = list(instances)      # (nombre, ruta)
+        self.base_params = dict(base_params or {})
+        self.optima = optima or {}
+        self.n_configs = n_configs
+        self.eta = max(2, eta)
+        self.alpha = alpha
+        self.workers = workers
+        self.seed = seed
+        self.history: List[Dict[str, Any]] = []
+
+    def _configs(self) -> List[Dict[str, Any]]:
+        rng = random.Random(self.seed)
+        space = PARAM_SPACES[self.algo]
+        # La configuración por defecto siempre participa
+        default = {k: self.base_params[k] for k in space if k in self.base_params}
+        configs = [default] if default else []
+        while len(configs) < self.n_configs:
+            configs.append(sample_config(space, rng))
+        return configs
+
+    def _normalized(
+        self,
+        costs: Dict[int, Dict[str, List[float]]],
+        alive: List[int],
+        names: List[str],
+    ) -> Dict[int, List[float]]:
+        """Costo / óptimo conocido (o / mejor costo visto en la ronda) por (instancia, corrida)."""
+        out: Dict[int, List[float]] = {i: [] for i in alive}
+        for name in names:
+            ref = self.optima.get(name) or min(min(costs[i][name]) for i in alive) or 1.0
+            for i in alive:
+                out[i].extend(c / ref for c in costs[i][name])
+        return out
+
+    def race(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Ejecuta la carrera y retorna (mejor configuración, historial por ronda)."""
+        configs = self._configs()
+        alive = list(range(len(configs)))
+        costs: Dict[int, Dict[str, List[float]]] = {i: {} for i in alive}
+        seed = self.base_params.get("seed")
+        n_inst = min(len(self.instances), 2)
+        rnd = 0
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                names = [name for name, _ in self.instances[:n_inst]]
+                jobs = {}
+                for i in alive:
+                    params = dict(self.base_params)
+                    params.update(configs[i])
+                    for name, path in self.instances[:n_inst]:
+                        if name not in costs[i]:
+                            jobs[(i, name)] = pool.submit(_evaluate, self.algo, path, params, seed)
+                for (i, name), fut in jobs.items():
+                    costs[i][name] = fut.result()
+
+                scores = self._normalized(costs, alive, names)
+                ranking = sorted(alive, key=lambda i: sum(scores[i]) / len(scores[i]))
+                best = ranking[0]
+                keep = max(1, math.ceil(len(alive) / self.eta))
+                survivors = []
+                for i in ranking[:keep]:
+                    test = None if i == best else wilcoxon_signed_rank(scores[best], scores[i])
+                    worse = test is not None and test[1] < self.alpha and sum(scores[i]) > sum(scores[best])
+                    if not worse:
+                        survivors.append(i)
+                self.history.append({
+                    "round": rnd,
+                    "instances": names,
+                    "alive": len(alive),
+                    "survivors": len(survivors),
+                    "scores": {i: sum(scores[i]) / len(scores[i]) for i in alive},
+                    "best": configs[best],
+                })
+                alive = survivors
+                rnd += 1
+                if len(alive) == 1:
+                    break
+                # Con todas las instancias en uso se sigue recortando hasta quedar una
+                n_inst = min(len(self.instances), n_inst * self.eta)
+
+        params = dict(self.base_params)
+        params.update(configs[alive[0]])
+        return params, self.history
@@ -0,0 +1,359 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, Optional, Tuple
+from .algorithms import ALGORITHMS, get_algorithm
+from .core.serialization import build_output
+from .experiments.catalog import lookup
+from .experiments.optimal_cover import get_optimal_cover_size
+
+
+# Caché LRU de grafos propia de cada worker (graph_id -> grafo): el proceso
+# padre solo envía el grafo cuando el worker que tomó la tarea no lo tiene.
+_WORKER_GRAPHS: "OrderedDict[str, Any]" = OrderedDict()
+_WORKER_CACHE_SIZE = 0
+_GRAPH_MISS = "graph-miss"
+
+
+def _warm_worker(cache_size: int = 0) -> None:
+    """Inicializador de cada proceso: importa NetworkX y los algoritmos una sola vez."""
+    global _WORKER_CACHE_SIZE
+    import networkx  # noqa: F401
+    for name in ALGORITHMS:
+        ALGORITHMS[name]
+    _WORKER_CACHE_SIZE = cache_size
+
+
+def _worker_graph(graph_id: str, graph: Any) -> Any:
+    """Busca (graph=None) o guarda el grafo en la caché del worker."""
+    if graph is None:
+        graph = _WORKER_GRAPHS.get(graph_id)
+        if graph is not None:
+            _WORKER_GRAPHS.move_to_end(graph_id)
+        return graph
+    if _WORKER_CACHE_SIZE > 0:
+        _WORKER_GRAPHS[graph_id] = graph
+        _WORKER_GRAPHS.move_to_end(graph_id)
+        while len(_WORKER_GRAPHS) > _WORKER_CACHE_SIZE:
+            _WORKER_GRAPHS.popitem(last=False)
+    return graph
+
+
+def _solve_job(
+    algo: str,
+    graph_id: str,
+    graph: Any,
+    seed: Optional[int],
+    params: Dict[str, Any],
+    deadline: Optional[float],
+) -> Tuple[Any, float, float]:
+    """
+    Ejecuta una solicitud dentro de un worker. Retorna (resultado, inicio, fin)
+    medidos con time.monotonic (reloj compartido entre procesos en Linux/macOS).
+    Si la fecha límite ya venció al salir de la cola, no se resuelve (resultado None);
+    si vence durante la solicitud, meta["deadline_overrun"] indica por cuánto.
+    Con graph=None se usa la caché del worker; si no lo tiene, el resultado es
+    _GRAPH_MISS y el padre reenvía la tarea con el grafo.
+    """
+    from .experiments.run_benchmark import run
+
+    started = time.monotonic()
+    graph = _worker_graph(graph_id, graph)
+    if graph is None:
+        return _GRAPH_MISS, started, started
+    if deadline is not None:
+        if deadline <= started:
+            return None, started, started
+        # run() reparte el tiempo restante entre las num_runs corridas (acotando
+        # su time_limit) y deja de iniciar corridas al vencer la fecha límite
+        params = dict(params, deadline_at=deadline)
+    result = next(iter(run(get_algorithm(algo), [graph], seed=seed, params=params)))
+    return result, started, time.monotonic()
+
+
+def _percentiles(values: Deque[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"count": 0, "p50": None, "p90": None, "p99": None, "max": None}
+    data = sorted(values)
+
+    def pick(q: float) -> float:
+        return data[min(len(data) - 1, int(round(q * (len(data) - 1))))]
+
+    return {"count": len(data), "p50": pick(0.5), "p90": pick(0.9), "p99": pick(0.99), "max": data[-1]}
+
+
+class SolverService:
+    """
+    Servicio de larga duración: mantiene un pool de workers con los algoritmos
+    ya importados y una caché LRU de grafos ya parseados.
+
+    Solicitudes (JSON):
+        {"op": "load", "edges": [[u, v], ...] | "path": "...", "name": "..."}  -> {"graph_id": ...}
+        {"op": "solve", "graph_id" | "edges" | "path", "algo", "params", "seed", "deadline", "verbose", "encoding"}
+        {"op": "stats"}
+    La respuesta de "solve" es el mismo objeto que imprime main.py
+    (más "id" si la solicitud lo incluía).
+    """
+
+    def __init__(
+        self,
+        algo: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        workers: int = 0,
+        cache_size: int = 128,
+        history: int = 10000,
+    ) -> None:
+        self.default_algo = algo
+        self.default_params = dict(params or {})
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue_wait: Deque[float] = deque(maxlen=history)
+        self._solve_time: Deque[float] = deque(maxlen=history)
+        self._counts = {
+            "requests": 0, "errors": 0, "deadline_missed": 0, "deadline_overrun": 0,
+            "cache_hits": 0, "graph_transfers": 0,
+        }
+        # workers=0 resuelve en hilos del mismo proceso (útil para instancias pequeñas)
+        if workers > 0:
+            self._pool: Executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_warm_worker, initargs=(cache_size,),
+            )
+        else:
+            _warm_worker()
+            self._pool = ThreadPoolExecutor(max_workers=1)
+        self.workers = workers
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    # --- Caché de grafos ---
+
+    def _parse_graph(self, request: Dict[str, Any]) -> Tuple[str, str, Any]:
+        import networkx as nx
+        from .core.graph_io import load_edgelist, normalize_nodes
+
+        if "edges" in request:
+            raw = json.dumps(request["edges"], separators=(",", ":"))
+            graph_id = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+            cached = self._cached(graph_id)
+            if cached is not None:
+                return (graph_id,) + cached
+            graph = normalize_nodes(nx.Graph([tuple(e) for e in request["edges"]]))
+            name = request.get("name", graph_id)
+        elif "path" in request:
+            path = request["path"]
+            stat = os.stat(path)
+            key = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+            graph_id = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+            cached = self._cached(graph_id)
+            if cached is not None:
+                return (graph_id,) + cached
+            graph = load_edgelist(path)
+            name = request.get("name", os.path.basename(path))
+        else:
+            raise ValueError("La solicitud debe incluir 'graph_id', 'edges' o 'path'")
+
+        with self._lock:
+            self._cache[graph_id] = (name, graph)
+            self._cache.move_to_end(graph_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return graph_id, name, graph
+
+    def _cached(self, graph_id: str) -> Optional[Tuple[str, Any]]:
+        with self._lock:
+            entry = self._cache.get(graph_id)
+            if entry is not None:
+                self._cache.move_to_end(graph_id)
+                self._counts["cache_hits"] += 1
+            return entry
+
+    def _graph(self, request: Dict[str, Any]) -> Tuple[str, str, Any]:
+        if "graph_id" in request:
+            entry = self._cached(request["graph_id"])
+            if entry is None:
+                raise KeyError(f"graph_id desconocido: {request['graph_id']}")
+            return (request["graph_id"],) + entry
+        return self._parse_graph(request)
+
+    # --- Operaciones ---
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Atiende una solicitud (bloqueante) y retorna la respuesta como dict."""
+        op = request.get("op", "solve")
+        try:
+            if op == "stats":
+                response = self.stats()
+            elif op == "load":
+                graph_id, name, graph = self._graph(request)
+                response = {"graph_id": graph_id, "instance": name, "n_nodes": graph.number_of_nodes()}
+            elif op == "solve":
+                response = self._solve(request)
+            else:
+                raise ValueError(f"Operación desconocida: {op}")
+        except Exception as exc:
+            with self._lock:
+                self._counts["errors"] += 1
+            response = {"error": f"{type(exc).__name__}: {exc}"}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def _solve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        algo = request.get("algo", self.default_algo)
+        if algo is None:
+            raise ValueError("Falta 'algo'")
+        params = dict(self.default_params)
+        params.update(request.get("params") or {})
+        seed = request.get("seed", params.get("seed"))
+        verbose = bool(request.get("verbose", False))
+        if verbose:
+            params["verbose"] = True
+
+        graph_id, name, graph = self._graph(request)
+        submitted = time.monotonic()
+        deadline = request.get("deadline")
+        deadline_at = submitted + float(deadline) if deadline is not None else None
+
+        with self._lock:
+            self._counts["requests"] += 1
+        # Con procesos se intenta primero sin el grafo, para no serializarlo en cada solicitud
+        first = graph if self.workers == 0 else None
+        future = self._pool.submit(_solve_job, algo, graph_id, first, seed, params, deadline_at)
+        result, started, finished = future.result()
+        if isinstance(result, str) and result == _GRAPH_MISS:
+            with self._lock:
+                self._counts["graph_transfers"] += 1
+            future = self._pool.submit(_solve_job, algo, graph_id, graph, seed, params, deadline_at)
+            result, started, finished = future.result()
+
+        with self._lock:
+            self._queue_wait.append(started - submitted)
+            if result is None:
+                self._counts["deadline_missed"] += 1
+            else:
+                self._solve_time.append(finished - started)
+                if result.meta.get("deadline_overrun"):
+                    self._counts["deadline_overrun"] += 1
+
+        if result is None:
+            response: Dict[str, Any] = {"instance": name, "algo": algo, "error": "deadline exceeded"}
+        else:
+            # Con "path" se consulta el catálogo de su carpeta; si no, el del benchmark por nombre
+            record = lookup(request["path"]) if "path" in request else None
+            optimal = record["optimum"] if record else get_optimal_cover_size(name)
+            response = build_output(
+                name, algo, result, optimal=optimal, verbose=verbose,
+                encoding=request.get("encoding", "full"),
+            )
+            # Hubo resultado, pero la fecha límite venció antes de terminar
+            overrun = result.meta.get("deadline_overrun")
+            if overrun:
+                response["deadline_exceeded"] = True
+                response["deadline_overrun"] = overrun
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "cached_graphs": len(self._cache),
+                "counts": dict(self._counts),
+                "queue_wait": _percentiles(self._queue_wait),
+                "solve_latency": _percentiles(self._solve_time),
+            }
+
+
+def serve_stdin(service: SolverService, concurrency: int = 4) -> None:
+    """
+    Lee una solicitud JSON por línea de stdin y escribe una respuesta JSON por línea.
+    Las solicitudes se atienden en paralelo, por lo que las respuestas pueden
+    salir en otro orden (usar "id" para emparejarlas).
+    """
+    out_lock = threading.Lock()
+
+    def reply(line: str) -> None:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            response: Dict[str, Any] = {"error": f"JSONDecodeError: {exc}"}
+        else:
+            if isinstance(request, dict):
+                response = service.handle(request)
+            else:
+                response = {"error": "La solicitud debe ser un objeto JSON"}
+        with out_lock:
+            sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as dispatch:
+        for line in sys.stdin:
+            line = line.strip()
+            if line:
+                dispatch.submit(reply, line)
+
+
+def _http_status(response: Dict[str, Any]) -> int:
+    """Vencer la fecha límite no es un error del cliente: 504; otros errores, 400."""
+    if "error" not in response:
+        return 200
+    return 504 if response["error"] == "deadline exceeded" else 400
+
+
+def serve_http(service: SolverService, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """
+    Servidor HTTP local: POST /solve y POST /load con cuerpo JSON, GET /stats.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") == "/stats":
+                self._send(200, service.stats())
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self) -> None:
+            op = self.path.strip("/")
+            if op not in ("solve", "load", "stats"):
+                self._send(404, {"error": "not found"})
+                return
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                request = json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError as exc:
+                self._send(400, {"error": f"JSONDecodeError: {exc}"})
+                return
+            if not isinstance(request, dict):
+                self._send(400, {"error": "La solicitud debe ser un objeto JSON"})
+                return
+            request["op"] = op
+            response = service.handle(request)
+            self._send(_http_status(response), response)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"Sirviendo en http://{host}:{port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()